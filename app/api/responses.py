@@ -0,0 +1,19 @@
+# app/api/responses.py
+"""
+Fast JSON response class for list endpoints.
+
+Routes return plain dicts straight from the raw read path, skipping Pydantic
+validation and FastAPI's jsonable_encoder pass; serialization goes through
+app.core.serialization (orjson when installed).
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from app.core.serialization import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
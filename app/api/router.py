@@ -8,12 +8,14 @@ be mounted under /api/v1 to permit non-breaking future changes.
 
 from fastapi import APIRouter
 
-from app.api import routes_news, routes_alerts, routes_admin
+from app.api import routes_news, routes_alerts, routes_admin, routes_trends, routes_stats
 
 api_v1 = APIRouter(prefix="/v1")
 api_v1.include_router(routes_news.router, prefix="/news", tags=["news"])
 api_v1.include_router(routes_alerts.router, prefix="/alerts", tags=["alerts"])
 api_v1.include_router(routes_admin.router, prefix="/admin", tags=["admin"])
+api_v1.include_router(routes_trends.router, prefix="/trends", tags=["trends"])
+api_v1.include_router(routes_stats.router, prefix="/stats", tags=["stats"])
 
 def get_root_router() -> APIRouter:
     """
@@ -1,7 +1,19 @@
 # app/api/routes_admin.py
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from typing import Optional
 from app.models.news_item_doc import NewsItemDocument
 from app.models.alert_doc import AlertDocument
+from app.models.alert_content_doc import AlertContentDocument
+from app.models.job_doc import JobDocument
+from app.core.config import settings
+from app.core.jobqueue import enqueue, queue_stats
+from app.core.db import pool_stats
+from app.core.resilience import breaker_states
+from app.services.classifier import classifier_stats
+from app.services.retention import apply_retention
+from app.services.aggregates import rebuild_aggregates
+from app.services.priority import latency_report
 from pymongo.errors import PyMongoError
 
 router = APIRouter()
@@ -9,11 +21,12 @@ router = APIRouter()
 @router.post("/reset-db")
 async def reset_db():
     """
-    Delete all news and alerts documents. DEVELOPMENT ONLY.
+    Delete all news and alerts documents (and alert bodies). DEVELOPMENT ONLY.
     """
     try:
         news_result = NewsItemDocument.objects.delete()
         alerts_result = AlertDocument.objects.delete()
+        AlertContentDocument.objects.delete()
         return {
             "message": "Database reset complete",
             "news_deleted": news_result,
@@ -24,3 +37,100 @@ async def reset_db():
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"DB reset failed: {e}"
         )
+
+
+def _job_to_dict(job: JobDocument) -> dict:
+    return {
+        "id": str(job.id),
+        "task": job.task,
+        "status": job.status,
+        "attempts": job.attempts,
+        "max_attempts": job.max_attempts,
+        "result": job.result,
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+@router.get("/jobs")
+async def list_jobs(
+    job_status: Optional[str] = Query(None, alias="status", description="queued | running | done | failed"),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """
+    Job queue counts per status plus the most recent jobs.
+    """
+    def _load():
+        qs = JobDocument.objects(status=job_status) if job_status else JobDocument.objects
+        jobs = qs.order_by("-created_at").limit(limit)
+        return {"counts": queue_stats(), "jobs": [_job_to_dict(j) for j in jobs]}
+
+    return await run_in_threadpool(_load)
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Status and result of a single job.
+    """
+    job = await run_in_threadpool(lambda: JobDocument.objects(id=job_id).first())
+    if not job:
+        raise HTTPException(status_code=404, detail="job not found")
+    return _job_to_dict(job)
+
+
+@router.get("/breakers")
+async def list_breakers():
+    """
+    Circuit breaker state per dependency (this process only).
+    """
+    return breaker_states()
+
+
+@router.get("/classifier/stats")
+async def get_classifier_stats():
+    """
+    Classification hits, share and average latency per tier (this process only).
+    """
+    return classifier_stats.snapshot()
+
+
+@router.get("/db/pool")
+async def get_pool_stats():
+    """
+    Mongo connection pool checkouts, wait time and open connections per client (this process only).
+    """
+    return {name: stats.snapshot() for name, stats in pool_stats.items()}
+
+
+@router.get("/priority")
+async def get_priority_stats(limit: int = Query(500, ge=1, le=5000)):
+    """
+    Fast-lane configuration and publish-to-inbox latency (p50/p95/max) of the last `limit` priority alerts.
+    """
+    return await run_in_threadpool(latency_report, limit)
+
+
+@router.post("/stats/rebuild")
+async def rebuild_stats():
+    """
+    Rebuild the dashboard aggregates (repair after drift, retention or reset-db).
+    Queued as a job when queue workers run (SCHEDULER_MODE=nuvom), inline otherwise.
+    """
+    if settings.SCHEDULER_MODE == "nuvom":
+        job_id = await run_in_threadpool(enqueue, "rebuild_aggregates", {}, dedupe_key="rebuild_aggregates")
+        return {"queued": job_id is not None, "job_id": job_id}
+    return await run_in_threadpool(rebuild_aggregates)
+
+
+@router.post("/retention")
+async def run_retention():
+    """
+    Enforce retention now: sync TTL indexes, archive expired documents (archive modes).
+    """
+    try:
+        archived = await run_in_threadpool(apply_retention)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"mode": settings.RETENTION_MODE, "archived": archived}
@@ -3,17 +3,25 @@
 Routes for alert operations.
 
 - GET /api/v1/alerts - history (paginated)
-- POST /api/v1/alerts/{news_id} - send an alert for a news item
+- GET /api/v1/alerts/export - stream NDJSON/CSV export (time range + resume token)
+- GET /api/v1/alerts/{alert_id} - one alert including its body
+- POST /api/v1/alerts/{news_id} - send an alert for a news item (one or many recipients)
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from functools import lru_cache
 from typing import Any, Optional
+from datetime import datetime
 import logging
 
 from app.api.schemas import SendAlertRequest
-from app.services.alert_sender import send_alert_for_news, get_alert_history
+from app.api.responses import FastJSONResponse
+from app.services.exporter import iter_alerts_export
+from app.services.alert_sender import send_alert_for_news, send_alerts_for_news
+from app.services.repositories import MongoAlertRepository
+from app.domain.interfaces import AlertRepository
 from app.infrastructure.smtp_emailer import SMTPEmailer
 from app.core.config import settings
 
@@ -26,31 +34,65 @@ def get_emailer() -> SMTPEmailer:
     """
     Create and cache a singleton SMTPEmailer instance per process.
     """
-    return SMTPEmailer(
-        host=settings.SMTP_HOST,
-        port=settings.SMTP_PORT,
-        user=settings.SMTP_USER,
-        password=settings.SMTP_PASS,
-        default_from=settings.ALERT_EMAIL_FROM,
-    )
+    return SMTPEmailer.from_settings(settings)
+
+
+@lru_cache()
+def get_alert_repository() -> AlertRepository:
+    return MongoAlertRepository()
 
 
 @router.get("/", tags=["alerts"])
 async def api_alerts(
     limit: int = Query(100, ge=1, le=500, description="Number of alerts to return"),
-    offset: int = Query(0, ge=0, description="Offset for pagination")
+    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    since: Optional[datetime] = Query(None, description="Only alerts sent after this time"),
+    repo: AlertRepository = Depends(get_alert_repository),
 ):
     """
-    Return stored alert history, paginated.
+    Return stored alert history, paginated (async Mongo client, no threadpool hop).
     """
     try:
-        alerts = await run_in_threadpool(get_alert_history, limit=limit, offset=offset)
-        return {"count": len(alerts), "alerts": alerts}
+        alerts = await repo.list_alerts(limit=limit, offset=offset, since=since)
+        return FastJSONResponse({"count": len(alerts), "alerts": alerts})
     except Exception:
         logger.exception("Failed to retrieve alert history")
         raise HTTPException(status_code=500, detail="Failed to fetch alert history")
 
 
+@router.get("/export", tags=["alerts"])
+def api_export_alerts(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    since: Optional[datetime] = Query(None, description="sent_at >= since"),
+    until: Optional[datetime] = Query(None, description="sent_at < until"),
+    after: Optional[str] = Query(None, description="Resume token: id of the last record received"),
+    batch_size: int = Query(500, ge=10, le=5000),
+):
+    """
+    Stream alert history straight from a Mongo cursor (constant memory).
+    """
+    try:
+        stream = iter_alerts_export(fmt=format, since=since, until=until, after=after, batch_size=batch_size)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(stream, media_type=media_type)
+
+
+@router.get("/{alert_id}", tags=["alerts"])
+async def api_get_alert(
+    alert_id: str = Path(..., description="ID of the alert"),
+    repo: AlertRepository = Depends(get_alert_repository),
+):
+    """
+    Return one alert with its body (loaded from the content store).
+    """
+    alert = await repo.get_alert(alert_id)
+    if alert is None:
+        raise HTTPException(status_code=404, detail="alert not found")
+    return FastJSONResponse(alert)
+
+
 @router.post("/{news_id}", tags=["alerts"])
 async def api_send_alert(
     news_id: str = Path(..., description="ID of the news item"),
@@ -60,9 +102,21 @@ async def api_send_alert(
     """
     Send an alert for a given news_id.
     The 'to' address can be provided in the body; otherwise the configured ALERT_EMAIL_TO is used.
+    With 'recipients', the message is rendered once and sent to each address
+    over one SMTP session; the response lists the per-recipient results.
     """
     to_addr = payload.to if payload and payload.to else settings.ALERT_EMAIL_TO
 
+    if payload and payload.recipients:
+        try:
+            records = await run_in_threadpool(send_alerts_for_news, emailer, news_id, [str(r) for r in payload.recipients])
+        except ValueError:
+            raise HTTPException(status_code=404, detail="news item not found")
+        sent = sum(1 for r in records if r["sent"])
+        if not sent:
+            raise HTTPException(status_code=502, detail=f"Failed to send alert: {records[0].get('error')}")
+        return {"sent": sent, "failed": len(records) - sent, "alerts": records}
+
     try:
         # Delegate sync sending to threadpool
         record = await run_in_threadpool(send_alert_for_news, emailer, news_id, to_addr)
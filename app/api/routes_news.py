@@ -3,20 +3,31 @@
 Routes for news operations (API v1).
 
 - GET /api/v1/news -> list with pagination
+- GET /api/v1/news/{news_id} -> single item
 - POST /api/v1/news/fetch -> trigger fetch+classify (returns new_count and item ids)
+- GET /api/v1/news/export -> stream NDJSON/CSV export (time range + resume token)
+- POST /api/v1/news/bulk -> ingest pre-fetched items (JSON array or NDJSON stream)
 """
 
-from fastapi import APIRouter, Depends, Query, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
+from typing import Any, List, Optional, Tuple
+from dataclasses import asdict
+from datetime import datetime
+import json
 import logging
 from functools import lru_cache
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
-from app.services.news_fetcher import list_news_paginated, fetch_and_process
-from app.infrastructure.groq_client import GroqClient
-from app.services.classifier import ClassifierService
+from app.services.news_fetcher import fetch_and_process
+from app.services.repositories import MongoNewsRepository
+from app.domain.interfaces import NewsRepository
+from app.services.classifier import ClassifierService, build_classifier
 from app.core.config import settings
-from app.api.schemas import NewsListResponse, FetchResponse
+from app.api.schemas import NewsListResponse, FetchResponse, BulkIngestResponse
+from app.api.responses import FastJSONResponse
+from app.services.exporter import iter_news_export
+from app.services.bulk_ingest import BulkIngestor, ingest_records
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -25,21 +36,44 @@ router = APIRouter()
 @lru_cache()
 def get_classifier() -> ClassifierService:
     """
-    Cached factory for ClassifierService — reuses Groq client across requests.
+    Cached factory for ClassifierService — reuses Groq client / local model across requests.
     """
-    groq = None
-    if settings.GROQ_API_KEY:
-        groq = GroqClient(settings.GROQ_API_KEY)
-    return ClassifierService(classifier=groq)
+    return build_classifier(settings)
+
+
+@lru_cache()
+def get_news_repository() -> NewsRepository:
+    return MongoNewsRepository()
 
 
 @router.get("/", response_model=List[NewsListResponse], tags=["news"])
-async def api_list_news(limit: int = Query(50, ge=1, le=200), offset: int = Query(0, ge=0)):
+async def api_list_news(
+    limit: int = Query(50, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    category: Optional[str] = Query(None, description="Only items labeled with this category"),
+    min_score: Optional[float] = Query(None, ge=0, le=1, description="Minimum score for `category`"),
+    since: Optional[datetime] = Query(None, description="Only items stored after this ingested_at (incremental polling)"),
+    since_id: Optional[str] = Query(None, description="id of the last item seen at `since` (tie-breaker)"),
+    repo: NewsRepository = Depends(get_news_repository),
+):
     """
     Return paginated news items. Use limit/offset for pagination.
+
+    Pollers pass the ingested_at/id of the newest item they hold as
+    since/since_id and receive only newer items, oldest first. Items can
+    become visible out of ingested_at order (batch writes share one
+    timestamp, workers write concurrently), so a poller that must not miss
+    any should instead send `since` a little before its cursor, without
+    since_id, and drop ids it already has (as the Streamlit UI does).
+
+    Served from the raw projection read path on the async Mongo client (no
+    threadpool hop); `response_model` documents the shape but is not re-validated.
     """
-    items = await run_in_threadpool(list_news_paginated, limit, offset)
-    return items
+    try:
+        items = await repo.list_news(limit, offset, category, min_score, since=since, since_id=since_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return FastJSONResponse(items)
 
 
 @router.post("/fetch", response_model=FetchResponse, tags=["news"])
@@ -47,8 +81,120 @@ async def api_fetch_now(classifier: ClassifierService = Depends(get_classifier))
     """
     Trigger a fetch + classify across configured RSS feeds.
     Runs in a threadpool because fetch_and_process is sync and performs blocking IO.
+    Bypasses the ingestion log (its only writer is the scheduled cycle).
     """
-    new_items = await run_in_threadpool(fetch_and_process, classifier)
+    new_items = await run_in_threadpool(fetch_and_process, classifier, use_log=False)
     # Return only the added ids to avoid huge payloads
     item_ids = [it.id for it in new_items]
     return {"new_count": len(new_items), "items": item_ids}
+
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+@router.get("/export", tags=["news"])
+def api_export_news(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    since: Optional[datetime] = Query(None, description="published_at >= since"),
+    until: Optional[datetime] = Query(None, description="published_at < until"),
+    after: Optional[str] = Query(None, description="Resume token: id of the last record received"),
+    batch_size: int = Query(500, ge=10, le=5000),
+):
+    """
+    Stream all matching news items straight from a Mongo cursor.
+    The generator is sync, so Starlette iterates it in a threadpool and the
+    event loop is never blocked; memory is bounded by `batch_size`.
+    """
+    stream = iter_news_export(fmt=format, since=since, until=until, after=after, batch_size=batch_size)
+    return StreamingResponse(stream, media_type=EXPORT_MEDIA_TYPES[format])
+
+
+async def _iter_ndjson(request: Request):
+    """
+    Yield (index, parsed record or None, error) for each non-empty NDJSON line as it arrives.
+    """
+    buffer = b""
+    index = 0
+
+    def parse(line: bytes):
+        try:
+            return json.loads(line), None
+        except ValueError as exc:
+            return None, f"invalid JSON: {exc}"
+
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield (index, *parse(line))
+                index += 1
+    if buffer.strip():
+        yield (index, *parse(buffer))
+
+
+@router.post("/bulk", response_model=BulkIngestResponse, tags=["news"])
+async def api_bulk_ingest(
+    request: Request,
+    classify: bool = Query(True, description="Classify records that arrive without a category"),
+    classifier: ClassifierService = Depends(get_classifier),
+):
+    """
+    Ingest a batch of NewsItem-shaped records pushed by webhooks or crawlers.
+
+    Send a JSON array, or NDJSON (`Content-Type: application/x-ndjson`) which is
+    processed while it streams in. Records go through validation, de-duplication,
+    classification and the bulk store path in chunks of BULK_CHUNK_SIZE; the
+    response reports every rejected record by its position in the request.
+
+    A JSON array over BULK_MAX_RECORDS is refused with 413 before anything is
+    stored. An NDJSON stream is stored as it arrives, so reading stops at the
+    limit instead and the response (200) has `truncated: true` and the counts
+    of what was stored.
+    """
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" in content_type or "jsonl" in content_type:
+        ingestor = BulkIngestor(classifier, classify=classify)
+        chunk: List[Tuple[int, Any]] = []
+        async for index, record, error in _iter_ndjson(request):
+            if index >= settings.BULK_MAX_RECORDS:
+                ingestor.result.truncated = True
+                break
+            if error:
+                ingestor.reject(index, error)
+                continue
+            chunk.append((index, record))
+            if len(chunk) >= settings.BULK_CHUNK_SIZE:
+                await run_in_threadpool(ingestor.ingest_chunk, chunk)
+                chunk = []
+        if chunk:
+            await run_in_threadpool(ingestor.ingest_chunk, chunk)
+        result = ingestor.result
+    else:
+        try:
+            records = json.loads(await request.body())
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=f"invalid JSON body: {exc}")
+        if not isinstance(records, list):
+            raise HTTPException(status_code=400, detail="expected a JSON array of records")
+        if len(records) > settings.BULK_MAX_RECORDS:
+            raise HTTPException(status_code=413, detail=f"at most {settings.BULK_MAX_RECORDS} records per request")
+        result = await run_in_threadpool(ingest_records, records, classifier, classify)
+
+    logger.info(
+        "Bulk ingest: received=%d stored=%d duplicates=%d invalid=%d failed=%d%s",
+        result.received, result.stored, result.duplicates, result.invalid, result.failed,
+        " (truncated)" if result.truncated else "",
+    )
+    return asdict(result)
+
+
+@router.get("/{news_id}", response_model=NewsListResponse, tags=["news"])
+async def api_get_news(news_id: str, repo: NewsRepository = Depends(get_news_repository)):
+    """
+    Return a single news item by id.
+    """
+    item = await repo.get_news(news_id)
+    if item is None:
+        raise HTTPException(status_code=404, detail="news item not found")
+    return FastJSONResponse(item)
@@ -0,0 +1,32 @@
+# app/api/routes_stats.py
+"""
+Routes for dashboard aggregates.
+
+- GET /api/v1/stats -> counts per category, per source and per hour (materialized)
+"""
+
+from fastapi import APIRouter, Depends, Query
+from functools import lru_cache
+
+from app.api.responses import FastJSONResponse
+from app.domain.interfaces import StatsRepository
+from app.services.repositories import MongoStatsRepository
+
+router = APIRouter()
+
+
+@lru_cache()
+def get_stats_repository() -> StatsRepository:
+    return MongoStatsRepository()
+
+
+@router.get("/", tags=["stats"])
+async def api_stats(
+    hours: int = Query(48, ge=1, le=24 * 90, description="Hourly buckets to return"),
+    repo: StatsRepository = Depends(get_stats_repository),
+):
+    """
+    Stored news counts, read from the incrementally maintained `stats`
+    collection (no aggregation over news).
+    """
+    return FastJSONResponse(await repo.get_stats(hours=hours))
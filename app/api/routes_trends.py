@@ -0,0 +1,40 @@
+# app/api/routes_trends.py
+"""
+Routes for trend / burst detection.
+
+- GET /api/v1/trends -> top terms and categories in the current window, with burst flags
+"""
+
+from fastapi import APIRouter, Query
+
+from app.core.config import settings
+from app.services.trends import get_trend_detector
+
+router = APIRouter()
+
+
+@router.get("/", tags=["trends"])
+async def api_trends(
+    limit: int = Query(20, ge=1, le=100, description="Max terms / categories returned"),
+    bursts_only: bool = Query(False, description="Only return keys flagged as bursting"),
+):
+    """
+    Sliding-window counts (approximate, count-min sketch) compared against
+    the preceding baseline window. Counts cover items stored by this process.
+
+    Trend detection is in-process, so it follows the feed cycle only with
+    SCHEDULER_MODE=background. With the job queue (nuvom) feeds are stored
+    by worker processes whose counts are not shared; the response then has
+    `complete: false` and covers only bulk ingests handled by this API process.
+    """
+    snapshot = get_trend_detector().snapshot(limit=limit)
+    snapshot["complete"] = settings.SCHEDULER_MODE != "nuvom"
+    if not snapshot["complete"]:
+        snapshot["note"] = (
+            "trend detection runs in-process; with SCHEDULER_MODE=nuvom feed items are stored by queue "
+            "workers and are not counted here (only bulk ingests via this API process are)"
+        )
+    if bursts_only:
+        snapshot["terms"] = [r for r in snapshot["terms"] if r["burst"]]
+        snapshot["categories"] = [r for r in snapshot["categories"] if r["burst"]]
+    return snapshot
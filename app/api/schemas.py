@@ -6,16 +6,17 @@ Keep these small and explicit so the OpenAPI docs are useful during the demo.
 """
 
 from pydantic import BaseModel, EmailStr, HttpUrl
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
 class SendAlertRequest(BaseModel):
     """
     Body for sending alert manually. 'to' defaults to configured ALERT_EMAIL_TO
-    when omitted.
+    when omitted; 'recipients' fans the same message out to many addresses.
     """
     to: Optional[EmailStr] = None
+    recipients: Optional[List[EmailStr]] = None
 
 
 class NewsListResponse(BaseModel):
@@ -26,9 +27,29 @@ class NewsListResponse(BaseModel):
     source: Optional[str]
     category: Optional[str]
     published_at: Optional[datetime]
+    ingested_at: Optional[datetime] = None
+    scores: Dict[str, float] = {}
 
 
 class FetchResponse(BaseModel):
     new_count: int
     # To avoid returning huge payloads, this includes only the newly added ids
     items: List[str]
+
+
+class BulkIngestError(BaseModel):
+    index: int
+    error: str
+
+
+class BulkIngestResponse(BaseModel):
+    received: int
+    stored: int
+    duplicates: int
+    invalid: int
+    failed: int
+    # first 1000 per-record errors, by position in the request
+    errors: List[BulkIngestError]
+    ids: List[str]
+    # NDJSON only: the stream went past BULK_MAX_RECORDS; records after that were not read
+    truncated: bool = False
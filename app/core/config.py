@@ -4,6 +4,10 @@ Application configuration.
 
 Loads environment variables using Pydantic's BaseSettings for typed access.
 Provides convenience helpers (rss_feed_list).
+
+`settings` is built on first attribute access (get_settings()), not at
+import, so importing app modules stays cheap and does not read the
+environment / .env until something actually needs a value.
 """
 
 try:
@@ -14,7 +18,8 @@ except Exception:
     # fallback for pydantic v1 where BaseSettings is in pydantic
     from pydantic import BaseSettings, Field
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, List, Optional, cast
 
 
 class Settings(BaseSettings):
@@ -32,22 +37,105 @@ class Settings(BaseSettings):
     # LLM / Groq
     GROQ_API_KEY: Optional[str] = ""
     GROQ_MODEL: str = Field("llama-3.1-8b-instant", env="GROQ_MODEL")
+    # client-side budget; match the account's limits for GROQ_MODEL
+    GROQ_RPM: int = Field(30)
+    GROQ_TPM: int = Field(6000)
+    GROQ_MAX_WAIT_SECONDS: float = Field(10.0)
+
+    # Bulk ingest (POST /api/v1/news/bulk)
+    BULK_CHUNK_SIZE: int = Field(1000)
+    BULK_MAX_RECORDS: int = Field(100000)
+
+    # Classifier backend: groq | local | cascade
+    CLASSIFIER_BACKEND: str = Field("groq")
+    LOCAL_MODEL_PATH: str = Field("data/local_classifier.npz")
+    # cascade: first-tier labels below this confidence go to Groq (tune with `uv run tune-cascade`)
+    CASCADE_THRESHOLD: float = Field(0.8)
+    CASCADE_TARGET_PRECISION: float = Field(0.9)
+
+    # Classification fan-out
+    CLASSIFY_CONCURRENCY: int = Field(8)
+    CLASSIFY_TIMEOUT_SECONDS: float = Field(15.0)
+    CYCLE_DEADLINE_SECONDS: float = Field(120.0)
 
     # News filtering
     KEYWORDS: Optional[str] = "[]"
     TOPICS: Optional[str] = "[]"
+    # minimum score for a label to count as a category of an item (category_mask)
+    LABEL_SCORE_THRESHOLD: float = Field(0.5)
 
-    # Redis (future)
+    # Redis (optional; used for leader election when set)
     REDIS_URL: Optional[str] = None
 
+    # Circuit breakers (per dependency: groq, smtp, mongo, feed:<host>)
+    BREAKER_FAILURE_THRESHOLD: int = Field(5)
+    BREAKER_RESET_SECONDS: float = Field(30.0)
+
     # MongoDB
     MONGO_URI: str = Field("mongodb://localhost:27017/news_db", env="MONGO_URI")
+    MONGO_MAX_POOL_SIZE: int = Field(100)
+    MONGO_MIN_POOL_SIZE: int = Field(0)
+    MONGO_MAX_IDLE_TIME_MS: int = Field(0)  # 0 = no limit
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = Field(0)  # 0 = wait for a pooled connection until serverSelectionTimeout
+    MONGO_CONNECT_TIMEOUT_MS: int = Field(5000)
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = Field(5000)
+    MONGO_SOCKET_TIMEOUT_MS: int = Field(0)  # 0 = no limit
+    MONGO_COMPRESSORS: str = Field("")  # e.g. "zstd,snappy,zlib"
+    # dashboard/list/export reads; writes always go to the primary
+    MONGO_READ_PREFERENCE: str = Field("primary")  # primary | primaryPreferred | secondary | secondaryPreferred | nearest
+    MONGO_BULK_WRITE_CONCERN: str = Field("1")  # write concern `w` for bulk ingest ("0", "1", "majority")
+
+    # Retention: days kept in the hot collection (0 = keep forever)
+    NEWS_RETENTION_DAYS: int = Field(30)
+    ALERTS_RETENTION_DAYS: int = Field(90)
+    JOBS_RETENTION_DAYS: int = Field(7)
+    RETENTION_MODE: str = Field("ttl")  # ttl | collection (move to <name>_archive) | file (gzip NDJSON)
+    RETENTION_ARCHIVE_DIR: str = Field("data/archive")
+    RETENTION_INTERVAL_SECONDS: int = Field(3600)
     
     # Scheduler mode
     SCHEDULER_MODE: str = Field("background")
 
+    # Leader election (only the lease holder runs the periodic task)
+    LEADER_ELECTION: bool = Field(True)
+    LEADER_LEASE_NAME: str = Field("news-scheduler")
+    LEADER_LEASE_TTL_SECONDS: int = Field(15)
+
+    # Job queue (SCHEDULER_MODE=nuvom)
+    QUEUE_CONCURRENCY: int = Field(2)  # worker processes started by the API; 0 = external workers only
+    QUEUE_MAX_ATTEMPTS: int = Field(3)
+    QUEUE_RETRY_BACKOFF_SECONDS: float = Field(5.0)
+    QUEUE_VISIBILITY_TIMEOUT_SECONDS: int = Field(300)
+    QUEUE_POLL_SECONDS: float = Field(1.0)
+    QUEUE_CLASSIFY_BATCH_SIZE: int = Field(10)
+
+    # Trend / burst detection (app.services.trends)
+    TREND_BUCKET_SECONDS: int = Field(300)
+    TREND_WINDOW_BUCKETS: int = Field(3)  # current window
+    TREND_BASELINE_BUCKETS: int = Field(24)  # history the window is compared against
+    TREND_BURST_RATIO: float = Field(3.0)
+    TREND_MIN_COUNT: int = Field(5)
+    TREND_SKETCH_WIDTH: int = Field(2048)
+    TREND_SKETCH_DEPTH: int = Field(4)
+    TREND_TOP_K: int = Field(50)
+
     # RSS feeds
     RSS_FEEDS: Optional[str] = ""
+    FEED_CHECKPOINT_MAX_GUIDS: int = Field(1000)  # processed entry GUIDs remembered per feed
+
+    # Priority fast lane (app.services.priority): items from these sources (feed
+    # URLs or feed titles) or matching these keywords skip the regular queue and alert at once
+    PRIORITY_SOURCES: Optional[str] = ""
+    PRIORITY_KEYWORDS: Optional[str] = ""
+    PRIORITY_FETCH_INTERVAL_SECONDS: int = Field(10)  # polling of priority feed URLs (background mode)
+    PRIORITY_ALERT_TO: Optional[str] = None  # defaults to ALERT_EMAIL_TO
+
+    # On-disk ingestion log between fetch and classify/store (app.core.ingest_log)
+    INGEST_LOG_ENABLED: bool = Field(False)
+    INGEST_LOG_DIR: str = Field("data/ingest_log")
+    INGEST_LOG_SEGMENT_BYTES: int = Field(64 * 1024 * 1024)
+    INGEST_LOG_BATCH: int = Field(500)  # records classified + stored per cycle
+    INGEST_LOG_RETENTION_HOURS: int = Field(72)  # kept for replay once consumed
 
     # Logging
     LOG_LEVEL: str = Field("INFO")
@@ -71,5 +159,62 @@ class Settings(BaseSettings):
             return []
         return [s.strip() for s in raw.split(",") if s.strip()]
 
+    @property
+    def topic_list(self) -> List[str]:
+        """
+        Return the configured TOPICS as a list; accepts "a,b" or "[a, b]" / JSON lists.
+        """
+        raw = (self.TOPICS or "").strip().strip("[]")
+        return [s.strip().strip("'\"").lower() for s in raw.split(",") if s.strip().strip("'\"")]
+
+    @property
+    def priority_source_list(self) -> List[str]:
+        """
+        Return the configured PRIORITY_SOURCES (feed URLs or feed titles) as a list.
+        """
+        raw = (self.PRIORITY_SOURCES or "").strip()
+        return [s.strip() for s in raw.split(",") if s.strip()]
+
+    @property
+    def priority_keyword_list(self) -> List[str]:
+        """
+        Return the configured PRIORITY_KEYWORDS as a lowercase list.
+        """
+        raw = (self.PRIORITY_KEYWORDS or "").strip().strip("[]")
+        return [s.strip().strip("'\"").lower() for s in raw.split(",") if s.strip().strip("'\"")]
+
+    @property
+    def priority_feed_list(self) -> List[str]:
+        """
+        Configured RSS feeds that are themselves priority sources (polled by the fast lane).
+        """
+        sources = set(self.priority_source_list)
+        return [url for url in self.rss_feed_list if url in sources]
+
+
+@lru_cache()
+def get_settings() -> Settings:
+    """
+    The process-wide Settings instance, built on first use.
+    """
+    return Settings()
+
+
+class _LazySettings:
+    """
+    Stand-in for the Settings instance that builds it on first attribute access.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_settings(), name, value)
+
+    def __repr__(self) -> str:
+        return repr(get_settings())
+
 
-settings = Settings()
+settings = cast(Settings, _LazySettings())
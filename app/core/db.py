@@ -1,10 +1,173 @@
 # app/core/db.py
 """ Initialize database connection. """
 from mongoengine import connect
+from mongoengine.connection import get_db
+from pymongo import AsyncMongoClient, ReadPreference, WriteConcern
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.monitoring import ConnectionPoolListener
+from threading import Lock
+from typing import Any, Dict
 import os
 from app.core.config import settings
 
+_async_client = None
+
+
+class PoolStats(ConnectionPoolListener):
+    """
+    Connection pool counters for one client (checkouts, failures, wait time, open connections).
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.checkout_failures = 0
+            self.wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+            self.in_use = 0
+            self.open = 0
+            self.pool_clears = 0
+
+    def _waited(self, event) -> None:
+        duration = getattr(event, "duration", None) or 0.0
+        self.wait_seconds += duration
+        self.max_wait_seconds = max(self.max_wait_seconds, duration)
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self._waited(event)
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.checkout_failures += 1
+            self._waited(event)
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.in_use -= 1
+
+    def connection_created(self, event):
+        with self._lock:
+            self.open += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.open -= 1
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.pool_clears += 1
+
+    # required by the listener interface, not counted
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "avg_wait_ms": 1000 * self.wait_seconds / self.checkouts if self.checkouts else 0.0,
+                "max_wait_ms": 1000 * self.max_wait_seconds,
+                "in_use": self.in_use,
+                "open": self.open,
+                "pool_clears": self.pool_clears,
+            }
+
+
+# one listener per client so sync (scheduler/ingest) and async (API reads) pools are reported separately
+pool_stats = {"sync": PoolStats(), "async": PoolStats()}
+
+
+def _client_options() -> Dict[str, Any]:
+    options: Dict[str, Any] = {
+        "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": settings.MONGO_MAX_IDLE_TIME_MS or None,
+        "waitQueueTimeoutMS": settings.MONGO_WAIT_QUEUE_TIMEOUT_MS or None,
+        "connectTimeoutMS": settings.MONGO_CONNECT_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "socketTimeoutMS": settings.MONGO_SOCKET_TIMEOUT_MS or None,
+    }
+    compressors = [c.strip() for c in settings.MONGO_COMPRESSORS.split(",") if c.strip()]
+    if compressors:
+        # zstd needs `zstandard`, snappy needs `python-snappy` (extra: compression); unavailable ones are skipped
+        options["compressors"] = compressors
+    return options
+
+
+_READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primarypreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondarypreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST,
+}
+
+
+def _read_preference():
+    try:
+        return _READ_PREFERENCES[settings.MONGO_READ_PREFERENCE.lower()]
+    except KeyError:
+        raise ValueError(f"unknown MONGO_READ_PREFERENCE {settings.MONGO_READ_PREFERENCE!r}")
+
 
 def init_db():
     MONGO_URI = settings.MONGO_URI
-    connect(host=MONGO_URI)
+    # writes (and the default for everything) go to the primary
+    connect(host=MONGO_URI, event_listeners=[pool_stats["sync"]], **_client_options())
+
+
+def read_collection(collection):
+    """
+    `collection` routed by MONGO_READ_PREFERENCE; use for dashboard/list/export reads
+    that tolerate replication lag.
+    """
+    return collection.with_options(read_preference=_read_preference())
+
+
+def bulk_collection(collection):
+    """
+    `collection` with the bulk-ingest write concern (MONGO_BULK_WRITE_CONCERN).
+    """
+    w = settings.MONGO_BULK_WRITE_CONCERN
+    return collection.with_options(write_concern=WriteConcern(w=int(w) if w.isdigit() else w))
+
+
+def get_async_db() -> AsyncDatabase:
+    """
+    Database handle on the shared async client (API read path).
+
+    The client is created on first use, inside the running event loop, and
+    keeps its own connection pool. Call init_db() first so both clients
+    resolve the same database name. Reads follow MONGO_READ_PREFERENCE.
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncMongoClient(settings.MONGO_URI, event_listeners=[pool_stats["async"]], **_client_options())
+    return _async_client.get_database(get_db().name, read_preference=_read_preference())
+
+
+async def close_async_db() -> None:
+    global _async_client
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
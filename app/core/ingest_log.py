@@ -0,0 +1,302 @@
+# app/core/ingest_log.py
+"""
+Append-only, segmented on-disk log between the fetch and classify/store stages.
+
+Layout (INGEST_LOG_DIR):
+
+    00000000000000000000.log    segment; the name is its base offset
+    00000000000067108864.log
+    offsets/<consumer>          committed offset of each consumer
+
+Offsets are byte positions in the logical log (segment base + position in
+segment), so any offset can be located without an index. Segments are
+preallocated to INGEST_LOG_SEGMENT_BYTES and memory-mapped; a record is
+
+    header  <IIqB  payload length, crc32(payload), fetch time (ms), flags
+    payload        compact binary NewsRecord (zlib-compressed when large)
+
+and the zero-filled tail ends a segment. On open, the active segment is
+scanned and a torn final record (short or bad crc) is ignored, so a crash
+mid-append loses at most that record.
+
+Consumers read from their committed offset and commit only after the batch
+has been processed, so a slow or failing downstream stage never loses items:
+they wait in the log. Segments older than INGEST_LOG_RETENTION_HOURS that
+every consumer has passed are deleted; anything still on disk can be
+replayed by time range (`uv run replay-log`).
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Iterator, List, Optional, Tuple
+import mmap
+import os
+import struct
+import time
+import zlib
+
+from app.domain.records import NewsRecord
+
+HEADER = struct.Struct("<IIqB")
+FLAG_ZLIB = 1
+COMPRESS_ABOVE = 512
+_NONE = 0xFFFFFFFF
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_TEXT_FIELDS = ("id", "title", "link", "summary", "source", "category")
+
+
+def encode_record(record: NewsRecord) -> Tuple[bytes, int]:
+    """
+    Serialize the fetch-stage fields of a record; returns (payload, flags).
+    """
+    published = record.published_at
+    if published is not None and published.tzinfo is not None:
+        published = published.astimezone(timezone.utc).replace(tzinfo=None)
+    ms = int(published.replace(tzinfo=timezone.utc).timestamp() * 1000) if published else -1
+    parts = [_I64.pack(ms)]
+    for name in _TEXT_FIELDS:
+        value = getattr(record, name)
+        if value is None:
+            parts.append(_U32.pack(_NONE))
+        else:
+            data = value.encode("utf-8")
+            parts.append(_U32.pack(len(data)))
+            parts.append(data)
+    payload = b"".join(parts)
+    if len(payload) > COMPRESS_ABOVE:
+        return zlib.compress(payload, 1), FLAG_ZLIB
+    return payload, 0
+
+
+def decode_record(payload: bytes, flags: int) -> NewsRecord:
+    if flags & FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+    (ms,) = _I64.unpack_from(payload, 0)
+    pos = _I64.size
+    values = {}
+    for name in _TEXT_FIELDS:
+        (size,) = _U32.unpack_from(payload, pos)
+        pos += _U32.size
+        if size == _NONE:
+            values[name] = None
+        else:
+            values[name] = payload[pos:pos + size].decode("utf-8")
+            pos += size
+    published_at = datetime.fromtimestamp(ms / 1000, tz=timezone.utc).replace(tzinfo=None) if ms >= 0 else None
+    return NewsRecord(
+        id=values["id"],
+        title=values["title"] or "",
+        link=values["link"],
+        summary=values["summary"],
+        published_at=published_at,
+        source=values["source"],
+        category=values["category"] or "uncategorized",
+    )
+
+
+class _Segment:
+
+    def __init__(self, path: Path, base: int, size: Optional[int] = None):
+        self.path = path
+        self.base = base
+        if size is not None:
+            with open(path, "wb") as fh:
+                fh.truncate(size)
+        self._file = open(path, "r+b")
+        self.mm = mmap.mmap(self._file.fileno(), 0)
+        self.size = len(self.mm)
+        self.end = self._scan()
+
+    def _scan(self) -> int:
+        """
+        Position after the last complete, crc-valid record.
+        """
+        pos = 0
+        while pos + HEADER.size <= self.size:
+            length, crc, _, _ = HEADER.unpack_from(self.mm, pos)
+            start = pos + HEADER.size
+            if length == 0 or start + length > self.size:
+                break
+            if zlib.crc32(self.mm[start:start + length]) != crc:
+                break
+            pos = start + length
+        return pos
+
+    def records(self, pos: int) -> Iterator[Tuple[int, int, int, bytes]]:
+        """
+        Yield (position after record, timestamp ms, flags, payload) from `pos` to the end.
+        """
+        while pos < self.end:
+            length, _, ts, flags = HEADER.unpack_from(self.mm, pos)
+            start = pos + HEADER.size
+            pos = start + length
+            yield pos, ts, flags, self.mm[start:pos]
+
+    def first_timestamp(self) -> Optional[int]:
+        if self.end == 0:
+            return None
+        return HEADER.unpack_from(self.mm, 0)[2]
+
+    def last_timestamp(self) -> Optional[int]:
+        last = None
+        for _, ts, _, _ in self.records(0):
+            last = ts
+        return last
+
+    def close(self) -> None:
+        self.mm.close()
+        self._file.close()
+
+
+class IngestLog:
+
+    def __init__(self, directory: str, segment_bytes: int = 64 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.segment_bytes = segment_bytes
+        (self.directory / "offsets").mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._segments: List[_Segment] = [
+            _Segment(path, int(path.stem)) for path in sorted(self.directory.glob("*.log"))
+        ]
+        if not self._segments:
+            self._segments.append(self._new_segment(0, segment_bytes))
+
+    def _new_segment(self, base: int, size: int) -> _Segment:
+        return _Segment(self.directory / f"{base:020d}.log", base, size=size)
+
+    @property
+    def end_offset(self) -> int:
+        active = self._segments[-1]
+        return active.base + active.end
+
+    def append(self, records: List[NewsRecord], now: Optional[float] = None) -> int:
+        """
+        Append records (stamped with the fetch time) and flush; returns the new end offset.
+        """
+        ts = int((time.time() if now is None else now) * 1000)
+        with self._lock:
+            active = self._segments[-1]
+            for record in records:
+                payload, flags = encode_record(record)
+                needed = HEADER.size + len(payload)
+                if active.end + needed > active.size:
+                    active.mm.flush()
+                    # sealed segments keep their zero-filled tail; offsets continue from the end position
+                    active = self._new_segment(active.base + active.end, max(self.segment_bytes, needed))
+                    self._segments.append(active)
+                HEADER.pack_into(active.mm, active.end, len(payload), zlib.crc32(payload), ts, flags)
+                start = active.end + HEADER.size
+                active.mm[start:start + len(payload)] = payload
+                active.end = start + len(payload)
+            active.mm.flush()
+            return active.base + active.end
+
+    def read(self, offset: int, max_records: int) -> Tuple[List[NewsRecord], int]:
+        """
+        Up to `max_records` records starting at `offset`; returns (records, next offset).
+        """
+        records: List[NewsRecord] = []
+        with self._lock:
+            for segment in self._segments:
+                if segment.base + segment.end <= offset:
+                    continue
+                pos = max(offset - segment.base, 0)
+                for end, _, flags, payload in segment.records(pos):
+                    records.append(decode_record(payload, flags))
+                    offset = segment.base + end
+                    if len(records) >= max_records:
+                        return records, offset
+                # the next segment starts where this one's records end
+        return records, offset
+
+    def iter_range(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> Iterator[NewsRecord]:
+        """
+        Records fetched in [since, until) (naive datetimes are UTC).
+        """
+        lo = _ms(since) if since else None
+        hi = _ms(until) if until else None
+        with self._lock:
+            segments = list(self._segments)
+        for index, segment in enumerate(segments):
+            following = segments[index + 1].first_timestamp() if index + 1 < len(segments) else None
+            if lo is not None and following is not None and following < lo:
+                continue
+            first = segment.first_timestamp()
+            if hi is not None and first is not None and first >= hi:
+                break
+            for _, ts, flags, payload in segment.records(0):
+                if (lo is None or ts >= lo) and (hi is None or ts < hi):
+                    yield decode_record(payload, flags)
+
+    def committed(self, consumer: str) -> int:
+        """
+        Committed offset of `consumer`; new consumers start at the oldest retained record.
+        """
+        path = self.directory / "offsets" / consumer
+        if path.exists():
+            return int(path.read_text().strip() or 0)
+        return self._segments[0].base
+
+    def commit(self, consumer: str, offset: int) -> None:
+        path = self.directory / "offsets" / consumer
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(str(offset))
+        os.replace(tmp, path)  # atomic: a crash leaves the old or the new offset
+
+    def lag(self, consumer: str) -> int:
+        """
+        Bytes between the consumer's committed offset and the end of the log.
+        """
+        return self.end_offset - self.committed(consumer)
+
+    def delete_expired(self, retention_seconds: float, now: Optional[float] = None) -> int:
+        """
+        Delete sealed segments whose newest record is older than the retention
+        window and that every consumer has fully read. Returns segments deleted.
+        """
+        cutoff = int(((time.time() if now is None else now) - retention_seconds) * 1000)
+        consumers = [p for p in (self.directory / "offsets").iterdir() if p.suffix != ".tmp"]
+        low_water = min((self.committed(p.name) for p in consumers), default=self.end_offset)
+        deleted = 0
+        with self._lock:
+            while len(self._segments) > 1:
+                segment = self._segments[0]
+                last = segment.last_timestamp()
+                if segment.base + segment.end > low_water or (last is not None and last >= cutoff):
+                    break
+                segment.close()
+                segment.path.unlink()
+                self._segments.pop(0)
+                deleted += 1
+        return deleted
+
+    def close(self) -> None:
+        with self._lock:
+            for segment in self._segments:
+                segment.close()
+
+
+def _ms(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+_log: Optional[IngestLog] = None
+_log_lock = Lock()
+
+
+def get_ingest_log() -> IngestLog:
+    """
+    Process-wide log at INGEST_LOG_DIR (one writer process per directory:
+    the main fetch cycle of the leader, see news_fetcher.fetch_and_process).
+    """
+    global _log
+    with _log_lock:
+        if _log is None:
+            from app.core.config import settings
+
+            _log = IngestLog(settings.INGEST_LOG_DIR, settings.INGEST_LOG_SEGMENT_BYTES)
+        return _log
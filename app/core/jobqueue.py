@@ -0,0 +1,164 @@
+# app/core/jobqueue.py
+"""
+MongoDB-backed job queue.
+
+Jobs are documents in the `jobs` collection. Producers call enqueue(); worker
+processes claim() jobs atomically (find-and-modify), run the registered task
+handler and record the result. Failed jobs are re-queued with exponential
+backoff until max_attempts, and jobs whose worker died are reclaimed once
+their lock expires.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+import logging
+
+from app.core.config import settings
+from app.models.job_doc import JobDocument
+
+logger = logging.getLogger(__name__)
+
+TaskHandler = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+_TASKS: Dict[str, TaskHandler] = {}
+
+
+def register_task(name: str) -> Callable[[TaskHandler], TaskHandler]:
+    """
+    Decorator registering a job handler under `name`.
+
+    Handlers receive the job payload and may return a dict stored as the job result.
+    """
+    def decorator(func: TaskHandler) -> TaskHandler:
+        _TASKS[name] = func
+        return func
+    return decorator
+
+
+def get_task(name: str) -> Optional[TaskHandler]:
+    return _TASKS.get(name)
+
+
+def enqueue(
+    task: str,
+    payload: Optional[Dict[str, Any]] = None,
+    priority: int = 0,
+    max_attempts: Optional[int] = None,
+    dedupe_key: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Add a job to the queue. Returns the job id, or None if an identical
+    (same dedupe_key) job is already queued or running.
+    """
+    if dedupe_key and JobDocument.objects(dedupe_key=dedupe_key, status__in=["queued", "running"]).first():
+        logger.debug("Job %s (%s) already pending; not enqueued", task, dedupe_key)
+        return None
+
+    job = JobDocument(
+        task=task,
+        payload=payload or {},
+        priority=priority,
+        max_attempts=max_attempts or settings.QUEUE_MAX_ATTEMPTS,
+        dedupe_key=dedupe_key,
+    )
+    job.save()
+    return str(job.id)
+
+
+def claim(worker_id: str) -> Optional[JobDocument]:
+    """
+    Atomically lock the next runnable job for `worker_id`.
+
+    Jobs whose lock expired (the worker died or hung) are reclaimed while
+    they have attempts left; once attempts reach max_attempts they are
+    marked failed instead, so a job that kills its worker is not retried forever.
+    """
+    now = datetime.now(timezone.utc)
+    expired = {"status": "running", "locked_until": {"$lt": now}}
+    exhausted = JobDocument.objects(
+        __raw__={**expired, "$expr": {"$gte": ["$attempts", "$max_attempts"]}}
+    ).update(
+        set__status="failed",
+        set__error="lock expired on the last attempt (worker died or timed out)",
+        set__finished_at=now,
+        unset__locked_until=True,
+    )
+    if exhausted:
+        logger.error("Marked %d expired jobs as failed after their last attempt", exhausted)
+    runnable = {"$or": [
+        {"status": "queued", "run_at": {"$lte": now}},
+        {**expired, "$expr": {"$lt": ["$attempts", "$max_attempts"]}},
+    ]}
+    return (
+        JobDocument.objects(__raw__=runnable)
+        .order_by("-priority", "run_at")
+        .modify(
+            new=True,
+            set__status="running",
+            set__locked_by=worker_id,
+            set__locked_until=now + timedelta(seconds=settings.QUEUE_VISIBILITY_TIMEOUT_SECONDS),
+            inc__attempts=1,
+        )
+    )
+
+
+def complete(job: JobDocument, result: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Mark a job as done and store its result.
+    """
+    JobDocument.objects(id=job.id, locked_by=job.locked_by).update_one(
+        set__status="done",
+        set__result=result or {},
+        set__finished_at=datetime.now(timezone.utc),
+        unset__locked_until=True,
+    )
+
+
+def fail(job: JobDocument, exc: BaseException) -> None:
+    """
+    Record a failure; re-queue with exponential backoff or mark as failed.
+    """
+    now = datetime.now(timezone.utc)
+    if job.attempts < job.max_attempts:
+        delay = settings.QUEUE_RETRY_BACKOFF_SECONDS * (2 ** (job.attempts - 1))
+        JobDocument.objects(id=job.id, locked_by=job.locked_by).update_one(
+            set__status="queued",
+            set__error=str(exc),
+            set__run_at=now + timedelta(seconds=delay),
+            unset__locked_until=True,
+        )
+        logger.warning("Job %s (%s) failed, retry %d/%d in %.1fs", job.id, job.task, job.attempts, job.max_attempts, delay)
+        return
+
+    JobDocument.objects(id=job.id, locked_by=job.locked_by).update_one(
+        set__status="failed",
+        set__error=str(exc),
+        set__finished_at=now,
+        unset__locked_until=True,
+    )
+    logger.error("Job %s (%s) failed permanently after %d attempts", job.id, job.task, job.attempts)
+
+
+def run_job(job: JobDocument) -> None:
+    """
+    Execute a claimed job with its registered handler and record the outcome.
+    """
+    handler = get_task(job.task)
+    if handler is None:
+        fail(job, LookupError(f"no handler registered for task '{job.task}'"))
+        return
+    try:
+        result = handler(job.payload or {})
+    except Exception as exc:
+        logger.exception("Job %s (%s) raised", job.id, job.task)
+        fail(job, exc)
+        return
+    complete(job, result)
+
+
+def queue_stats() -> Dict[str, int]:
+    """
+    Count jobs per status.
+    """
+    pipeline = [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]
+    return {row["_id"]: row["count"] for row in JobDocument.objects.aggregate(pipeline)}
@@ -0,0 +1,179 @@
+# app/core/leader.py
+"""
+Leader election for periodic work.
+
+Every API process creates a scheduler, but only the process holding the
+leader lease actually runs the periodic task. The lease is a short-lived
+record (Mongo document or Redis key) that the leader renews on a heartbeat;
+if the leader dies, the lease expires after `ttl_seconds` and another
+process takes over on its next heartbeat.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+import logging
+import os
+import socket
+import uuid
+
+from app.core.config import settings
+
+try:
+    import redis
+except ImportError:
+    redis = None  # Redis backend is optional; Mongo is used otherwise
+
+logger = logging.getLogger(__name__)
+
+
+def default_owner_id() -> str:
+    """
+    Build a process-unique owner id (host:pid:random).
+    """
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderLease(ABC):
+    """
+    A renewable, expiring lease. At most one owner holds it at a time.
+    """
+
+    def __init__(self, name: str, ttl_seconds: int = 15, owner: Optional[str] = None):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.owner = owner or default_owner_id()
+        self.is_leader = False
+
+    @property
+    def renew_interval(self) -> float:
+        """
+        How often the holder should renew; a third of the TTL leaves room for two misses.
+        """
+        return max(self.ttl_seconds / 3.0, 1.0)
+
+    def acquire(self) -> bool:
+        """
+        Acquire the lease or renew it if already held. Returns True if this process leads.
+        """
+        try:
+            leader = self._try_acquire()
+        except Exception:
+            logger.exception("Leader lease '%s' heartbeat failed", self.name)
+            leader = False
+
+        if leader != self.is_leader:
+            logger.info(
+                "Leader lease '%s': %s %s",
+                self.name, self.owner, "acquired" if leader else "lost",
+            )
+        self.is_leader = leader
+        return leader
+
+    def release(self) -> None:
+        """
+        Give up the lease (if held) so another process can take over immediately.
+        """
+        if not self.is_leader:
+            return
+        try:
+            self._release()
+            logger.info("Leader lease '%s' released by %s", self.name, self.owner)
+        except Exception:
+            logger.exception("Failed to release leader lease '%s'", self.name)
+        finally:
+            self.is_leader = False
+
+    @abstractmethod
+    def _try_acquire(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _release(self) -> None:
+        raise NotImplementedError
+
+
+class MongoLeaderLease(LeaderLease):
+    """
+    Lease stored as a single document in the `leases` collection.
+
+    Acquisition is an upsert that only matches when the lease is ours or has
+    expired; when someone else holds it the upsert collides on `_id` and fails.
+    Requires init_db() to have been called.
+    """
+
+    collection_name = "leases"
+
+    def _collection(self):
+        from mongoengine.connection import get_db
+        return get_db()[self.collection_name]
+
+    def _try_acquire(self) -> bool:
+        from pymongo.errors import DuplicateKeyError
+
+        now = datetime.now(timezone.utc)
+        try:
+            self._collection().update_one(
+                {
+                    "_id": self.name,
+                    "$or": [{"owner": self.owner}, {"expires_at": {"$lt": now}}],
+                },
+                {"$set": {"owner": self.owner, "expires_at": now + timedelta(seconds=self.ttl_seconds)}},
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # held by another live owner
+            return False
+        return True
+
+    def _release(self) -> None:
+        self._collection().delete_one({"_id": self.name, "owner": self.owner})
+
+
+class RedisLeaderLease(LeaderLease):
+    """
+    Lease stored as a Redis key with a PX expiry (SET NX + owner-checked renew).
+    """
+
+    _RENEW = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('pexpire', KEYS[1], ARGV[2]) else return 0 end"
+    )
+    _RELEASE = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
+
+    def __init__(self, url: str, name: str, ttl_seconds: int = 15, owner: Optional[str] = None):
+        if redis is None:
+            raise RuntimeError("REDIS_URL is set but the redis package is not installed")
+        super().__init__(name=name, ttl_seconds=ttl_seconds, owner=owner)
+        self.client = redis.Redis.from_url(url)
+        self.key = f"leader:{name}"
+
+    def _try_acquire(self) -> bool:
+        ttl_ms = int(self.ttl_seconds * 1000)
+        if self.client.set(self.key, self.owner, nx=True, px=ttl_ms):
+            return True
+        return bool(self.client.eval(self._RENEW, 1, self.key, self.owner, ttl_ms))
+
+    def _release(self) -> None:
+        self.client.eval(self._RELEASE, 1, self.key, self.owner)
+
+
+def create_leader_lease(name: Optional[str] = None) -> Optional[LeaderLease]:
+    """
+    Build the leader lease configured in settings.
+
+    Uses Redis when REDIS_URL is set, Mongo otherwise. Returns None when leader
+    election is disabled (every process runs the task, as before).
+    """
+    if not settings.LEADER_ELECTION:
+        return None
+
+    name = name or settings.LEADER_LEASE_NAME
+    ttl = settings.LEADER_LEASE_TTL_SECONDS
+
+    if settings.REDIS_URL:
+        return RedisLeaderLease(settings.REDIS_URL, name=name, ttl_seconds=ttl)
+    return MongoLeaderLease(name=name, ttl_seconds=ttl)
@@ -0,0 +1,129 @@
+# app/core/queue_worker.py
+"""
+Queue worker processes.
+
+A WorkerPool spawns N processes; each one connects to MongoDB and loops:
+claim a job, run it, repeat. Throughput scales with the number of processes.
+The pool respawns processes that exit (e.g. killed by a job), so it keeps
+its size until stopped.
+"""
+
+from multiprocessing import get_context
+from multiprocessing.synchronize import Event as EventType
+from threading import Thread
+from typing import List, Optional
+import logging
+import os
+import socket
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueueWorker:
+    """
+    Single-process claim/run loop.
+    """
+
+    def __init__(self, worker_id: str, poll_seconds: float = 1.0):
+        self.worker_id = worker_id
+        self.poll_seconds = poll_seconds
+
+    def run(self, stop_event: EventType) -> None:
+        from app.core.jobqueue import claim, run_job
+
+        logger.info("Queue worker %s started", self.worker_id)
+        while not stop_event.is_set():
+            try:
+                job = claim(self.worker_id)
+            except Exception:
+                logger.exception("Queue worker %s failed to claim a job", self.worker_id)
+                job = None
+
+            if job is None:
+                stop_event.wait(self.poll_seconds)
+                continue
+
+            try:
+                run_job(job)
+            except Exception:
+                # recording the outcome failed (e.g. Mongo down); the job's lock expires and it is reclaimed
+                logger.exception("Queue worker %s failed to run job %s", self.worker_id, job.id)
+        logger.info("Queue worker %s stopped", self.worker_id)
+
+
+def _worker_process(index: int, stop_event: EventType) -> None:
+    """
+    Entry point of a spawned worker process.
+    """
+    from app.core.logging import configure_logging
+    from app.core.db import init_db
+    import app.services.jobs  # noqa: F401  (registers task handlers)
+
+    configure_logging()
+    init_db()
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:{index}"
+    QueueWorker(worker_id, poll_seconds=settings.QUEUE_POLL_SECONDS).run(stop_event)
+
+
+class WorkerPool:
+    """
+    Pool of queue worker processes (spawned, so each gets its own Mongo connection).
+    """
+
+    def __init__(self, concurrency: int, supervise_seconds: float = 5.0):
+        self.concurrency = concurrency
+        self.supervise_seconds = supervise_seconds
+        self._ctx = get_context("spawn")
+        self._stop_event = self._ctx.Event()
+        self._processes: List = []
+        self._supervisor: Optional[Thread] = None
+
+    def _spawn(self, index: int):
+        proc = self._ctx.Process(
+            target=_worker_process,
+            args=(index, self._stop_event),
+            name=f"queue-worker-{index}",
+            daemon=True,
+        )
+        proc.start()
+        return proc
+
+    def _supervise(self) -> None:
+        while not self._stop_event.wait(self.supervise_seconds):
+            for index, proc in enumerate(self._processes):
+                if not proc.is_alive() and not self._stop_event.is_set():
+                    logger.warning("Worker %s exited with code %s; respawning", proc.name, proc.exitcode)
+                    self._processes[index] = self._spawn(index)
+
+    def start(self) -> None:
+        if self._processes:
+            return
+        self._stop_event.clear()
+        self._processes = [self._spawn(index) for index in range(self.concurrency)]
+        self._supervisor = Thread(target=self._supervise, name="queue-worker-supervisor", daemon=True)
+        self._supervisor.start()
+        logger.info("WorkerPool started %d worker processes", self.concurrency)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop_event.set()
+        if self._supervisor is not None:
+            self._supervisor.join()
+            self._supervisor = None
+        for proc in self._processes:
+            proc.join(timeout=timeout)
+            if proc.is_alive():
+                logger.warning("Worker %s did not exit in time; terminating", proc.name)
+                proc.terminate()
+        self._processes = []
+        logger.info("WorkerPool stopped")
+
+    def join(self) -> None:
+        """
+        Block until the pool is stopped (workers that exit meanwhile are respawned).
+        """
+        if self._supervisor is not None:
+            self._supervisor.join()
+        for proc in self._processes:
+            proc.join()
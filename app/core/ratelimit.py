@@ -0,0 +1,204 @@
+# app/core/ratelimit.py
+"""
+Client-side rate limiting for the Groq API.
+
+Two token buckets (requests per minute, tokens per minute) are charged for
+every call. Callers wait for budget up to a priority-dependent limit;
+low-priority calls are shed immediately when no budget is left (the classifier
+then falls back to keywords). Budgets are re-synced from the provider's
+x-ratelimit-* / retry-after response headers so the client tracks the real
+server-side window instead of drifting into 429s.
+"""
+
+from functools import lru_cache
+from typing import Mapping, Optional
+import asyncio
+import logging
+import math
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+PRIORITIES = ("high", "normal", "low")
+
+
+class RateLimitExceeded(RuntimeError):
+    """Raised when a call would have to wait longer than its priority allows."""
+
+
+class TokenBucket:
+    """
+    Classic token bucket. Not thread-safe on its own; RateLimiter holds the lock.
+
+    Tokens may go negative: a reservation that has to wait takes its tokens up
+    front, so concurrent waiters queue behind each other instead of all waking
+    at the same moment.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self._updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+
+    def wait_for(self, amount: float) -> float:
+        """
+        Seconds until `amount` tokens are available (0 if available now).
+        """
+        if self.tokens >= amount:
+            return 0.0
+        if self.refill_per_second <= 0:
+            return math.inf
+        return (amount - self.tokens) / self.refill_per_second
+
+    def take(self, amount: float) -> None:
+        self.tokens -= amount
+
+
+def estimate_tokens(text: str, prompt_overhead: int = 60, completion_tokens: int = 50) -> int:
+    """
+    Rough prompt+completion token estimate (~4 characters per token).
+    """
+    return math.ceil(len(text) / 4) + prompt_overhead + completion_tokens
+
+
+_DURATION = re.compile(r"(?:(\d+(?:\.\d+)?)h)?(?:(\d+(?:\.\d+)?)m(?!s))?(?:(\d+(?:\.\d+)?)s)?(?:(\d+(?:\.\d+)?)ms)?$")
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """
+    Parse reset durations as sent by Groq/OpenAI ("2m59.56s", "7.66s", "120ms", "3").
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    match = _DURATION.match(value)
+    if not match or not any(match.groups()):
+        return None
+    hours, minutes, seconds, millis = (float(g) if g else 0.0 for g in match.groups())
+    return hours * 3600 + minutes * 60 + seconds + millis / 1000
+
+
+class RateLimiter:
+    """
+    Requests-per-minute + tokens-per-minute limiter shared by all Groq calls in a process.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, max_wait_seconds: float = 10.0):
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+        self.max_wait_seconds = max_wait_seconds
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _max_wait(self, priority: str) -> float:
+        if priority == "low":
+            return 0.0
+        if priority == "high":
+            return self.max_wait_seconds * 2
+        return self.max_wait_seconds
+
+    def reserve(self, tokens: int, priority: str = "normal") -> float:
+        """
+        Reserve budget for one request and return how long to wait before sending.
+
+        Raises RateLimitExceeded (without charging anything) when the wait would
+        exceed the priority's limit.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.requests.refill(now)
+            self.tokens.refill(now)
+            wait = max(
+                self.requests.wait_for(1),
+                self.tokens.wait_for(min(tokens, self.tokens.capacity)),
+                self._paused_until - now,
+                0.0,
+            )
+            if wait > self._max_wait(priority):
+                raise RateLimitExceeded(f"Groq budget exhausted ({priority} priority, wait {wait:.1f}s)")
+            self.requests.take(1)
+            self.tokens.take(tokens)
+            return wait
+
+    def available_in(self, requests: int, tokens: int) -> float:
+        """
+        Seconds until `requests` requests and `tokens` tokens are available,
+        without reserving anything (for batch jobs pacing themselves).
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.requests.refill(now)
+            self.tokens.refill(now)
+            return max(
+                self.requests.wait_for(min(requests, self.requests.capacity)),
+                self.tokens.wait_for(min(tokens, self.tokens.capacity)),
+                self._paused_until - now,
+                0.0,
+            )
+
+    def acquire(self, tokens: int, priority: str = "normal") -> None:
+        wait = self.reserve(tokens, priority)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: int, priority: str = "normal") -> None:
+        wait = self.reserve(tokens, priority)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop issuing requests for `seconds` (e.g. after a 429 with retry-after).
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        logger.warning("Groq rate limit: pausing requests for %.1fs", seconds)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Sync local budgets with the provider's rate-limit headers.
+        """
+        retry_after = parse_reset(headers.get("retry-after"))
+        if retry_after:
+            self.pause(retry_after)
+
+        remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+        remaining_requests = headers.get("x-ratelimit-remaining-requests")
+        with self._lock:
+            now = time.monotonic()
+            if remaining_tokens is not None:
+                try:
+                    self.tokens.refill(now)
+                    self.tokens.tokens = min(self.tokens.tokens, float(remaining_tokens))
+                except ValueError:
+                    pass
+            if remaining_requests is not None and remaining_requests.strip() == "0":
+                reset = parse_reset(headers.get("x-ratelimit-reset-requests"))
+                if reset:
+                    self._paused_until = max(self._paused_until, now + reset)
+
+
+@lru_cache()
+def get_groq_limiter() -> RateLimiter:
+    """
+    Process-wide limiter for Groq, configured from settings.
+    """
+    from app.core.config import settings
+
+    return RateLimiter(
+        requests_per_minute=settings.GROQ_RPM,
+        tokens_per_minute=settings.GROQ_TPM,
+        max_wait_seconds=settings.GROQ_MAX_WAIT_SECONDS,
+    )
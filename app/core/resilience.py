@@ -0,0 +1,307 @@
+# app/core/resilience.py
+"""
+Resilience helpers: retries with jittered exponential backoff, deadlines and
+per-dependency circuit breakers.
+
+- retry / async_retry: decorators using "full jitter" backoff
+  (sleep = uniform(0, min(max_delay, base_delay * 2**n))).
+- deadline(seconds): context manager bounding all retries inside it; a retry
+  never sleeps past the active deadline.
+- CircuitBreaker / get_breaker(name): after `failure_threshold` consecutive
+  failures the breaker opens and calls fail fast with CircuitOpenError until
+  `reset_timeout` has passed, then a single trial call is let through.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, Optional, Tuple, Type, Union
+import asyncio
+import functools
+import logging
+import random
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_deadline: ContextVar[Optional[float]] = ContextVar("resilience_deadline", default=None)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the dependency's circuit is open."""
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when the active deadline has passed."""
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Bound all retries (and remaining_time() checks) inside the block.
+
+    Nested deadlines never extend an outer one.
+    """
+    if seconds is None:
+        yield
+        return
+    current = _deadline.get()
+    expires = time.monotonic() + seconds
+    if current is not None:
+        expires = min(expires, current)
+    token = _deadline.set(expires)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Seconds left before the active deadline, or None when no deadline is set.
+    """
+    expires = _deadline.get()
+    if expires is None:
+        return None
+    return max(expires - time.monotonic(), 0.0)
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """
+    Full-jitter exponential backoff for the given (0-based) attempt.
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def _next_sleep(attempt: int, base_delay: float, max_delay: float) -> Optional[float]:
+    """
+    Delay before the next attempt, or None if it would overrun the deadline.
+    """
+    delay = backoff_delay(attempt, base_delay, max_delay)
+    left = remaining_time()
+    if left is not None and delay >= left:
+        return None
+    return delay
+
+
+ExceptionTypes = Union[
+    Type[BaseException],
+    Tuple[Type[BaseException], ...],
+    Callable[[], Tuple[Type[BaseException], ...]],
+]
+
+
+def _exception_types(exceptions: ExceptionTypes) -> Tuple[Type[BaseException], ...]:
+    # classes are callable too, so check for them before treating it as a factory
+    if isinstance(exceptions, tuple):
+        return exceptions
+    if isinstance(exceptions, type):
+        return (exceptions,)
+    return exceptions()
+
+
+def retry(
+    attempts: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    exceptions: ExceptionTypes = (Exception,),
+):
+    """
+    Retry a sync function on the given exceptions with jittered exponential backoff.
+
+    `exceptions` is a class, a tuple, or a function returning the tuple,
+    resolved when a call fails (so an SDK's exception classes can be
+    imported lazily).
+    CircuitOpenError is never retried. Stops early when the active deadline
+    would be exceeded.
+
+    Usage:
+        @retry(attempts=3, base_delay=1)
+        def send_email(...):
+            ...
+    """
+    def decorator(func: Callable):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(attempts):
+                if remaining_time() == 0.0:
+                    raise DeadlineExceeded(f"deadline exceeded before calling {func.__qualname__}")
+                try:
+                    return func(*args, **kwargs)
+                except CircuitOpenError:
+                    raise
+                except _exception_types(exceptions) as exc:
+                    if attempt == attempts - 1:
+                        raise
+                    delay = _next_sleep(attempt, base_delay, max_delay)
+                    if delay is None:
+                        raise
+                    logger.debug("%s failed (%s); retry %d in %.2fs", func.__qualname__, exc, attempt + 1, delay)
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+
+
+def async_retry(
+    attempts: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    exceptions: ExceptionTypes = (Exception,),
+):
+    """
+    Async counterpart of retry(); sleeps with asyncio.sleep so the event loop is never blocked.
+    """
+    def decorator(func: Callable):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(attempts):
+                if remaining_time() == 0.0:
+                    raise DeadlineExceeded(f"deadline exceeded before calling {func.__qualname__}")
+                try:
+                    return await func(*args, **kwargs)
+                except CircuitOpenError:
+                    raise
+                except _exception_types(exceptions) as exc:
+                    if attempt == attempts - 1:
+                        raise
+                    delay = _next_sleep(attempt, base_delay, max_delay)
+                    if delay is None:
+                        raise
+                    logger.debug("%s failed (%s); retry %d in %.2fs", func.__qualname__, exc, attempt + 1, delay)
+                    await asyncio.sleep(delay)
+        return wrapper
+    return decorator
+
+
+class CircuitBreaker:
+    """
+    Thread-safe consecutive-failure circuit breaker (closed -> open -> half_open).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        failure_exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+        ignored_exceptions: Tuple[Type[BaseException], ...] = (),
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_exceptions = failure_exceptions
+        # raised before the dependency was called (e.g. a local rate-limit shed); count neither way
+        self.ignored_exceptions = ignored_exceptions
+        self._lock = threading.Lock()
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == "open" and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return "half_open"
+            return self._state
+
+    def allow(self) -> bool:
+        """
+        Return True if a call may proceed. In half-open state only one trial call is allowed.
+        """
+        with self._lock:
+            if self._state == "closed":
+                return True
+            if self._state == "open":
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = "half_open"
+                self._trial_in_flight = False
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != "closed":
+                logger.info("Circuit '%s' closed", self.name)
+            self._state = "closed"
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == "half_open" or self._failures >= self.failure_threshold:
+                if self._state != "open":
+                    logger.warning("Circuit '%s' opened after %d failures", self.name, self._failures)
+                self._state = "open"
+                self._opened_at = time.monotonic()
+
+    def check(self) -> None:
+        """
+        Raise CircuitOpenError if the circuit rejects calls right now.
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"circuit '{self.name}' is open")
+
+    def __enter__(self) -> "CircuitBreaker":
+        self.check()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self.record_success()
+        elif issubclass(exc_type, self.failure_exceptions) and not issubclass(exc_type, self.ignored_exceptions):
+            self.record_failure()
+        else:
+            # not a dependency failure (e.g. a validation error); release a half-open trial
+            with self._lock:
+                self._trial_in_flight = False
+        return False
+
+    def call(self, func: Callable, *args, **kwargs):
+        with self:
+            return func(*args, **kwargs)
+
+    def snapshot(self) -> Dict[str, object]:
+        return {"name": self.name, "state": self.state, "failures": self._failures}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(
+    name: str,
+    failure_exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+    ignored_exceptions: Tuple[Type[BaseException], ...] = (),
+) -> CircuitBreaker:
+    """
+    Return the process-wide breaker for a dependency (e.g. "groq", "smtp",
+    "mongo", "feed:<host>"), creating it with the configured thresholds.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            from app.core.config import settings
+
+            breaker = CircuitBreaker(
+                name,
+                failure_threshold=settings.BREAKER_FAILURE_THRESHOLD,
+                reset_timeout=settings.BREAKER_RESET_SECONDS,
+                failure_exceptions=failure_exceptions,
+                ignored_exceptions=ignored_exceptions,
+            )
+            _breakers[name] = breaker
+        return breaker
+
+
+def breaker_states() -> Dict[str, Dict[str, object]]:
+    """
+    Snapshot of all breakers created in this process.
+    """
+    with _breakers_lock:
+        return {name: b.snapshot() for name, b in _breakers.items()}
@@ -1,11 +1,14 @@
 # app/core/retry.py
 """
 Reusable retry decorator for transient failures.
+
+Kept for backward compatibility; see app.core.resilience for the async
+variant, deadlines and circuit breakers.
 """
 
-import time
-import functools
-from typing import Callable, Type
+from typing import Type
+
+from app.core import resilience
 
 
 def retry(
@@ -18,7 +21,7 @@ def retry(
 
     Args:
         attempts: Number of retry attempts.
-        delay: Seconds to wait between attempts.
+        delay: Base delay in seconds; backoff doubles per attempt with full jitter.
         exceptions: Tuple of exception types to retry.
 
     Usage:
@@ -26,16 +29,4 @@ def retry(
         def send_email(...):
             ...
     """
-    def decorator(func: Callable):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            last_exc = None
-            for _ in range(attempts):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as exc:
-                    last_exc = exc
-                    time.sleep(delay)
-            raise last_exc
-        return wrapper
-    return decorator
+    return resilience.retry(attempts=attempts, base_delay=delay, exceptions=exceptions)
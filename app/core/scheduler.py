@@ -4,10 +4,12 @@ Pluggable scheduler for News Alert System.
 """
 
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, Optional
 from threading import Thread, Event
 import logging
 
+from app.core.leader import LeaderLease
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,18 +27,26 @@ class BackgroundThreadScheduler(SchedulerInterface):
     """
     Thread-based scheduler using Event.wait(),
     allowing instant shutdown instead of waiting for sleep().
+
+    When a LeaderLease is supplied, a heartbeat thread keeps the lease renewed
+    and the task only runs while this process is the leader.
     """
 
-    def __init__(self, task: Callable, interval_seconds: int = 30):
+    def __init__(self, task: Callable, interval_seconds: int = 30, lease: Optional[LeaderLease] = None):
         self.task = task
         self.interval_seconds = interval_seconds
+        self.lease = lease
         self._thread: Thread | None = None
+        self._heartbeat: Thread | None = None
         self._stop_event = Event()
 
     def _loop(self):
         logger.info("BackgroundThreadScheduler started (interval=%s s)", self.interval_seconds)
 
         while not self._stop_event.wait(self.interval_seconds): 
+            if self.lease is not None and not self.lease.is_leader:
+                logger.debug("Not the leader; skipping periodic task")
+                continue
             try:
                 self.task()
             except Exception:
@@ -44,11 +54,20 @@ class BackgroundThreadScheduler(SchedulerInterface):
 
         logger.info("BackgroundThreadScheduler stopped")
 
+    def _heartbeat_loop(self):
+        self.lease.acquire()
+        while not self._stop_event.wait(self.lease.renew_interval):
+            self.lease.acquire()
+        self.lease.release()
+
     def start(self) -> None:
         if self._thread is not None:
             return
 
         self._stop_event.clear()
+        if self.lease is not None:
+            self._heartbeat = Thread(target=self._heartbeat_loop, daemon=True)
+            self._heartbeat.start()
         self._thread = Thread(target=self._loop, daemon=True)
         self._thread.start()
 
@@ -58,16 +77,43 @@ class BackgroundThreadScheduler(SchedulerInterface):
         if self._thread:
             self._thread.join(timeout=3)
             self._thread = None
+        if self._heartbeat:
+            self._heartbeat.join(timeout=3)
+            self._heartbeat = None
 
 
 class NuvomScheduler(SchedulerInterface):
-    """Placeholder for future Nuvom integration."""
+    """
+    Queue-based scheduler.
+
+    Instead of running the whole cycle in one thread, the (leader) process
+    enqueues one fetch job per feed every interval; fetch, classify and alert
+    jobs are then executed by a pool of worker processes (see app.core.queue_worker).
+    Set concurrency=0 to only produce jobs and run workers elsewhere (`uv run worker`).
+    """
+
+    def __init__(self, interval_seconds: int = 30, lease: Optional[LeaderLease] = None, concurrency: int = 0):
+        from app.core.queue_worker import WorkerPool
+        from app.services.jobs import enqueue_fetch_jobs
+
+        self._producer = BackgroundThreadScheduler(
+            task=enqueue_fetch_jobs,
+            interval_seconds=interval_seconds,
+            lease=lease,
+        )
+        self._pool = WorkerPool(concurrency) if concurrency > 0 else None
 
     def start(self) -> None:
-        logger.info("NuvomScheduler start called (not implemented)")
+        logger.info("NuvomScheduler starting (workers=%s)", self._pool.concurrency if self._pool else 0)
+        if self._pool:
+            self._pool.start()
+        self._producer.start()
 
     def stop(self) -> None:
-        logger.info("NuvomScheduler stop called (not implemented)")
+        self._producer.stop()
+        if self._pool:
+            self._pool.stop()
+        logger.info("NuvomScheduler stopped")
 
 
 class NoOpScheduler(SchedulerInterface):
@@ -80,13 +126,19 @@ class NoOpScheduler(SchedulerInterface):
         logger.info("NoOpScheduler: stop called - nothing to do")
 
 
-def create_scheduler(task: Callable, mode: str = "background", interval_seconds: int = 30) -> SchedulerInterface:
+def create_scheduler(
+    task: Callable,
+    mode: str = "background",
+    interval_seconds: int = 30,
+    lease: Optional[LeaderLease] = None,
+    concurrency: int = 0,
+) -> SchedulerInterface:
     mode = mode.lower()
 
     if mode == "background":
-        return BackgroundThreadScheduler(task=task, interval_seconds=interval_seconds)
+        return BackgroundThreadScheduler(task=task, interval_seconds=interval_seconds, lease=lease)
 
     if mode == "nuvom":
-        return NuvomScheduler()
+        return NuvomScheduler(interval_seconds=interval_seconds, lease=lease, concurrency=concurrency)
 
     return NoOpScheduler()
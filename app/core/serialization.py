@@ -0,0 +1,31 @@
+# app/core/serialization.py
+"""
+JSON serialization helpers shared by API responses and exports.
+
+Uses orjson when installed (native datetime support, several times faster
+than the stdlib); otherwise falls back to compact stdlib json.
+"""
+
+from datetime import date, datetime
+from typing import Any
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # stdlib fallback below
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON bytes (datetimes as ISO 8601, ObjectIds as strings).
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
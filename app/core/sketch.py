@@ -0,0 +1,94 @@
+# app/core/sketch.py
+"""
+Fixed-memory streaming counters.
+
+- CountMinSketch: approximate counts for an unbounded set of keys in
+  depth x width integers; estimates never undercount and overcount by at
+  most ~e/width of the total with probability 1 - e^-depth.
+- TopK: the heaviest keys seen, capped at `capacity` entries (min-heap with
+  lazy deletion), used to remember which keys are worth asking the sketch about.
+
+Neither is thread-safe on its own; callers hold a lock.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+import heapq
+import zlib
+
+import numpy as np
+
+
+class CountMinSketch:
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int32)
+        self._rows = np.arange(depth)
+
+    def _columns(self, key: str) -> np.ndarray:
+        data = key.encode("utf-8")
+        # one crc32 per row, each seeded with the row number
+        return np.fromiter((zlib.crc32(data, row) % self.width for row in range(self.depth)), dtype=np.int64, count=self.depth)
+
+    def add(self, key: str, count: int = 1) -> int:
+        """
+        Count `key` and return its new estimate.
+        """
+        cols = self._columns(key)
+        self.table[self._rows, cols] += count
+        return int(self.table[self._rows, cols].min())
+
+    def estimate(self, key: str) -> int:
+        return int(self.table[self._rows, self._columns(key)].min())
+
+    def clear(self) -> None:
+        self.table.fill(0)
+
+    @staticmethod
+    def estimate_sum(sketches: Iterable["CountMinSketch"], key: str) -> int:
+        """
+        Estimate of `key` over several sketches of the same shape (e.g. time buckets).
+        """
+        sketches = list(sketches)
+        if not sketches:
+            return 0
+        cols = sketches[0]._columns(key)
+        rows = sketches[0]._rows
+        return int(sum(s.table[rows, cols] for s in sketches).min())
+
+
+class TopK:
+
+    def __init__(self, capacity: int = 50):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []
+
+    def update(self, key: str, count: int) -> None:
+        """
+        Offer `key` with its current (estimated) count.
+        """
+        if key not in self.counts and len(self.counts) >= self.capacity:
+            if count <= self._min():
+                return
+            _, evicted = heapq.heappop(self._heap)
+            del self.counts[evicted]
+        self.counts[key] = count
+        heapq.heappush(self._heap, (count, key))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, k) for k, c in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _min(self) -> int:
+        # drop stale heap entries (superseded by a later update of the same key)
+        while self._heap and self.counts.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else 0
+
+    def items(self) -> List[Tuple[str, int]]:
+        return sorted(self.counts.items(), key=lambda kv: kv[1], reverse=True)
+
+    def clear(self) -> None:
+        self.counts.clear()
+        self._heap.clear()
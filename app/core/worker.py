@@ -2,12 +2,14 @@
 """
 Periodic worker for News Alert System.
 """
+from typing import List, Optional
 import logging
 
-from app.core.logging import configure_logging
+from app.core.config import settings
 from app.services.classifier import ClassifierService
 from app.services.news_fetcher import fetch_and_process
-configure_logging()
+from app.services.retention import apply_retention, retention_due
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,15 +19,37 @@ class PeriodicWorker:
     for maintainability & testability.
     """
 
-    def __init__(self, classifier: ClassifierService):
+    def __init__(self, classifier: ClassifierService, feeds: Optional[List[str]] = None):
         self.classifier = classifier
+        self.feeds = feeds  # None = all configured feeds
 
     def run(self):
         try:
-            new_items = fetch_and_process(self.classifier)
+            new_items = fetch_and_process(self.classifier, urls=self.feeds)
 
             if new_items:
                 logger.info("Periodic fetch produced %d new items", len(new_items))
 
         except Exception:
-            logger.exception("Periodic task failed")
\ No newline at end of file
+            logger.exception("Periodic task failed")
+
+        try:
+            if retention_due():
+                apply_retention()
+        except Exception:
+            logger.exception("Retention run failed")
+
+    def run_priority(self):
+        """
+        Fast-lane cycle: poll only the priority feeds (PRIORITY_SOURCES URLs).
+        Bypasses the ingestion log, whose only writer is the main cycle
+        (this cycle holds its own lease and may run in another process).
+        """
+        try:
+            new_items = fetch_and_process(self.classifier, urls=settings.priority_feed_list, use_log=False)
+
+            if new_items:
+                logger.info("Priority fetch produced %d new items", len(new_items))
+
+        except Exception:
+            logger.exception("Priority task failed")
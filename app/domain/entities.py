@@ -6,7 +6,7 @@ Pydantic models are used for validation and convenient serialization.
 """
 
 from pydantic import BaseModel, HttpUrl
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -31,6 +31,22 @@ class NewsItem(BaseModel):
     published_at: Optional[datetime] = None
     source: Optional[str] = None
     category: str = "uncategorized"
+    # multi-label scores (category -> confidence in [0, 1]); category is the top one
+    scores: Dict[str, float] = {}
+
+
+class IncomingNewsItem(BaseModel):
+    """
+    A news item pushed by an external source (bulk ingest). `id` is generated
+    when omitted; `category` is filled in by the classifier when omitted.
+    """
+    id: Optional[str] = None
+    title: str
+    link: HttpUrl
+    summary: Optional[str] = None
+    published_at: Optional[datetime] = None
+    source: Optional[str] = None
+    category: Optional[str] = None
 
 
 class Alert(BaseModel):
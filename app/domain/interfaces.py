@@ -5,7 +5,8 @@ Interfaces (abstract contracts) for pluggable infrastructure.
 Keep concrete implementations behind these interfaces to preserve inversion of control.
 """
 
-from typing import List
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
 from abc import ABC, abstractmethod
 from app.domain.entities import NewsItem
 from app.core.config import Settings
@@ -36,6 +37,12 @@ class ClassifierInterface(ABC):
         """
         raise NotImplementedError
 
+    def classify_batch(self, texts: Sequence[str], settings: Settings) -> List[str]:
+        """
+        Classify many texts at once. Backends that can vectorize should override this.
+        """
+        return [self.classify(text, settings) for text in texts]
+
 
 class EmailerInterface(ABC):
     """
@@ -43,8 +50,61 @@ class EmailerInterface(ABC):
     """
 
     @abstractmethod
-    def send(self, to: str, subject: str, body: str) -> None:
+    def send(self, to: str, subject: str, body: str, html: Optional[str] = None) -> None:
+        """
+        Send a message, with an HTML alternative when given (raises on failure).
+        """
+        raise NotImplementedError
+
+
+class NewsRepository(ABC):
+    """
+    Async read access to stored news items (plain dicts, ready to serialize).
+    """
+
+    @abstractmethod
+    async def list_news(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        category: Optional[str] = None,
+        min_score: Optional[float] = None,
+        since: Optional[datetime] = None,
+        since_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Newest first by published_at; with `since`, items stored after the
+        (since, since_id) cursor in storage order.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_news(self, news_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+
+class AlertRepository(ABC):
+    """
+    Async read access to alert history.
+    """
+
+    @abstractmethod
+    async def list_alerts(self, limit: int = 100, offset: int = 0, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_alert(self, alert_id: str) -> Optional[Dict[str, Any]]:
         """
-        Send a message (raises on failure).
+        One alert including its body, or None.
         """
         raise NotImplementedError
+
+
+class StatsRepository(ABC):
+    """
+    Async read access to the materialized dashboard aggregates.
+    """
+
+    @abstractmethod
+    async def get_stats(self, hours: int = 48) -> Dict[str, Any]:
+        raise NotImplementedError
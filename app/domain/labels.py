@@ -0,0 +1,71 @@
+# app/domain/labels.py
+"""
+Compact multi-label encoding.
+
+A classification is a dict of category -> score in [0, 1]. For storage it is
+encoded as:
+
+- category_mask: int bitmask, bit i set when topics[i] scores >= threshold
+  (queryable with $bitsAllSet / $bitsAnySet)
+- scores: dict of category -> score quantized to 0..255 (one byte of
+  precision per label), queryable as {"scores.<category>": {"$gt": q}}
+
+Bit positions follow the order of TOPICS, so keep new topics appended at the
+end (or re-run the backfill after reordering).
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+QUANT_MAX = 255
+
+
+def quantize(score: float) -> int:
+    return int(round(min(max(score, 0.0), 1.0) * QUANT_MAX))
+
+
+def dequantize(value: int) -> float:
+    return value / QUANT_MAX
+
+
+def primary_label(scores: Dict[str, float], default: str = "uncategorized") -> str:
+    """
+    Highest-scoring label (ties broken alphabetically), or `default` if there are no scores.
+    """
+    if not scores:
+        return default
+    return max(sorted(scores), key=lambda label: scores[label])
+
+
+def topic_bit(topic: str, topics: Sequence[str]) -> Optional[int]:
+    try:
+        return 1 << list(topics).index(topic)
+    except ValueError:
+        return None
+
+
+def encode_scores(
+    scores: Dict[str, float], topics: Sequence[str], threshold: float = 0.5
+) -> Tuple[int, Dict[str, int]]:
+    """
+    Encode a score dict as (category_mask, quantized scores). Zero scores are dropped.
+    """
+    mask = 0
+    quantized: Dict[str, int] = {}
+    for label, score in scores.items():
+        q = quantize(score)
+        if q == 0:
+            continue
+        quantized[label] = q
+        if score >= threshold:
+            bit = topic_bit(label, topics)
+            if bit is not None:
+                mask |= bit
+    return mask, quantized
+
+
+def decode_scores(quantized: Optional[Dict[str, int]]) -> Dict[str, float]:
+    return {label: dequantize(q) for label, q in (quantized or {}).items()}
+
+
+def mask_labels(mask: int, topics: Sequence[str]) -> List[str]:
+    return [topic for i, topic in enumerate(topics) if mask & (1 << i)]
@@ -0,0 +1,103 @@
+# app/domain/records.py
+"""
+Lightweight record type for the ingestion pipeline.
+
+NewsItem (Pydantic) validates every field on construction, which is the
+right trade-off at the API boundary but pure overhead inside fetch ->
+classify -> store, where the data comes from our own parsers. NewsRecord is a
+slotted dataclass with the same fields: no validation, no per-instance
+__dict__, and cheap attribute access. Convert with to_entity() /
+from_entity() where a validated NewsItem is actually needed.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from app.domain.entities import NewsItem
+
+
+def clean_link(link: Optional[str]) -> Optional[str]:
+    """
+    Keep only absolute http(s) links (the cheap part of HttpUrl validation).
+    """
+    if not link:
+        return None
+    link = str(link).strip()
+    return link if link.startswith(("http://", "https://")) else None
+
+
+@dataclass(slots=True)
+class NewsRecord:
+    id: str
+    title: str
+    link: Optional[str] = None
+    summary: Optional[str] = None
+    published_at: Optional[datetime] = None
+    source: Optional[str] = None
+    category: str = "uncategorized"
+    # multi-label scores (category -> confidence in [0, 1]); category is the top one
+    scores: Dict[str, float] = field(default_factory=dict)
+    # "high" routes the item through the priority fast lane (app.services.priority)
+    priority: str = "normal"
+    fetched_at: Optional[float] = None  # epoch seconds when the feed was parsed
+
+    def to_payload(self) -> Dict[str, Any]:
+        """
+        JSON-safe dict (job payloads).
+        """
+        return {
+            "id": self.id,
+            "title": self.title,
+            "link": self.link,
+            "summary": self.summary,
+            "published_at": self.published_at.isoformat() if self.published_at else None,
+            "source": self.source,
+            "category": self.category,
+            "scores": self.scores,
+            "priority": self.priority,
+            "fetched_at": self.fetched_at,
+        }
+
+    @classmethod
+    def from_payload(cls, raw: Dict[str, Any]) -> "NewsRecord":
+        published_at = raw.get("published_at")
+        if isinstance(published_at, str):
+            published_at = datetime.fromisoformat(published_at)
+        return cls(
+            id=raw["id"],
+            title=raw.get("title", ""),
+            link=raw.get("link"),
+            summary=raw.get("summary"),
+            published_at=published_at,
+            source=raw.get("source"),
+            category=raw.get("category") or "uncategorized",
+            scores=dict(raw.get("scores") or {}),
+            priority=raw.get("priority") or "normal",
+            fetched_at=raw.get("fetched_at"),
+        )
+
+    def to_entity(self) -> NewsItem:
+        return NewsItem(
+            id=self.id,
+            title=self.title,
+            link=self.link,
+            summary=self.summary,
+            published_at=self.published_at,
+            source=self.source,
+            category=self.category,
+            scores=self.scores,
+        )
+
+    @classmethod
+    def from_entity(cls, item: NewsItem) -> "NewsRecord":
+        return cls(
+            id=item.id,
+            title=item.title,
+            link=str(item.link) if item.link else None,
+            summary=item.summary,
+            published_at=item.published_at,
+            source=item.source,
+            category=item.category,
+            scores=dict(item.scores),
+        )
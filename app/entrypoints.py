@@ -4,7 +4,6 @@ Entrypoint functions for UV/Hatch console scripts.
 Each function simply forwards to the real command.
 """
 
-import uvicorn
 import subprocess
 import sys
 from pathlib import Path
@@ -12,11 +11,15 @@ from pathlib import Path
 
 def start_api():
     """Start the FastAPI server (production mode)."""
+    import uvicorn
+
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=False)
 
 
 def dev_api():
     """Start the FastAPI dev server with reload."""
+    import uvicorn
+
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
 
 
@@ -30,3 +33,116 @@ def run_scheduler():
     """Run standalone scheduler script."""
     script = Path(__file__).resolve().parents[1] / "scripts" / "run_scheduler.py"
     subprocess.run([sys.executable, str(script)])
+
+
+def run_worker():
+    """Run a pool of queue worker processes (SCHEDULER_MODE=nuvom)."""
+    from app.core.config import settings
+    from app.core.logging import configure_logging
+    from app.core.queue_worker import WorkerPool
+
+    configure_logging()
+    pool = WorkerPool(settings.QUEUE_CONCURRENCY or 1)
+    pool.start()
+    try:
+        pool.join()
+    except KeyboardInterrupt:
+        pool.stop()
+
+
+def train_classifier():
+    """Train the local classifier from labeled news stored in MongoDB."""
+    from app.core.config import settings
+    from app.core.db import init_db
+    from app.core.logging import configure_logging
+    from app.services.training import train_local_classifier
+
+    configure_logging()
+    init_db()
+    train_local_classifier(settings.LOCAL_MODEL_PATH)
+
+
+def tune_cascade():
+    """Recommend CASCADE_THRESHOLD from a holdout set of labeled news."""
+    from app.core.config import settings
+    from app.core.db import init_db
+    from app.core.logging import configure_logging
+    from app.services.training import tune_cascade_threshold
+
+    configure_logging()
+    init_db()
+    tune_cascade_threshold(settings.LOCAL_MODEL_PATH, settings.CASCADE_TARGET_PRECISION)
+
+
+def run_retention():
+    """Apply retention once (TTL indexes / archive expired documents)."""
+    from app.core.db import init_db
+    from app.core.logging import configure_logging
+    from app.services.retention import apply_retention
+
+    configure_logging()
+    init_db()
+    print(apply_retention())
+
+
+def rebuild_stats():
+    """Recompute the dashboard aggregates from the news collection."""
+    from app.core.db import init_db
+    from app.core.logging import configure_logging
+    from app.services.aggregates import rebuild_aggregates
+
+    configure_logging()
+    init_db()
+    print(rebuild_aggregates())
+
+
+def replay_log():
+    """Re-classify a time range of the ingestion log and update stored items."""
+    import argparse
+    from datetime import datetime
+
+    from app.core.config import settings
+    from app.core.db import init_db
+    from app.core.logging import configure_logging
+    from app.services.classifier import build_classifier
+    from app.services.ingest_replay import replay_range
+
+    parser = argparse.ArgumentParser(prog="replay-log", description=replay_log.__doc__)
+    parser.add_argument("--since", type=datetime.fromisoformat, help="fetch time >= since (ISO 8601, UTC if naive)")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="fetch time < until")
+    parser.add_argument("--dry-run", action="store_true", help="classify only; report labels without updating")
+    args = parser.parse_args()
+
+    configure_logging()
+    init_db()
+    print(replay_range(build_classifier(settings), since=args.since, until=args.until, dry_run=args.dry_run))
+
+
+def backfill():
+    """Reclassify all stored news with the configured classifier (resumable)."""
+    import argparse
+
+    from app.core.config import settings
+    from app.core.db import init_db
+    from app.core.logging import configure_logging
+    from app.services.backfill import run_backfill
+    from app.services.classifier import build_classifier
+
+    parser = argparse.ArgumentParser(prog="backfill", description=backfill.__doc__)
+    parser.add_argument("--run", default="reclassify", help="run name; re-running the same name resumes it")
+    parser.add_argument("--workers", type=int, default=4, help="parallel _id ranges")
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--restart", action="store_true", help="discard the run's checkpoints and start over")
+    parser.add_argument("--dry-run", action="store_true", help="classify without writing results")
+    args = parser.parse_args()
+
+    configure_logging()
+    init_db()
+    print(run_backfill(
+        build_classifier(settings),
+        run_id=args.run,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        restart=args.restart,
+        dry_run=args.dry_run,
+    ))
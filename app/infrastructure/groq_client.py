@@ -2,55 +2,218 @@
 """
 Groq client adapter.
 Minimal wrapper around Groq API for text classification.
+
+The groq SDK is imported on the first request, not at import time: it is one
+of the slowest imports of the app and many processes (CLI jobs, workers with
+the local backend) never call Groq.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import json
 import logging
 from app.core.config import Settings
-try:
-    from groq import Groq
-except ImportError:
-    Groq = None  # Allows app to start even if SDK is missing
+from app.domain.labels import primary_label
+from app.core.resilience import CircuitOpenError, async_retry, get_breaker, retry
+from app.core.ratelimit import RateLimiter, RateLimitExceeded, estimate_tokens, get_groq_limiter
 
 logger = logging.getLogger(__name__)
 
+MAX_COMPLETION_TOKENS = 150
+
+
+@lru_cache()
+def _groq_sdk():
+    """
+    The groq module, or None if the SDK is not installed (the app still starts).
+    """
+    try:
+        import groq
+    except ImportError:
+        return None
+    return groq
+
+
+def transient_groq_errors() -> Tuple[type, ...]:
+    sdk = _groq_sdk()
+    if sdk is None:
+        return ()
+    return (sdk.RateLimitError, sdk.APIConnectionError, sdk.APITimeoutError, sdk.InternalServerError)
+
+
+def _is_rate_limit(exc: Exception) -> bool:
+    sdk = _groq_sdk()
+    return sdk is not None and isinstance(exc, sdk.RateLimitError)
+
+
+def parse_scores(content: Optional[str]) -> Dict[str, float]:
+    """
+    Parse the model's JSON answer into category -> score. A bare label
+    (older prompt / non-JSON answer) counts as that label with score 1.0.
+    """
+    content = (content or "").strip()
+    if not content:
+        return {}
+    try:
+        data = json.loads(content)
+    except ValueError:
+        label = content.strip("\"' .").lower()
+        return {} if label in ("", "uncategorized") else {label: 1.0}
+
+    scores: Dict[str, float] = {}
+    if isinstance(data, dict):
+        for label, score in data.items():
+            try:
+                value = float(score)
+            except (TypeError, ValueError):
+                continue
+            label = str(label).strip().lower()
+            if label and label != "uncategorized" and value > 0:
+                scores[label] = min(value, 1.0)
+    return scores
+
 
 class GroqClient:
     """Minimal Groq client wrapper for classification."""
 
-    def __init__(self, api_key: Optional[str]):
+    def __init__(self, api_key: Optional[str], rate_limiter: Optional[RateLimiter] = None):
         self.api_key = api_key
-        if api_key and Groq is None:
+        self.rate_limiter = rate_limiter or get_groq_limiter()
+        if api_key and find_spec("groq") is None:
             logger.warning(
                 "Groq SDK not installed but GROQ_API_KEY provided. "
                 "Install the SDK to enable classification."
             )
-        self.client = Groq(api_key=api_key) if api_key and Groq else None
+        self._client = None
+        # one AsyncGroq per running event loop (threads may classify concurrently)
+        self._async_clients: Dict[asyncio.AbstractEventLoop, Any] = {}
+
+    @property
+    def client(self):
+        """
+        Sync Groq client, created on first use; None without an API key or SDK.
+        """
+        if self._client is None and self.api_key:
+            sdk = _groq_sdk()
+            if sdk is not None:
+                self._client = sdk.Groq(api_key=self.api_key)
+        return self._client
+
+    def classify(self, text: str, settings: Settings, priority: str = "normal") -> str:
+        """
+        Classify free-form text using Groq LLM; returns the highest-scoring category.
+
+        Raises on failure (CircuitOpenError while Groq is failing,
+        RateLimitExceeded when the request budget is exhausted for this
+        priority) so callers can fall back to another classifier.
+        """
+        return primary_label(self.classify_scores(text, settings, priority))
 
-    def classify(self, text: str, settings: Settings) -> str:
-        """Classify free-form text using Groq LLM."""
+    def classify_scores(self, text: str, settings: Settings, priority: str = "normal") -> Dict[str, float]:
+        """
+        Multi-label classification: category -> confidence in [0, 1].
+        """
         if not self.api_key or self.client is None:
-            logger.warning("GroqClient not properly configured, returning 'uncategorized'")
-            return "uncategorized"
+            logger.warning("GroqClient not properly configured, returning no scores")
+            return {}
 
         try:
-            response = self.client.chat.completions.create(
-                model=settings.GROQ_MODEL,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            f"You are a classification engine. Classify text into: {settings.TOPICS}. "
-                            "Respond only with one category or 'uncategorized'."
-                        ),
-                    },
-                    {"role": "user", "content": text},
-                ],
-                temperature=0.0,
-                max_tokens=50,
-            )
-            category = response.choices[0].message.content.strip()
-            return category or "uncategorized"
+            # a shed (RateLimitExceeded) never reached Groq; it must not open the circuit
+            with get_breaker("groq", ignored_exceptions=(RateLimitExceeded,)):
+                response = self._complete(text, settings, priority)
+            return parse_scores(response.choices[0].message.content)
+        except (CircuitOpenError, RateLimitExceeded) as exc:
+            logger.debug("Skipping LLM classification: %s", exc)
+            raise
+        except Exception:
+            logger.exception("Groq classification request failed")
+            raise
+
+    async def aclassify(self, text: str, settings: Settings, priority: str = "normal") -> str:
+        """
+        Async variant of classify() using the AsyncGroq client; same failure semantics.
+        """
+        return primary_label(await self.aclassify_scores(text, settings, priority))
+
+    async def aclassify_scores(self, text: str, settings: Settings, priority: str = "normal") -> Dict[str, float]:
+        if not self.api_key or _groq_sdk() is None:
+            logger.warning("GroqClient not properly configured, returning no scores")
+            return {}
+
+        try:
+            # a shed (RateLimitExceeded) never reached Groq; it must not open the circuit
+            with get_breaker("groq", ignored_exceptions=(RateLimitExceeded,)):
+                response = await self._acomplete(text, settings, priority)
+            return parse_scores(response.choices[0].message.content)
+        except (CircuitOpenError, RateLimitExceeded) as exc:
+            logger.debug("Skipping LLM classification: %s", exc)
+            raise
         except Exception:
             logger.exception("Groq classification request failed")
-            return "uncategorized"
+            raise
+
+    def _get_async_client(self):
+        # httpx async connections are bound to the loop that opened them, and
+        # classify_many() runs a fresh loop per batch; aclose() releases it
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = _groq_sdk().AsyncGroq(api_key=self.api_key)
+        return client
+
+    async def aclose(self) -> None:
+        """
+        Close the async client of the running loop (its connection pool);
+        call before the loop ends.
+        """
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+    @async_retry(attempts=2, base_delay=0.5, max_delay=2.0, exceptions=transient_groq_errors)
+    async def _acomplete(self, text: str, settings: Settings, priority: str = "normal"):
+        await self.rate_limiter.acquire_async(estimate_tokens(text, completion_tokens=MAX_COMPLETION_TOKENS), priority)
+        try:
+            raw = await self._get_async_client().chat.completions.with_raw_response.create(**self._request(text, settings))
+        except Exception as exc:
+            if _is_rate_limit(exc):
+                self.rate_limiter.update_from_headers(exc.response.headers)
+            raise
+        self.rate_limiter.update_from_headers(raw.headers)
+        return raw.parse()
+
+    @retry(attempts=2, base_delay=0.5, max_delay=2.0, exceptions=transient_groq_errors)
+    def _complete(self, text: str, settings: Settings, priority: str = "normal"):
+        # budget is charged per attempt, so a retry after a 429 waits for the window to reset
+        self.rate_limiter.acquire(estimate_tokens(text, completion_tokens=MAX_COMPLETION_TOKENS), priority)
+        try:
+            raw = self.client.chat.completions.with_raw_response.create(**self._request(text, settings))
+        except Exception as exc:
+            if _is_rate_limit(exc):
+                self.rate_limiter.update_from_headers(exc.response.headers)
+            raise
+        self.rate_limiter.update_from_headers(raw.headers)
+        return raw.parse()
+
+    def _request(self, text: str, settings: Settings) -> dict:
+        return dict(
+            model=settings.GROQ_MODEL,
+            messages=[
+                {
+                    "role": "system",
+                    "content": (
+                        f"You are a classification engine. Categories: {settings.TOPICS}. "
+                        "Respond only with a JSON object mapping every category that applies "
+                        "to a confidence between 0 and 1, e.g. {\"tech\": 0.9, \"business\": 0.4}. "
+                        "Respond with {} if none apply."
+                    ),
+                },
+                {"role": "user", "content": text},
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.0,
+            max_tokens=MAX_COMPLETION_TOKENS,
+            timeout=settings.CLASSIFY_TIMEOUT_SECONDS,
+        )
@@ -0,0 +1,185 @@
+# app/infrastructure/local_classifier.py
+"""
+Local, CPU-only text classifier.
+
+Hashed TF-IDF features (unigrams + bigrams hashed into a fixed number of
+columns, so no vocabulary has to be stored) and one L2-normalised centroid per
+category. A batch of articles is scored with a single matrix multiply:
+
+    scores = X (n_docs x n_features) @ C.T (n_features x n_categories)
+
+Model files are small .npz archives produced by `uv run train-classifier`.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+import re
+import zlib
+
+import numpy as np
+
+from app.core.config import Settings
+from app.domain.interfaces import ClassifierInterface
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+@lru_cache(maxsize=200_000)
+def _hash(term: str, n_features: int) -> int:
+    return zlib.crc32(term.encode("utf-8")) % n_features
+
+
+def _features(text: str, n_features: int) -> List[int]:
+    tokens = _TOKEN.findall(text.lower())
+    terms = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    return [_hash(t, n_features) for t in terms]
+
+
+class HashingTfidf:
+    """
+    Stateless hashing vectorizer with a learned IDF vector.
+    """
+
+    def __init__(self, n_features: int = 2 ** 14, idf: np.ndarray = None):
+        self.n_features = n_features
+        self.idf = idf if idf is not None else np.ones(n_features, dtype=np.float32)
+
+    def _counts(self, texts: Sequence[str]) -> np.ndarray:
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, text in enumerate(texts):
+            cols_for_text = _features(text, self.n_features)
+            cols.extend(cols_for_text)
+            rows.extend([row] * len(cols_for_text))
+        flat = np.asarray(rows, dtype=np.int64) * self.n_features + np.asarray(cols, dtype=np.int64)
+        counts = np.bincount(flat, minlength=len(texts) * self.n_features)
+        return counts.reshape(len(texts), self.n_features).astype(np.float32)
+
+    def fit(self, texts: Sequence[str]) -> "HashingTfidf":
+        # document frequencies straight from each text's distinct columns; no dense matrix
+        df = np.zeros(self.n_features, dtype=np.int64)
+        for text in texts:
+            df[np.unique(_features(text, self.n_features))] += 1
+        n = len(texts)
+        self.idf = (np.log((1 + n) / (1 + df)) + 1).astype(np.float32)
+        return self
+
+    def transform(self, texts: Sequence[str]) -> np.ndarray:
+        X = self._counts(texts)
+        np.log1p(X, out=X)  # sublinear tf
+        X *= self.idf
+        norms = np.linalg.norm(X, axis=1, keepdims=True)
+        np.divide(X, norms, out=X, where=norms > 0)
+        return X
+
+
+class LocalClassifier(ClassifierInterface):
+    """
+    Nearest-centroid classifier over hashed TF-IDF features.
+    """
+
+    batch_size = 512
+
+    def __init__(self, labels: Sequence[str], centroids: np.ndarray, vectorizer: HashingTfidf, temperature: float = 10.0):
+        self.labels = list(labels)
+        self.centroids = centroids.astype(np.float32)
+        self.vectorizer = vectorizer
+        self.temperature = temperature
+
+    @classmethod
+    def fit(cls, texts: Sequence[str], labels: Sequence[str], n_features: int = 2 ** 14) -> "LocalClassifier":
+        vectorizer = HashingTfidf(n_features).fit(texts)
+        classes = sorted(set(labels))
+        index = {label: i for i, label in enumerate(classes)}
+        y = np.asarray([index[label] for label in labels], dtype=np.int64)
+        centroids = np.zeros((len(classes), n_features), dtype=np.float32)
+        # same chunking as scores(): only batch_size dense rows at a time
+        for start in range(0, len(texts), cls.batch_size):
+            X = vectorizer.transform(texts[start:start + cls.batch_size])
+            np.add.at(centroids, y[start:start + cls.batch_size], X)
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        np.divide(centroids, norms, out=centroids, where=norms > 0)
+        return cls(classes, centroids, vectorizer)
+
+    def scores(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Cosine similarity of each text to each category centroid, shape (n_texts, n_categories).
+        """
+        if not texts:
+            return np.zeros((0, len(self.labels)), dtype=np.float32)
+        # chunked so the dense feature matrix stays a few tens of MB
+        chunks = [
+            self.vectorizer.transform(texts[start:start + self.batch_size]) @ self.centroids.T
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        return np.vstack(chunks)
+
+    def probabilities(self, sims: np.ndarray) -> np.ndarray:
+        """
+        Softmax over temperature-scaled similarities; rows sum to 1.
+        """
+        logits = sims * self.temperature
+        logits -= logits.max(axis=1, keepdims=True)
+        np.exp(logits, out=logits)
+        logits /= logits.sum(axis=1, keepdims=True)
+        return logits
+
+    def predict(self, texts: Sequence[str]) -> List[Tuple[str, float]]:
+        """
+        Best label and its probability for each text. Texts sharing no
+        features with any category come back as ("uncategorized", 0.0).
+        """
+        sims = self.scores(texts)
+        if not len(sims):
+            return []
+        probs = self.probabilities(sims)
+        best = probs.argmax(axis=1)
+        known = sims.max(axis=1) > 0
+        return [
+            (self.labels[idx], float(probs[row, idx])) if known[row] else ("uncategorized", 0.0)
+            for row, idx in enumerate(best)
+        ]
+
+    def predict_scores(self, texts: Sequence[str], min_score: float = 0.01) -> List[Dict[str, float]]:
+        """
+        Per-label probabilities for each text (labels below `min_score` dropped);
+        empty for texts sharing no features with any category.
+        """
+        sims = self.scores(texts)
+        if not len(sims):
+            return []
+        probs = self.probabilities(sims)
+        known = sims.max(axis=1) > 0
+        return [
+            {label: float(p) for label, p in zip(self.labels, row) if p >= min_score} if known[i] else {}
+            for i, row in enumerate(probs)
+        ]
+
+    def classify(self, title: str, settings: Settings, summary: str = "") -> str:
+        return self.predict([f"{title}\n{summary}"])[0][0]
+
+    def classify_batch(self, texts: Sequence[str], settings: Settings) -> List[str]:
+        return [label for label, _ in self.predict(texts)]
+
+    def save(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            labels=np.asarray(self.labels),
+            centroids=self.centroids,
+            idf=self.vectorizer.idf,
+            temperature=np.asarray(self.temperature),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "LocalClassifier":
+        with np.load(path) as data:
+            idf = data["idf"]
+            vectorizer = HashingTfidf(n_features=idf.shape[0], idf=idf)
+            return cls(
+                labels=[str(label) for label in data["labels"]],
+                centroids=data["centroids"],
+                vectorizer=vectorizer,
+                temperature=float(data["temperature"]),
+            )
@@ -2,29 +2,77 @@
 """
 RSS client implementation.
 
-Uses `feedparser` to read RSS/Atom feeds and convert entries into NewsItem entities.
+Uses `feedparser` to read RSS/Atom feeds and convert entries into NewsRecord
+objects (unvalidated; see app.domain.records).
 Synchronous and intentionally simple for demo purposes.
 """
 
-from typing import List
-import feedparser
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Pattern, Tuple
+from urllib.parse import urlparse
 from datetime import datetime
+import re
+import time
 import uuid
 import logging
 
-from app.domain.entities import NewsItem
+from app.domain.records import NewsRecord, clean_link
 from app.core.config import settings
+from app.core.resilience import get_breaker
 
 logger = logging.getLogger(__name__)
 
 
-def fetch_from_feed_url(url: str) -> List[NewsItem]:
+@dataclass
+class FeedFetch:
     """
-    Fetch and normalize one RSS/Atom feed.
+    Result of one conditional feed request. `not_modified` means the server
+    answered 304 for the given validators (no items).
     """
+    items: List[NewsRecord] = field(default_factory=list)
+    etag: Optional[str] = None
+    modified: Optional[str] = None
+    not_modified: bool = False
+
+
+@lru_cache(maxsize=8)
+def _priority_rules(sources: Tuple[str, ...], keywords: Tuple[str, ...]) -> Tuple[FrozenSet[str], Optional[Pattern]]:
+    # compiled once per configuration, not per entry
+    pattern = None
+    if keywords:
+        pattern = re.compile(r"\b(?:" + "|".join(re.escape(k) for k in keywords) + r")\b", re.IGNORECASE)
+    return frozenset(sources), pattern
+
+
+def is_priority(feed_url: str, source: Optional[str], title: str, summary: Optional[str] = None) -> bool:
+    """
+    True when the feed URL or feed title is a PRIORITY_SOURCES entry or the
+    title/summary contains one of PRIORITY_KEYWORDS (whole words).
+    """
+    sources, pattern = _priority_rules(tuple(settings.priority_source_list), tuple(settings.priority_keyword_list))
+    if feed_url in sources or (source and source in sources):
+        return True
+    return bool(pattern and (pattern.search(title) or (summary and pattern.search(summary))))
+
+
+def fetch_feed(url: str, etag: Optional[str] = None, modified: Optional[str] = None) -> FeedFetch:
+    """
+    Fetch and normalize one RSS/Atom feed, sending If-None-Match /
+    If-Modified-Since when validators from a previous fetch are given.
+    """
+    import feedparser  # deferred: only the fetch path needs it
+
     logger.info("Fetching RSS feed: %s", url)
-    parsed = feedparser.parse(url)
-    items: List[NewsItem] = []
+    with get_breaker(f"feed:{urlparse(url).netloc}"):
+        parsed = feedparser.parse(url, etag=etag, modified=modified)
+        if parsed.get("status") == 304:
+            return FeedFetch(etag=etag, modified=modified, not_modified=True)
+        # feedparser swallows network errors; surface them so the breaker sees them
+        if parsed.get("bozo") and not parsed.entries:
+            raise parsed.get("bozo_exception") or RuntimeError(f"feed unavailable: {url}")
+    fetched_at = time.time()
+    items: List[NewsRecord] = []
     for entry in parsed.entries:
         nid = entry.get("id") or entry.get("guid") or entry.get("link") or str(uuid.uuid4())
         published_at = None
@@ -37,24 +85,34 @@ def fetch_from_feed_url(url: str) -> List[NewsItem]:
                 if term:
                     categories.append(term)
         category = categories[0] if categories else "uncategorized"
-        item = NewsItem(
+        item = NewsRecord(
             id=str(nid),
             title=entry.get("title", "")[:500],
-            link=entry.get("link"),
+            link=clean_link(entry.get("link")),
             summary=entry.get("summary"),
             published_at=published_at,
             source=parsed.feed.get("title"),
             category=category,
+            fetched_at=fetched_at,
         )
+        if is_priority(url, item.source, item.title, item.summary):
+            item.priority = "high"
         items.append(item)
-    return items
+    return FeedFetch(items=items, etag=parsed.get("etag"), modified=parsed.get("modified"))
+
+
+def fetch_from_feed_url(url: str) -> List[NewsRecord]:
+    """
+    Fetch and normalize one RSS/Atom feed (unconditional).
+    """
+    return fetch_feed(url).items
 
 
-def fetch_all_configured(limit_per_feed: int = 5) -> List[NewsItem]:
+def fetch_all_configured(limit_per_feed: int = 5) -> List[NewsRecord]:
     """Fetch all feeds defined in settings, aggregate items, with a per-feed limit."""
     feeds = settings.rss_feed_list
     logger.info("Configured RSS feeds: %s", feeds)
-    all_items: List[NewsItem] = []
+    all_items: List[NewsRecord] = []
 
     for feed_url in feeds:
         try:
@@ -2,19 +2,65 @@
 """
 SMTP emailer implementation.
 
-Synchronous, simple wrapper using smtplib to send plain-text emails. Intended for demo.
+Synchronous wrapper around smtplib. Messages are prepared once: the MIME tree
+(text, plus an HTML alternative when given) is built and serialized without a
+To header, and the bytes are cached per content. Sending to a recipient then
+only prepends its To header, and send_many() delivers one prepared message to
+many recipients over a single SMTP session.
 """
 
 import smtplib
+from dataclasses import dataclass
+from email import policy
 from email.message import EmailMessage
+from functools import lru_cache
 import logging
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 
 from app.domain.interfaces import EmailerInterface
+from app.core.resilience import get_breaker, retry
+
+# Connection-level errors worth retrying (auth/recipient errors are not)
+TRANSIENT_SMTP_ERRORS = (
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPConnectError,
+    ConnectionError,
+    TimeoutError,
+)
+
+# Per-recipient rejections; recorded for that recipient, the session goes on
+RECIPIENT_SMTP_ERRORS = (
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPDataError,
+    smtplib.SMTPSenderRefused,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class PreparedMessage:
+    """
+    A serialized message (SMTP line endings) without its To header.
+    """
+    from_addr: str
+    data: bytes
+
+    def for_recipient(self, to: str) -> bytes:
+        return policy.SMTP.fold_binary("To", to) + self.data
+
+
+@lru_cache(maxsize=128)
+def _prepare(from_addr: str, subject: str, body: str, html: Optional[str]) -> PreparedMessage:
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg["From"] = from_addr
+    msg.set_content(body)
+    if html:
+        msg.add_alternative(html, subtype="html")
+    return PreparedMessage(from_addr=from_addr, data=msg.as_bytes(policy=policy.SMTP))
+
+
 class SMTPEmailer(EmailerInterface):
     """SMTP email sender."""
 
@@ -25,22 +71,63 @@ class SMTPEmailer(EmailerInterface):
         self.password = password
         self.default_from = default_from or user
 
-    def send(self, to: str, subject: str, body: str) -> None:
-        """Send plain-text email safely."""
-        msg = EmailMessage()
-        msg["Subject"] = subject
-        msg["From"] = self.default_from
-        msg["To"] = to
-        msg.set_content(body)
+    @classmethod
+    def from_settings(cls, settings) -> "SMTPEmailer":
+        return cls(
+            host=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            user=settings.SMTP_USER,
+            password=settings.SMTP_PASS,
+            default_from=settings.ALERT_EMAIL_FROM,
+        )
+
+    def prepare(self, subject: str, body: str, html: Optional[str] = None) -> PreparedMessage:
+        """
+        Build and serialize a message once (cached per content).
+        """
+        return _prepare(self.default_from, subject, body, html)
+
+    def send(self, to: str, subject: str, body: str, html: Optional[str] = None) -> None:
+        """Send one email (multipart/alternative when `html` is given); raises on failure."""
+        error = self.send_many([to], self.prepare(subject, body, html))[to]
+        if error:
+            raise smtplib.SMTPException(error)
 
+    def send_many(self, recipients: Iterable[str], prepared: PreparedMessage) -> Dict[str, Optional[str]]:
+        """
+        Deliver `prepared` to every recipient over one SMTP session.
+
+        Returns recipient -> error message (None when the server accepted it).
+        Dropped connections are retried for the recipients not yet handled, so
+        nobody gets the message twice; if the session still fails, the
+        remaining recipients get that error.
+        """
+        recipients = list(dict.fromkeys(recipients))
+        results: Dict[str, Optional[str]] = {}
         try:
-            logger.info("Sending email to %s via %s:%s", to, self.host, self.port)
-            with smtplib.SMTP(self.host, self.port, timeout=20) as server:
-                server.ehlo()
-                server.starttls()
-                server.login(self.user, self.password)
-                server.send_message(msg)
-            logger.info("Email sent successfully to %s", to)
-        except smtplib.SMTPException as exc:
-            logger.exception("SMTP send failed for %s", to)
-            raise
+            logger.info("Sending email to %d recipient(s) via %s:%s", len(recipients), self.host, self.port)
+            with get_breaker("smtp"):
+                self._deliver(prepared, recipients, results)
+        except Exception as exc:
+            logger.exception("SMTP session failed after %d of %d recipients", len(results), len(recipients))
+            for to in recipients:
+                results.setdefault(to, str(exc))
+        failed = sum(1 for error in results.values() if error)
+        logger.info("Email sent to %d recipient(s), %d failed", len(recipients) - failed, failed)
+        return results
+
+    @retry(attempts=3, base_delay=1.0, max_delay=10.0, exceptions=TRANSIENT_SMTP_ERRORS)
+    def _deliver(self, prepared: PreparedMessage, recipients: List[str], results: Dict[str, Optional[str]]) -> None:
+        with smtplib.SMTP(self.host, self.port, timeout=20) as server:
+            server.ehlo()
+            server.starttls()
+            server.login(self.user, self.password)
+            for to in recipients:
+                if to in results:
+                    continue  # handled before a reconnect
+                try:
+                    server.sendmail(prepared.from_addr, [to], prepared.for_recipient(to))
+                    results[to] = None
+                except RECIPIENT_SMTP_ERRORS as exc:
+                    logger.warning("SMTP rejected %s: %s", to, exc)
+                    results[to] = str(exc)
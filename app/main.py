@@ -15,13 +15,14 @@ import logging
 from app.core.logging import configure_logging
 from app.core.config import settings
 from app.core.scheduler import create_scheduler
-from app.infrastructure.groq_client import GroqClient
-from app.services.classifier import ClassifierService
+from app.core.leader import create_leader_lease
+from app.services.classifier import build_classifier
 from app.api.router import get_root_router
-from app.core.db import init_db
+from app.core.db import init_db, close_async_db
+from app.models.news_item_doc import ensure_score_indexes
+from app.services.retention import ensure_ttl_indexes
 from app.core.worker import PeriodicWorker
 
-configure_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -29,34 +30,59 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Lifespan manager that initializes and tears down shared resources."""
 
+    configure_logging()
     logger.info("Starting application lifespan")
 
     # Initialize classifier
-    groq_client = GroqClient(settings.GROQ_API_KEY) if settings.GROQ_API_KEY else None
-    classifier = ClassifierService(classifier=groq_client)
+    classifier = build_classifier(settings)
 
     # Initialize database
     init_db()
+    ensure_score_indexes()
+    ensure_ttl_indexes()
+
+    # Priority feeds get their own, faster loop (background mode); the main
+    # loop then skips them
+    priority_feeds = settings.priority_feed_list
+    fast_lane = settings.SCHEDULER_MODE.lower() == "background" and bool(priority_feeds)
 
     # Set up periodic worker
-    worker = PeriodicWorker(classifier=classifier)
+    worker = PeriodicWorker(
+        classifier=classifier,
+        feeds=[url for url in settings.rss_feed_list if url not in priority_feeds] if fast_lane else None,
+    )
 
-    # Create scheduler
+    # Create scheduler (only the leader-lease holder runs the task)
     scheduler = create_scheduler(
         task=worker.run,
         mode=settings.SCHEDULER_MODE,
         interval_seconds=settings.FETCH_INTERVAL_SECONDS,
+        lease=create_leader_lease(),
+        concurrency=settings.QUEUE_CONCURRENCY,
     )
 
     scheduler.start()
 
+    priority_scheduler = None
+    if fast_lane:
+        priority_scheduler = create_scheduler(
+            task=worker.run_priority,
+            mode="background",
+            interval_seconds=settings.PRIORITY_FETCH_INTERVAL_SECONDS,
+            lease=create_leader_lease(name=f"{settings.LEADER_LEASE_NAME}-priority"),
+        )
+        priority_scheduler.start()
+
     # Hand back to FastAPI
     yield
 
     # Shutdown
     logger.info("Application lifespan ending; stopping scheduler...")
     scheduler.stop()
+    if priority_scheduler:
+        priority_scheduler.stop()
     logger.info("Scheduler stopped cleanly")
+    await close_async_db()
 
 
 app = FastAPI(
@@ -0,0 +1,19 @@
+# app/models/alert_content_doc.py
+"""Defines the MongoEngine document model for deduplicated alert bodies."""
+
+from mongoengine import Document, StringField, DateTimeField
+
+
+class AlertContentDocument(Document):
+    """
+    One alert body, stored once no matter how many alerts reference it.
+    `_id` is the sha256 hex digest of the content (see app.services.alert_content).
+    """
+    meta = {"collection": "alert_contents"}
+
+    id = StringField(primary_key=True)
+    body = StringField()
+    html = StringField()
+    created_at = DateTimeField()
+    # newest alert referencing it; retention keys off this so content outlives its alerts
+    last_used_at = DateTimeField()
@@ -1,16 +1,28 @@
 # app/models/alert_doc.py
 """Defines the MongoEngine document model for storing sent alerts."""
 
-from mongoengine import Document, StringField, BooleanField, DateTimeField
+from mongoengine import Document, StringField, BooleanField, DateTimeField, IntField
 from datetime import datetime, timezone
 
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class AlertDocument(Document):
     meta = {"collection": "alerts"}
     
     news_id = StringField(required=True)
     to = StringField(required=True)     
     subject = StringField(required=True)
-    body = StringField()
+    # sha256 of the body in alert_contents (app.services.alert_content)
+    content_id = StringField()
+    body = StringField()  # inline body of alerts stored before content_id existed
     sent = BooleanField(default=False)  
     error = StringField()               
-    sent_at = DateTimeField(default=datetime.now(timezone.utc))
+    sent_at = DateTimeField(default=_utcnow)
+    # fast-lane alerts (app.services.priority): handed to SMTP this long after
+    # the item was published / after its feed was parsed
+    priority = StringField()
+    publish_latency_ms = IntField()
+    detect_latency_ms = IntField()
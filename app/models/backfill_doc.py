@@ -0,0 +1,21 @@
+# app/models/backfill_doc.py
+"""Defines the MongoEngine document model for resumable backfill runs."""
+
+from mongoengine import Document, StringField, ListField, DictField, DateTimeField
+
+
+class BackfillRunDocument(Document):
+    """
+    Progress of one reclassification backfill (see app.services.backfill).
+
+    Each entry of `ranges` is one `_id` range processed by one worker:
+    {min, max, max_inclusive, last_id, processed, done}.
+    """
+    meta = {"collection": "backfill_runs"}
+
+    id = StringField(primary_key=True)  # run name
+    status = StringField(default="running")  # running | done
+    backend = StringField()
+    ranges = ListField(DictField())
+    started_at = DateTimeField()
+    finished_at = DateTimeField()
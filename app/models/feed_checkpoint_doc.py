@@ -0,0 +1,23 @@
+# app/models/feed_checkpoint_doc.py
+"""Defines the MongoEngine document model for per-feed ingestion checkpoints."""
+
+from mongoengine import Document, StringField, ListField, DictField, DateTimeField
+
+
+class FeedCheckpointDocument(Document):
+    """
+    Where ingestion of one feed stands (see app.services.checkpoints).
+
+    stage: idle | fetched | classified; `pending` holds the in-flight items
+    (NewsRecord payloads, with scores once classified) until they are stored.
+    """
+    meta = {"collection": "feed_checkpoints"}
+
+    id = StringField(primary_key=True)  # feed URL
+    etag = StringField()
+    modified = StringField()
+    last_published = DateTimeField()
+    seen_guids = ListField(StringField())  # most recent last, capped
+    stage = StringField(default="idle")
+    pending = ListField(DictField())
+    updated_at = DateTimeField()
@@ -0,0 +1,35 @@
+# app/models/job_doc.py
+"""Defines the MongoEngine document model for queued background jobs."""
+
+from mongoengine import Document, StringField, DictField, IntField, DateTimeField
+from datetime import datetime, timezone
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobDocument(Document):
+    meta = {
+        "collection": "jobs",
+        "indexes": [
+            ("status", "-priority", "run_at"),
+            ("status", "locked_until"),
+            ("dedupe_key", "status"),
+        ],
+    }
+
+    task = StringField(required=True)
+    payload = DictField()
+    status = StringField(default="queued")  # queued | running | done | failed
+    priority = IntField(default=0)
+    attempts = IntField(default=0)
+    max_attempts = IntField(default=3)
+    dedupe_key = StringField()
+    run_at = DateTimeField(default=_utcnow)
+    locked_by = StringField()
+    locked_until = DateTimeField()
+    result = DictField()
+    error = StringField()
+    created_at = DateTimeField(default=_utcnow)
+    finished_at = DateTimeField()
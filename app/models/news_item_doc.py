@@ -1,11 +1,20 @@
 # app/models/news_item_doc.py
 """Defines the MongoEngine document model for NewsItem storage."""
 
-from mongoengine import Document, StringField, ListField, DateTimeField
+from mongoengine import Document, StringField, ListField, DateTimeField, IntField, DictField
 from datetime import datetime, timezone
 
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class NewsItemDocument(Document):
-    meta = {"collection": "news"}
+    meta = {
+        "collection": "news",
+        # (ingested_at, _id) serves the incremental `since` cursor of GET /news/
+        "indexes": ["category_mask", ("category", "-published_at"), ("ingested_at", "id")],
+    }
     
     id = StringField(required=True, primary_key=True)
     title = StringField(required=True)
@@ -13,4 +22,19 @@ class NewsItemDocument(Document):
     link = StringField(unique=True, required=True)
     source = StringField()
     category = StringField()
-    published_at = DateTimeField(default=datetime.now(timezone.utc))
+    published_at = DateTimeField(default=_utcnow)
+    # when we stored it; retention (app.services.retention) keys off this, not published_at
+    ingested_at = DateTimeField(default=_utcnow)
+    # multi-label classification, see app.domain.labels
+    category_mask = IntField(default=0)
+    scores = DictField()  # category -> score quantized to 0..255
+    # last relabeling by the backfill or an ingest-log replay (app.services.backfill, ingest_replay)
+    reclassified_at = DateTimeField()
+
+
+def ensure_score_indexes() -> None:
+    """
+    Wildcard index over `scores` so "category X with score > s" filters run in
+    MongoDB (mongoengine's index spec cannot express wildcard indexes).
+    """
+    NewsItemDocument._get_collection().create_index([("scores.$**", 1)], name="scores_wildcard")
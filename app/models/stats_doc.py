@@ -0,0 +1,22 @@
+# app/models/stats_doc.py
+"""Defines the MongoEngine document model for materialized dashboard counters."""
+
+from mongoengine import Document, StringField, IntField, DateTimeField
+
+
+class StatsDocument(Document):
+    """
+    One counter per (kind, key): kind is total | category | source | hour.
+    `_id` is "<kind>:<key>" so increments are single-document upserts.
+    """
+    meta = {
+        "collection": "stats",
+        "indexes": [("kind", "key"), ("kind", "hour")],
+    }
+
+    id = StringField(primary_key=True)
+    kind = StringField(required=True)
+    key = StringField()
+    hour = DateTimeField()  # kind == "hour": start of the bucket
+    count = IntField(default=0)
+    updated_at = DateTimeField()
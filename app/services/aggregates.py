@@ -0,0 +1,150 @@
+# app/services/aggregates.py
+"""
+Materialized dashboard aggregates.
+
+Counts of stored news per category, per source and per hour of publication
+(plus a total) live in the `stats` collection, one document per counter.
+store_items / store_items_bulk call record_items() with every stored batch,
+which applies all increments in a single unordered bulk_write of $inc
+upserts, so GET /api/v1/stats reads a handful of small documents instead of
+aggregating over the news collection.
+
+Counters are cumulative: documents removed by retention or reset-db stay
+counted until rebuild_aggregates() recomputes everything from the news
+collection (queue task `rebuild_aggregates`, `uv run rebuild-stats` or
+POST /api/v1/admin/stats/rebuild).
+"""
+
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Tuple
+import logging
+
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+
+from app.core.resilience import get_breaker
+from app.models.news_item_doc import NewsItemDocument
+from app.models.stats_doc import StatsDocument
+
+logger = logging.getLogger(__name__)
+
+
+def _hour(value: datetime) -> datetime:
+    # naive UTC, like the datetimes pymongo returns
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def _counter_doc(kind: str, key: Any) -> Tuple[str, Dict[str, Any]]:
+    if kind == "hour":
+        return f"hour:{key.isoformat()}", {"kind": kind, "key": key.isoformat(), "hour": key}
+    return f"{kind}:{key}", {"kind": kind, "key": key}
+
+
+def _counts(items: Iterable[Any]) -> Counter:
+    counts: Counter = Counter()
+    now = datetime.now(timezone.utc)
+    for it in items:
+        counts[("total", "all")] += 1
+        counts[("category", it.category or "uncategorized")] += 1
+        counts[("source", it.source or "unknown")] += 1
+        counts[("hour", _hour(it.published_at or now))] += 1
+    return counts
+
+
+def record_items(items: List[Any]) -> None:
+    """
+    Add a stored batch to the counters (one bulk_write). Failures are logged,
+    not raised: the batch is already stored and a rebuild repairs the counters.
+    """
+    if not items:
+        return
+    now = datetime.now(timezone.utc)
+    ops = []
+    for (kind, key), count in _counts(items).items():
+        _id, fields = _counter_doc(kind, key)
+        ops.append(UpdateOne(
+            {"_id": _id},
+            {"$inc": {"count": count}, "$set": {"updated_at": now}, "$setOnInsert": fields},
+            upsert=True,
+        ))
+    try:
+        with get_breaker("mongo", failure_exceptions=(PyMongoError,)):
+            StatsDocument._get_collection().bulk_write(ops, ordered=False)
+    except Exception:
+        logger.exception("Failed to update aggregates for %d items; run rebuild_aggregates to repair", len(items))
+
+
+def _snapshot_counts(news, match: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any], int]]:
+    """
+    (counter _id, counter fields, count) for the news documents matching `match`.
+    """
+    pipeline = [
+        {"$match": match},
+        {"$facet": {
+            "total": [{"$count": "count"}],
+            "category": [{"$group": {"_id": {"$ifNull": ["$category", "uncategorized"]}, "count": {"$sum": 1}}}],
+            "source": [{"$group": {"_id": {"$ifNull": ["$source", "unknown"]}, "count": {"$sum": 1}}}],
+            "hour": [{"$group": {
+                "_id": {"$dateTrunc": {"date": {"$ifNull": ["$published_at", "$ingested_at"]}, "unit": "hour"}},
+                "count": {"$sum": 1},
+            }}],
+        }},
+    ]
+    result = next(news.aggregate(pipeline, allowDiskUse=True), {})
+
+    rows = []
+    for row in result.get("total", []):
+        rows.append((*_counter_doc("total", "all"), row["count"]))
+    for kind in ("category", "source", "hour"):
+        for row in result.get(kind, []):
+            if row["_id"] is None:
+                continue
+            rows.append((*_counter_doc(kind, row["_id"]), row["count"]))
+    return rows
+
+
+def rebuild_aggregates() -> Dict[str, int]:
+    """
+    Recompute every counter from the news collection and swap it in atomically
+    (written to a scratch collection, then renamed over `stats`).
+
+    The snapshot covers items ingested before the rebuild started; $inc
+    updates for items stored meanwhile go to the old `stats` collection and
+    are dropped by the rename, so those items (ingested_at >= the start) are
+    counted again into the scratch collection just before the swap. Items
+    stored in the moment between that catch-up and the rename, or made
+    visible with an older ingested_at after the snapshot, can still be
+    missed until the next rebuild.
+    """
+    news = NewsItemDocument._get_collection()
+    stats = StatsDocument._get_collection()
+    now = datetime.now(timezone.utc)
+    # $not/$gte (rather than $lt) also keeps documents without ingested_at
+    rows = _snapshot_counts(news, {"ingested_at": {"$not": {"$gte": now}}})
+    docs = [{"_id": _id, **fields, "count": count, "updated_at": now} for _id, fields, count in rows]
+
+    scratch = stats.database[f"{stats.name}_rebuild"]
+    scratch.drop()
+    if docs:
+        scratch.insert_many(docs, ordered=False)
+    late = _snapshot_counts(news, {"ingested_at": {"$gte": now}})
+    if late:
+        scratch.bulk_write([
+            UpdateOne(
+                {"_id": _id},
+                {"$inc": {"count": count}, "$set": {"updated_at": now}, "$setOnInsert": fields},
+                upsert=True,
+            )
+            for _id, fields, count in late
+        ], ordered=False)
+    if docs or late:
+        scratch.create_index([("kind", 1), ("key", 1)])
+        scratch.create_index([("kind", 1), ("hour", 1)])
+        scratch.rename(stats.name, dropTarget=True)
+    else:
+        stats.delete_many({})
+    logger.info("Rebuilt aggregates: %d counters (%d updated by items stored during the rebuild)", len(docs), len(late))
+    return {"counters": len(docs), "late": len(late)}
@@ -0,0 +1,48 @@
+# app/services/alert_content.py
+"""
+Content-addressed storage for alert bodies.
+
+An alert body (plain text plus optional HTML) is stored once in
+`alert_contents` under the sha256 of its content; AlertDocument keeps only
+that `content_id` plus the per-recipient fields (to, subject, sent, error,
+sent_at). Sending one story to N recipients therefore writes the body once,
+and history listings never touch it: bodies are loaded on the detail view
+only.
+
+Storing is an idempotent upsert ($setOnInsert body, $max last_used_at), so
+concurrent senders of the same body converge on one document.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+import hashlib
+
+from pymongo.errors import DuplicateKeyError
+
+from app.models.alert_content_doc import AlertContentDocument
+
+
+def content_id(body: str, html: Optional[str] = None) -> str:
+    digest = hashlib.sha256(body.encode("utf-8"))
+    if html:
+        digest.update(b"\0")
+        digest.update(html.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def store_content(body: str, html: Optional[str] = None, now: Optional[datetime] = None) -> str:
+    """
+    Store `body` / `html` (once) and return their content id.
+    """
+    digest = content_id(body, html)
+    now = now or datetime.now(timezone.utc)
+    try:
+        AlertContentDocument._get_collection().update_one(
+            {"_id": digest},
+            {"$setOnInsert": {"body": body, "html": html, "created_at": now}, "$max": {"last_used_at": now}},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        # lost an insert race with another sender of the same body; the content is there
+        pass
+    return digest
@@ -2,11 +2,14 @@
 """
 Alert sender service.
 
-Encapsulates building email messages for a news item and sending them using
-the SMTPEmailer adapter (infra layer). Stores alert history in MongoDB.
+Encapsulates rendering email messages for a news item (Jinja2 templates,
+app.services.alert_templates) and sending them using the SMTPEmailer adapter
+(infra layer), to one recipient or fanned out to many. Stores alert history
+in MongoDB; the body goes to the content-addressed store
+(app.services.alert_content) and the alert keeps a reference.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 from datetime import datetime, timezone
 
@@ -14,28 +17,89 @@ from app.infrastructure.smtp_emailer import SMTPEmailer
 from app.services.news_fetcher import get_news_by_id
 from app.domain.entities import NewsItem
 from app.models.alert_doc import AlertDocument
+from app.services.alert_content import store_content
+from app.services.alert_templates import render_alert
+from app.core.db import read_collection
 
 logger = logging.getLogger(__name__)
 
 
 def build_message_for_news(news: NewsItem) -> Dict[str, str]:
     """
-    Build a short subject and plain-text body for the supplied news item.
+    Subject, plain-text body and HTML body for the supplied news item
+    (rendered from app/templates, cached per story).
     """
-    subject = f"[News Alert] {news.title}"
-    body_lines = [
-        news.title,
-        "",
-        news.summary or "",
-        "",
-        f"Source: {news.source or 'unknown'}",
-        f"Category: {news.category or 'uncategorized'}",
-    ]
-    if news.link:
-        body_lines.append("")
-        body_lines.append(f"Link: {news.link}")
-    body = "\n".join(line for line in body_lines if line is not None)
-    return {"subject": subject, "body": body}
+    rendered = render_alert(news)
+    return {"subject": rendered.subject, "body": rendered.text, "html": rendered.html}
+
+
+def _send_alerts(
+    emailer: SMTPEmailer,
+    news_id: str,
+    recipients: List[str],
+    subject: Optional[str],
+    body: Optional[str],
+    priority: Optional[str],
+    fetched_at: Optional[float],
+) -> Tuple[List[Dict[str, Any]], str]:
+    news = get_news_by_id(news_id)
+    if not news:
+        raise ValueError("news item not found")
+
+    msg = build_message_for_news(news)
+    subject = subject or msg["subject"]
+    html = None if body else msg["html"]
+    body = body or msg["body"]
+
+    content_id = store_content(body, html)
+    results = emailer.send_many(recipients, emailer.prepare(subject, body, html))
+
+    sent_at = datetime.now(timezone.utc)
+    records = []
+    for to, error in results.items():
+        record = AlertDocument(
+            news_id=news_id,
+            to=to,
+            subject=subject,
+            content_id=content_id,
+            sent=error is None,
+            error=error,
+            sent_at=sent_at,
+            priority=priority,
+        )
+        if priority and error is None:
+            _record_latency(record, news, fetched_at)
+        records.append(record)
+    AlertDocument.objects.insert(records, load_bulk=False)
+
+    failed = [r.to for r in records if not r.sent]
+    if failed:
+        logger.error("Failed to send email for news_id=%s to %s", news_id, ", ".join(failed))
+    logger.info("Email sent for news_id=%s to %d recipient(s)", news_id, len(records) - len(failed))
+    return [_alert_dict(record) for record in records], body
+
+
+def send_alerts_for_news(
+    emailer: SMTPEmailer,
+    news_id: str,
+    recipients: List[str],
+    subject: Optional[str] = None,
+    body: Optional[str] = None,
+    priority: Optional[str] = None,
+    fetched_at: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Send an alert for a news item to every recipient and store one alert
+    record per recipient. Returns the records (without the body).
+
+    The message is rendered, stored and serialized once; recipients only
+    differ in the To header and share one SMTP session. A custom `body`
+    replaces the template and is sent as plain text only.
+
+    Alerts sent with a `priority` also record how long after publication (and
+    after `fetched_at`, when the feed was parsed) the message reached SMTP.
+    """
+    return _send_alerts(emailer, news_id, recipients, subject, body, priority, fetched_at)[0]
 
 
 def send_alert_for_news(
@@ -44,67 +108,64 @@ def send_alert_for_news(
     to: str,
     subject: Optional[str] = None,
     body: Optional[str] = None,
+    priority: Optional[str] = None,
+    fetched_at: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
-    Send an alert for a news item and store it in MongoDB.
-    Returns a record describing the result.
+    Send an alert for a news item to one recipient and store it in MongoDB.
+    Returns a record describing the result (including the plain-text body).
     """
-    news = get_news_by_id(news_id)
-    if not news:
-        raise ValueError("news item not found")
-
-    # Build message if caller didn't supply
-    if not subject or not body:
-        msg = build_message_for_news(news)
-        subject = subject or msg["subject"]
-        body = body or msg["body"]
-
-    record = AlertDocument(
-        news_id=news_id,
-        to=to,
-        subject=subject,
-        body=body,
-        sent=False,
-        sent_at=datetime.now(timezone.utc)
-    )
+    records, body = _send_alerts(emailer, news_id, [to], subject, body, priority, fetched_at)
+    return dict(records[0], body=body)
 
-    try:
-        emailer.send(to=to, subject=subject, body=body)
-        record.sent = True
-        record.sent_at = datetime.now(timezone.utc)
-        record.save()
-        logger.info("Email sent for news_id=%s to=%s", news_id, to)
-    except Exception as exc:
-        record.error = str(exc)
-        record.sent_at = datetime.now(timezone.utc)
-        record.save()
-        logger.exception("Failed to send email for news_id=%s to=%s", news_id, to)
 
+def _alert_dict(record: AlertDocument) -> Dict[str, Any]:
     return {
         "news_id": record.news_id,
         "to": record.to,
         "subject": record.subject,
-        "body": record.body,
+        "content_id": record.content_id,
         "sent": record.sent,
         "error": record.error,
         "sent_at": record.sent_at.isoformat(),
+        "priority": record.priority,
+        "publish_latency_ms": record.publish_latency_ms,
+        "detect_latency_ms": record.detect_latency_ms,
     }
 
 
+def _record_latency(record: AlertDocument, news: NewsItem, fetched_at: Optional[float]) -> None:
+    sent = record.sent_at
+    if news.published_at:
+        published = news.published_at
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=timezone.utc)
+        record.publish_latency_ms = max(int((sent - published).total_seconds() * 1000), 0)
+    if fetched_at:
+        record.detect_latency_ms = max(int((sent.timestamp() - fetched_at) * 1000), 0)
+
+
+# Listing omits the body (GET /alerts/{id} loads it); `_id` becomes `id`
+ALERT_LIST_PROJECTION = {"news_id": 1, "to": 1, "subject": 1, "content_id": 1, "sent": 1, "error": 1, "sent_at": 1}
+
+
+def _raw_alert(doc: dict) -> dict:
+    doc["id"] = str(doc.pop("_id"))
+    return doc
+
+
 def get_alert_history(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
     """
     Retrieve alert history from MongoDB, paginated.
+
+    Reads raw dicts through pymongo with a projection (no body, no Document
+    hydration); `sent_at` stays a datetime for the response serializer.
     """
-    qs = AlertDocument.objects.order_by("-sent_at").skip(offset).limit(limit)
-    return [
-        {
-            "news_id": a.news_id,
-            "to": a.to,
-            "subject": a.subject,
-            "body": a.body,
-            "sent": a.sent,
-            "error": a.error,
-            "sent_at": a.sent_at.isoformat(),
-        }
-        for a in qs
-    ]
+    cursor = (
+        read_collection(AlertDocument._get_collection())
+        .find({}, ALERT_LIST_PROJECTION)
+        .sort("sent_at", -1)
+        .skip(offset)
+        .limit(limit)
+    )
+    return [_raw_alert(doc) for doc in cursor]
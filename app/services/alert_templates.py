@@ -0,0 +1,69 @@
+# app/services/alert_templates.py
+"""
+Jinja2 rendering of alert emails.
+
+Templates live in app/templates (alert_subject.txt.j2, alert.txt.j2 and
+alert.html.j2). The environment is built once per process with auto_reload
+off, so each template is compiled to Python once and every later render only
+runs the compiled code. Rendered alerts are cached per story (keyed on the
+fields the templates use), so a story sent to many recipients, whether in one
+fan-out or across send_alert jobs, is rendered once.
+
+The HTML template autoescapes; feed summaries are untrusted and shown as text.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from jinja2 import Environment, PackageLoader, Template, select_autoescape
+
+from app.domain.entities import NewsItem
+
+
+@dataclass(frozen=True)
+class RenderedAlert:
+    subject: str
+    text: str
+    html: str
+
+
+@lru_cache()
+def _templates() -> Tuple[Template, Template, Template]:
+    env = Environment(
+        loader=PackageLoader("app", "templates"),
+        autoescape=select_autoescape(enabled_extensions=("html.j2",), default_for_string=False),
+        auto_reload=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+    return (
+        env.get_template("alert_subject.txt.j2"),
+        env.get_template("alert.txt.j2"),
+        env.get_template("alert.html.j2"),
+    )
+
+
+@lru_cache(maxsize=256)
+def _render(title: str, summary: str, source: str, category: str, link: Optional[str]) -> RenderedAlert:
+    subject, text, html = _templates()
+    context = {"title": title, "summary": summary, "source": source, "category": category, "link": link}
+    return RenderedAlert(
+        # a header cannot span lines; titles from feeds sometimes do
+        subject=" ".join(subject.render(context).split()),
+        text=text.render(context).rstrip("\n"),
+        html=html.render(context),
+    )
+
+
+def render_alert(news: NewsItem) -> RenderedAlert:
+    """
+    Subject, plain-text and HTML body for a news item (cached per content).
+    """
+    return _render(
+        news.title,
+        news.summary or "",
+        news.source or "unknown",
+        news.category or "uncategorized",
+        str(news.link) if news.link else None,
+    )
@@ -0,0 +1,201 @@
+# app/services/backfill.py
+"""
+Resumable bulk reclassification of stored news.
+
+The collection is split into `_id` ranges with $bucketAuto and each range is
+processed by its own worker thread: read a batch in `_id` order, classify it
+through the configured backend (build_classifier), write category / scores /
+category_mask back with one unordered bulk_write, then checkpoint the last
+`_id` of the range in the run's BackfillRunDocument. Re-running with the same
+run name resumes every range after its checkpoint. A dry run classifies
+freshly planned ranges without touching any run document, so it never
+marks a real run as started or finished.
+
+Groq calls are paced: before each chunk the worker waits until the shared
+rate limiter has budget for the whole chunk, and chunks are sized to the
+per-minute request budget, so the backfill slows down instead of falling back
+to keywords (and leaves the interactive paths their share via the limiter).
+Items that still end up on the keyword fallback (Groq errors or deadline)
+keep their stored labels rather than being overwritten with degraded ones.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import time
+
+from pymongo import UpdateOne
+
+from app.core.config import settings
+from app.core.ratelimit import estimate_tokens, get_groq_limiter
+from app.domain.labels import encode_scores, primary_label
+from app.domain.records import NewsRecord
+from app.models.backfill_doc import BackfillRunDocument
+from app.models.news_item_doc import NewsItemDocument
+from app.services.aggregates import rebuild_aggregates
+from app.services.classifier import ClassifierService
+
+logger = logging.getLogger(__name__)
+
+# one Groq-paced chunk at a time across workers; local/keyword tiers run in parallel
+_groq_lock = Lock()
+
+
+def plan_ranges(workers: int) -> List[Dict[str, Any]]:
+    """
+    Split the news `_id` space into about `workers` ranges of similar size.
+    """
+    buckets = NewsItemDocument._get_collection().aggregate([
+        {"$bucketAuto": {"groupBy": "$_id", "buckets": max(workers, 1)}},
+    ])
+    ranges = [{"min": b["_id"]["min"], "max": b["_id"]["max"], "max_inclusive": False} for b in buckets]
+    if ranges:
+        # $bucketAuto upper bounds are exclusive except for the last bucket
+        ranges[-1]["max_inclusive"] = True
+    for r in ranges:
+        r.update(last_id=None, processed=0, done=False)
+    return ranges
+
+
+def paced_classify(classifier: ClassifierService, items: List[NewsRecord]) -> List[Tuple[Dict[str, float], str]]:
+    """
+    (scores, tier) per item, waiting for Groq budget instead of shedding
+    bulk work to the keyword fallback. Shared with the ingest-log replay.
+    """
+    if classifier.classifier is None:
+        return classifier.classify_many_tiered(items, settings=settings, priority="low")
+    limiter = get_groq_limiter()
+    chunk_size = max(1, int(limiter.requests.capacity))
+    results: List[Tuple[Dict[str, float], str]] = []
+    with _groq_lock:
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start:start + chunk_size]
+            tokens = sum(estimate_tokens(f"{it.title}\n{it.summary or ''}") for it in chunk)
+            wait = limiter.available_in(len(chunk), tokens)
+            if wait > 0:
+                logger.info("backfill: waiting %.1fs for Groq budget", wait)
+                time.sleep(wait)
+            results.extend(classifier.classify_many_tiered(chunk, settings=settings))
+    return results
+
+
+def is_degraded(classifier: ClassifierService, tier: str) -> bool:
+    """
+    True for a keyword-fallback result when Groq is configured (i.e. Groq
+    failed); for keyword/local-only backends the fallback is the real answer.
+    """
+    return tier == "fallback" and classifier.classifier is not None
+
+
+def _process_range(
+    run_id: str,
+    index: int,
+    spec: Dict[str, Any],
+    classifier: ClassifierService,
+    batch_size: int,
+    dry_run: bool,
+) -> int:
+    news = NewsItemDocument._get_collection()
+    runs = BackfillRunDocument._get_collection()
+    topics = settings.topic_list
+    processed = spec["processed"]
+    last_id = spec["last_id"]
+
+    while True:
+        bounds = {"$lte" if spec["max_inclusive"] else "$lt": spec["max"]}
+        bounds.update({"$gt": last_id} if last_id is not None else {"$gte": spec["min"]})
+        docs = list(news.find({"_id": bounds}, {"title": 1, "summary": 1}).sort("_id", 1).limit(batch_size))
+        if not docs:
+            break
+        items = [NewsRecord(id=d["_id"], title=d.get("title") or "", summary=d.get("summary")) for d in docs]
+        results = paced_classify(classifier, items)
+
+        now = datetime.now(timezone.utc)
+        ops = []
+        for it, (scores, tier) in zip(items, results):
+            if is_degraded(classifier, tier):
+                continue
+            mask, quantized = encode_scores(scores, topics, settings.LABEL_SCORE_THRESHOLD)
+            ops.append(UpdateOne(
+                {"_id": it.id},
+                {"$set": {"category": primary_label(scores), "scores": quantized, "category_mask": mask, "reclassified_at": now}},
+            ))
+        if ops and not dry_run:
+            news.bulk_write(ops, ordered=False)
+
+        last_id = docs[-1]["_id"]
+        processed += len(docs)
+        if not dry_run:
+            # checkpoint only this range's slot so parallel workers never overwrite each other
+            runs.update_one(
+                {"_id": run_id},
+                {"$set": {f"ranges.{index}.last_id": last_id, f"ranges.{index}.processed": processed}},
+            )
+        logger.info("backfill %s range %d: %d processed (last _id %s)", run_id, index, processed, last_id)
+
+    if not dry_run:
+        runs.update_one({"_id": run_id}, {"$set": {f"ranges.{index}.done": True}})
+    return processed
+
+
+def _run_ranges(
+    run_id: str,
+    ranges: Dict[int, Dict[str, Any]],
+    classifier: ClassifierService,
+    batch_size: int,
+    dry_run: bool,
+) -> List[int]:
+    with ThreadPoolExecutor(max_workers=max(len(ranges), 1), thread_name_prefix="backfill") as pool:
+        futures = [
+            pool.submit(_process_range, run_id, i, spec, classifier, batch_size, dry_run)
+            for i, spec in ranges.items()
+        ]
+        return [future.result() for future in futures]
+
+
+def run_backfill(
+    classifier: ClassifierService,
+    run_id: str,
+    workers: int = 4,
+    batch_size: int = 200,
+    restart: bool = False,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    Reclassify the whole news collection; resumes run `run_id` if it exists.
+    """
+    if dry_run:
+        ranges = plan_ranges(workers)
+        logger.info("backfill %s (dry run): planned %d ranges, nothing will be written", run_id, len(ranges))
+        processed = sum(_run_ranges(run_id, dict(enumerate(ranges)), classifier, batch_size, dry_run=True))
+        logger.info("backfill %s dry run finished: %d items", run_id, processed)
+        return {"run": run_id, "status": "dry_run", "processed": processed}
+
+    run: Optional[BackfillRunDocument] = BackfillRunDocument.objects(id=run_id).first()
+    if run is None or restart:
+        run = BackfillRunDocument(
+            id=run_id,
+            backend=settings.CLASSIFIER_BACKEND,
+            ranges=plan_ranges(workers),
+            started_at=datetime.now(timezone.utc),
+        )
+        run.save()
+        logger.info("backfill %s: planned %d ranges", run_id, len(run.ranges))
+    elif run.status == "done":
+        logger.info("backfill %s already finished; pass restart=True to run it again", run_id)
+        return {"run": run_id, "status": run.status, "processed": sum(r["processed"] for r in run.ranges)}
+    else:
+        logger.info("backfill %s: resuming %d unfinished ranges", run_id, sum(not r["done"] for r in run.ranges))
+
+    pending = {i: r for i, r in enumerate(run.ranges) if not r["done"]}
+    _run_ranges(run_id, pending, classifier, batch_size, dry_run=False)
+
+    BackfillRunDocument.objects(id=run_id).update_one(set__status="done", set__finished_at=datetime.now(timezone.utc))
+    run.reload()
+    # category counters are stale after relabeling
+    rebuild_aggregates()
+    processed = sum(r["processed"] for r in run.ranges)
+    logger.info("backfill %s finished: %d items", run_id, processed)
+    return {"run": run_id, "status": "done", "processed": processed}
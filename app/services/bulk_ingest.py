@@ -0,0 +1,153 @@
+# app/services/bulk_ingest.py
+"""
+Bulk ingestion of pre-fetched items (webhooks, internal crawlers).
+
+Records are processed in chunks: validated, de-duplicated (within the
+request and against stored links with one `$in` query per chunk),
+classified as a batch and written with one unordered insert_many. Every
+record that is not stored is reported with its index in the request.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple
+import logging
+import uuid
+
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.domain.entities import IncomingNewsItem
+from app.domain.labels import primary_label
+from app.domain.records import NewsRecord
+from app.models.news_item_doc import NewsItemDocument
+from app.services.classifier import ClassifierService
+from app.services.news_fetcher import store_items_bulk
+from app.services.trends import get_trend_detector
+
+logger = logging.getLogger(__name__)
+
+MAX_REPORTED_ERRORS = 1000
+
+
+@dataclass
+class BulkIngestResult:
+    received: int = 0
+    stored: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    failed: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    ids: List[str] = field(default_factory=list)
+    truncated: bool = False
+
+    def error(self, index: int, message: str) -> None:
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"index": index, "error": message})
+
+
+class BulkIngestor:
+    """
+    Stateful ingestor for one request; feed it chunks with ingest_chunk().
+    """
+
+    def __init__(self, classifier: ClassifierService, classify: bool = True):
+        self.classifier = classifier
+        self.classify = classify
+        self.result = BulkIngestResult()
+        self._seen_links = set()
+
+    def reject(self, index: int, message: str) -> None:
+        """
+        Count a record that could not even be parsed (e.g. a malformed NDJSON line).
+        """
+        self.result.received += 1
+        self.result.invalid += 1
+        self.result.error(index, message)
+
+    def ingest_chunk(self, records: List[Tuple[int, Any]]) -> None:
+        """
+        Process (request index, raw record) pairs.
+        """
+        self.result.received += len(records)
+        items: List[NewsRecord] = []
+        indexes: List[int] = []
+
+        for index, raw in records:
+            if not isinstance(raw, dict):
+                self.result.invalid += 1
+                self.result.error(index, "invalid record: expected a JSON object")
+                continue
+            try:
+                record = IncomingNewsItem(**raw)
+            except ValidationError as exc:
+                self.result.invalid += 1
+                first = exc.errors()[0]
+                where = ".".join(str(part) for part in first.get("loc", ()))
+                self.result.error(index, f"invalid record: {where}: {first.get('msg', 'validation error')}")
+                continue
+            link = str(record.link)
+            if link in self._seen_links:
+                self.result.duplicates += 1
+                continue
+            self._seen_links.add(link)
+            # validated once here; the rest of the pipeline uses plain records
+            items.append(NewsRecord(
+                id=record.id or str(uuid.uuid4()),
+                title=record.title[:500],
+                link=link,
+                summary=record.summary,
+                published_at=record.published_at,
+                source=record.source,
+                category=record.category or "uncategorized",
+            ))
+            indexes.append(index)
+
+        # drop links that are already stored (one query per chunk)
+        if not items:
+            return
+        existing = set(
+            doc["link"]
+            for doc in NewsItemDocument._get_collection().find(
+                {"link": {"$in": [it.link for it in items]}}, {"link": 1, "_id": 0}
+            )
+        )
+        if existing:
+            kept = [(it, idx) for it, idx in zip(items, indexes) if it.link not in existing]
+            self.result.duplicates += len(items) - len(kept)
+            items = [it for it, _ in kept]
+            indexes = [idx for _, idx in kept]
+
+        # classify only items the source did not label; low priority so bulk
+        # loads never starve the scheduled cycle of Groq budget
+        unlabeled = [it for it in items if it.category == "uncategorized"] if self.classify else []
+        if unlabeled:
+            results = self.classifier.classify_many_scores(unlabeled, settings=settings, priority="low")
+            for it, scores in zip(unlabeled, results):
+                if scores:
+                    it.scores = scores
+                    it.category = primary_label(scores)
+
+        added, duplicates, failures = store_items_bulk(items)
+        get_trend_detector().observe(added)
+        self.result.stored += len(added)
+        self.result.duplicates += duplicates
+        self.result.failed += len(failures)
+        self.result.ids.extend(it.id for it in added)
+        for position, message in failures:
+            self.result.error(indexes[position], message)
+
+
+def ingest_records(records: Iterable[Any], classifier: ClassifierService, classify: bool = True) -> BulkIngestResult:
+    """
+    Ingest an in-memory list of records in BULK_CHUNK_SIZE chunks.
+    """
+    ingestor = BulkIngestor(classifier, classify=classify)
+    chunk: List[Tuple[int, Any]] = []
+    for index, record in enumerate(records):
+        chunk.append((index, record))
+        if len(chunk) >= settings.BULK_CHUNK_SIZE:
+            ingestor.ingest_chunk(chunk)
+            chunk = []
+    if chunk:
+        ingestor.ingest_chunk(chunk)
+    return ingestor.result
@@ -0,0 +1,78 @@
+# app/services/checkpoints.py
+"""
+Per-feed ingestion checkpoints.
+
+Each feed has a FeedCheckpointDocument recording the HTTP validators of the
+last fetch (ETag / Last-Modified), the GUIDs of recently processed entries
+and, while a cycle is running, the stage reached plus the in-flight items:
+
+    idle --fetch--> fetched --classify--> classified --store--> idle
+
+A cycle that is interrupted (restart, deploy, Mongo outage during store)
+leaves the checkpoint at `fetched` or `classified`; the next cycle resumes
+from the pending items instead of fetching again, and classified items are
+stored without another LLM call. Entries whose GUID was already processed
+are dropped right after fetching, before classification.
+"""
+
+from datetime import datetime, timezone
+from typing import List, Optional
+import logging
+
+from app.core.config import settings
+from app.domain.records import NewsRecord
+from app.models.feed_checkpoint_doc import FeedCheckpointDocument
+
+logger = logging.getLogger(__name__)
+
+
+def load_checkpoint(url: str) -> FeedCheckpointDocument:
+    return FeedCheckpointDocument.objects(id=url).first() or FeedCheckpointDocument(id=url)
+
+
+def unseen(checkpoint: FeedCheckpointDocument, items: List[NewsRecord]) -> List[NewsRecord]:
+    """
+    Items whose GUID has not been processed yet.
+    """
+    seen = set(checkpoint.seen_guids)
+    return [it for it in items if it.id not in seen]
+
+
+def pending_items(checkpoint: FeedCheckpointDocument) -> List[NewsRecord]:
+    return [NewsRecord.from_payload(raw) for raw in checkpoint.pending]
+
+
+def save_stage(
+    checkpoint: FeedCheckpointDocument,
+    stage: str,
+    items: List[NewsRecord],
+    etag: Optional[str] = None,
+    modified: Optional[str] = None,
+) -> None:
+    """
+    Persist `items` as in flight at `stage` (a stage with nothing in flight is idle).
+    """
+    if etag is not None:
+        checkpoint.etag = etag
+    if modified is not None:
+        checkpoint.modified = modified
+    checkpoint.stage = stage if items else "idle"
+    checkpoint.pending = [it.to_payload() for it in items]
+    checkpoint.updated_at = datetime.now(timezone.utc)
+    checkpoint.save()
+
+
+def mark_done(checkpoint: FeedCheckpointDocument, items: List[NewsRecord]) -> None:
+    """
+    Record `items` as processed and clear the in-flight state.
+    """
+    seen = list(checkpoint.seen_guids)
+    known = set(seen)
+    seen.extend(it.id for it in items if it.id not in known)
+    checkpoint.seen_guids = seen[-settings.FEED_CHECKPOINT_MAX_GUIDS:]
+    published = [it.published_at for it in items if it.published_at]
+    if published:
+        latest = max(published)
+        if checkpoint.last_published is None or latest > checkpoint.last_published:
+            checkpoint.last_published = latest
+    save_stage(checkpoint, "idle", [])
@@ -2,48 +2,293 @@
 """
 Classifier service.
 
-Tries to use a pluggable LLM (GroqClient) if present; otherwise falls back to a simple
-keyword-based classifier. Returns a list of category labels as strings.
+Tries a local model (LocalClassifier) and/or a pluggable LLM (GroqClient) if present;
+otherwise falls back to a simple keyword-based classifier. Returns a list of
+category labels as strings. build_classifier() wires the backend selected by
+CLASSIFIER_BACKEND (groq | local | cascade).
+
+In cascade mode a cheap first tier (the local model, or the keyword matcher
+when no model is trained) labels everything, and only items whose confidence
+is below CASCADE_THRESHOLD are sent to Groq. Per-tier hits and latency are
+recorded in `classifier_stats`.
+
+classify_many() classifies a batch concurrently over the async Groq client,
+bounded by a semaphore (CLASSIFY_CONCURRENCY) and the active cycle deadline.
 """
 
-from typing import List, Optional
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import asyncio
 import re
 import logging
+import time
 
 from app.infrastructure.groq_client import GroqClient
+from app.infrastructure.local_classifier import LocalClassifier
 from app.domain.interfaces import ClassifierInterface
-from app.core.config import Settings
+from app.core.config import Settings, get_settings
+from app.core.resilience import remaining_time
+from app.domain.labels import primary_label
 
 logger = logging.getLogger(__name__)
 
+
+class ClassifierStats:
+    """
+    Per-tier hit counts and cumulative latency (process-local).
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._hits: Dict[str, int] = {}
+        self._seconds: Dict[str, float] = {}
+
+    def record(self, tier: str, hits: int, seconds: float) -> None:
+        if hits <= 0:
+            return
+        with self._lock:
+            self._hits[tier] = self._hits.get(tier, 0) + hits
+            self._seconds[tier] = self._seconds.get(tier, 0.0) + seconds
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            total = sum(self._hits.values()) or 1
+            return {
+                tier: {
+                    "hits": hits,
+                    "share": hits / total,
+                    "avg_latency_ms": 1000 * self._seconds[tier] / hits,
+                }
+                for tier, hits in self._hits.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hits.clear()
+            self._seconds.clear()
+
+
+classifier_stats = ClassifierStats()
+
+
+def _text(title: str, summary: Optional[str]) -> str:
+    return f"{title}\n{summary or ''}".lower()
+
+
 class ClassifierService(ClassifierInterface):
     """
-    Pluggable classifier which accepts an optional GroqClient instance.
+    Pluggable classifier which accepts an optional GroqClient and/or LocalClassifier instance.
+
+    Every tier produces multi-label scores (category -> confidence); the
+    single-label methods return the highest-scoring category. `threshold`
+    gates the first tier: a local (or, with keyword_first, keyword) result is
+    accepted only when its best score is at least `threshold`.
     """
 
-    def __init__(self, classifier: Optional[GroqClient] = None):
+    def __init__(
+        self,
+        classifier: Optional[GroqClient] = None,
+        local: Optional[LocalClassifier] = None,
+        threshold: float = 0.0,
+        keyword_first: bool = False,
+    ):
         self.classifier = classifier
+        self.local = local
+        self.threshold = threshold
+        self.keyword_first = keyword_first
 
-    def classify(self, title: str, summary: str = "", settings: Settings=Settings()) -> str:
+    def classify(self, title: str, summary: str = "", settings: Optional[Settings] = None, priority: str = "normal") -> str:
         """
         Return list of categories for the provided title/summary.
+
+        `priority` (high | normal | low) controls how long the call may wait for
+        Groq rate-limit budget; low-priority items are shed to the keyword fallback.
+        """
+        return primary_label(self.classify_scores(title, summary, settings or get_settings(), priority))
+
+    def classify_scores(self, title: str, summary: str, settings: Settings, priority: str = "normal") -> Dict[str, float]:
+        """
+        Multi-label variant of classify(): category -> confidence.
+        """
+        text = _text(title, summary)
+        scores = self._first_tier([text], settings)[0]
+        if scores is not None:
+            return scores
+
+        # Try LLM next
+        if self.classifier:
+            try:
+                started = time.perf_counter()
+                scores = self.classifier.classify_scores(text, settings, priority=priority)
+                if scores:
+                    classifier_stats.record("groq", 1, time.perf_counter() - started)
+                    logger.info("Classified via Groq: %s", primary_label(scores))
+                    return scores
+            except Exception as exc:
+                logger.warning("Groq classification failed, falling back to keyword classifier: %s", exc)
+
+        return self._fallback(text, settings)
+
+    async def aclassify_scores(self, title: str, summary: str, settings: Settings, priority: str = "normal") -> Dict[str, float]:
+        """
+        Async LLM path (first tier not included; see classify_many) using the async Groq client.
         """
-        text = f"{title}\n{summary}".lower()
-        # Try LLM first
+        return (await self._aclassify_tiered(title, summary, settings, priority))[0]
+
+    async def _aclassify_tiered(self, title: str, summary: str, settings: Settings, priority: str) -> Tuple[Dict[str, float], str]:
+        text = _text(title, summary)
         if self.classifier:
             try:
-                label = self.classifier.classify(text, settings)
-                if label:
-                    logger.info("Classified via Groq: %s", label)
-                    return label
+                started = time.perf_counter()
+                scores = await self.classifier.aclassify_scores(text, settings, priority=priority)
+                if scores:
+                    classifier_stats.record("groq", 1, time.perf_counter() - started)
+                    logger.debug("Classified via Groq: %s", primary_label(scores))
+                    return scores, "groq"
             except Exception as exc:
                 logger.warning("Groq classification failed, falling back to keyword classifier: %s", exc)
-    
+
+        return self._fallback(text, settings), "fallback"
+
+    def classify_many(self, items: Sequence[Any], settings: Settings, priority: str = "normal") -> List[str]:
+        """
+        Classify items (anything with .title/.summary) concurrently; returns labels in order.
+        """
+        return [primary_label(scores) for scores in self.classify_many_scores(items, settings, priority)]
+
+    def classify_many_scores(self, items: Sequence[Any], settings: Settings, priority: str = "normal") -> List[Dict[str, float]]:
+        """
+        Multi-label scores for each item, in order.
+
+        Runs its own event loop, so call it from sync code (scheduler thread,
+        threadpool, worker process). Items still pending at the deadline fall
+        back to the keyword classifier.
+        """
+        return [scores for scores, _ in self.classify_many_tiered(items, settings, priority)]
+
+    def classify_many_tiered(self, items: Sequence[Any], settings: Settings, priority: str = "normal") -> List[Tuple[Dict[str, float], str]]:
+        """
+        Like classify_many_scores(), with the tier that produced each result
+        (local | keyword | groq | fallback), so callers can tell degraded
+        keyword-fallback labels from real ones.
+        """
+        if not items:
+            return []
+        first_tier = "local" if self.local else "keyword"
+        results: List[Optional[Tuple[Dict[str, float], str]]] = [
+            (scores, first_tier) if scores is not None else None
+            for scores in self._first_tier([_text(it.title, it.summary) for it in items], settings)
+        ]
+
+        rest = [idx for idx, result in enumerate(results) if result is None]
+        if rest and self.classifier is not None:
+            rest_results = asyncio.run(self._classify_many_async([items[idx] for idx in rest], settings, priority=priority))
+        else:
+            rest_results = [(self._fallback(_text(items[idx].title, items[idx].summary), settings), "fallback") for idx in rest]
+        for idx, result in zip(rest, rest_results):
+            results[idx] = result
+        return results
+
+    async def _classify_many_async(self, items: Sequence[Any], settings: Settings, priority: str = "normal") -> List[Tuple[Dict[str, float], str]]:
+        semaphore = asyncio.Semaphore(max(settings.CLASSIFY_CONCURRENCY, 1))
+
+        async def _one(it: Any) -> Tuple[Dict[str, float], str]:
+            async with semaphore:
+                return await self._aclassify_tiered(it.title, it.summary or "", settings, priority)
+
+        tasks = [asyncio.create_task(_one(it)) for it in items]
+        try:
+            # stop waiting at the cycle deadline (if any) and cancel what is still in flight
+            _, pending = await asyncio.wait(tasks, timeout=remaining_time())
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                logger.warning("classify_many: %d/%d items cancelled at deadline; using keyword fallback", len(pending), len(items))
+        finally:
+            # the loop ends with this batch; don't leak its connection pool
+            await self.classifier.aclose()
+
+        results = []
+        for it, task in zip(items, tasks):
+            if task.cancelled() or task.exception() is not None:
+                results.append((self._fallback(_text(it.title, it.summary), settings), "fallback"))
+            else:
+                results.append(task.result())
+        logger.info("classify_many: classified %d items", len(items))
+        return results
+
+    def _first_tier(self, texts: Sequence[str], settings: Settings) -> List[Optional[Dict[str, float]]]:
+        """
+        Scores accepted by the cheap tier (None where the item must go further).
+        """
+        if not self.local and not self.keyword_first:
+            return [None] * len(texts)
+        started = time.perf_counter()
+        if self.local:
+            predictions = self.local.predict_scores(texts)
+        else:
+            predictions = [self._match_keywords(text, settings) for text in texts]
+        results = [
+            scores if scores and max(scores.values()) >= self.threshold else None
+            for scores in predictions
+        ]
+        accepted = sum(1 for scores in results if scores is not None)
+        # batch latency is attributed evenly across the items it labeled
+        classifier_stats.record("local" if self.local else "keyword", accepted, (time.perf_counter() - started) * accepted / max(len(texts), 1))
+        return results
+
+    def _match_keywords(self, text: str, settings: Settings) -> Dict[str, float]:
+        return {
+            keyword: 1.0
+            for keyword in (k.strip().lower() for k in settings.KEYWORDS.split(","))
+            if keyword and re.search(rf"\b{re.escape(keyword)}\b", text)
+        }
+
+    def _fallback(self, text: str, settings: Settings) -> Dict[str, float]:
         # Fallback: simple keyword matching
-        for keyword in settings.KEYWORDS.split(","):
-            keyword = keyword.strip().lower()
-            if re.search(rf"\b{re.escape(keyword)}\b", text):
-                logger.info("Classified via keyword match: %s", keyword)
-                return keyword 
-        logger.info("No classification match found; returning 'uncategorized'")
-        return "uncategorized"
+        started = time.perf_counter()
+        scores = self._match_keywords(text, settings)
+        classifier_stats.record("fallback", 1, time.perf_counter() - started)
+        if scores:
+            logger.info("Classified via keyword match: %s", ", ".join(scores))
+        else:
+            logger.info("No classification match found; returning 'uncategorized'")
+        return scores
+
+
+def build_classifier(settings: Settings) -> ClassifierService:
+    """
+    Build the ClassifierService for the configured CLASSIFIER_BACKEND.
+
+    - groq: Groq LLM (when GROQ_API_KEY is set), keyword fallback
+    - local: LocalClassifier loaded from LOCAL_MODEL_PATH, keyword fallback
+    - cascade: local model (or keyword matcher) first; items below
+      CASCADE_THRESHOLD confidence go to Groq
+    """
+    backend = settings.CLASSIFIER_BACKEND.lower()
+    local = None
+    if backend in ("local", "cascade"):
+        if Path(settings.LOCAL_MODEL_PATH).exists():
+            local = LocalClassifier.load(settings.LOCAL_MODEL_PATH)
+            logger.info("Loaded local classifier from %s (%d labels)", settings.LOCAL_MODEL_PATH, len(local.labels))
+        else:
+            logger.warning(
+                "CLASSIFIER_BACKEND=%s but %s does not exist; run `uv run train-classifier`",
+                backend, settings.LOCAL_MODEL_PATH,
+            )
+
+    if backend == "cascade":
+        groq = GroqClient(settings.GROQ_API_KEY) if settings.GROQ_API_KEY else None
+        return ClassifierService(
+            classifier=groq,
+            local=local,
+            threshold=settings.CASCADE_THRESHOLD,
+            keyword_first=local is None,
+        )
+
+    groq = None
+    if settings.GROQ_API_KEY and local is None:
+        groq = GroqClient(settings.GROQ_API_KEY)
+    return ClassifierService(classifier=groq, local=local)
@@ -0,0 +1,136 @@
+# app/services/exporter.py
+"""
+Streaming bulk export of news items and alerts.
+
+Documents are read from a Mongo cursor in `_id` order with a bounded batch
+size and yielded as NDJSON or CSV chunks, so memory stays constant no matter
+how many documents match. Every record carries its `id`; pass the last id you
+received as `after` to resume an interrupted export.
+"""
+
+from datetime import datetime
+from typing import Iterator, List, Optional
+import csv
+import io
+import logging
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from app.core.db import read_collection
+from app.core.serialization import dumps
+from app.domain.labels import decode_scores
+from app.models.alert_doc import AlertDocument
+from app.models.news_item_doc import NewsItemDocument
+
+logger = logging.getLogger(__name__)
+
+NEWS_EXPORT_FIELDS = ["id", "title", "summary", "link", "source", "category", "published_at", "scores"]
+ALERT_EXPORT_FIELDS = ["id", "news_id", "to", "subject", "sent", "error", "sent_at"]
+
+
+def _range(field: str, since: Optional[datetime], until: Optional[datetime]) -> dict:
+    bounds = {}
+    if since:
+        bounds["$gte"] = since
+    if until:
+        bounds["$lt"] = until
+    return {field: bounds} if bounds else {}
+
+
+def _encode(rows: Iterator[dict], fields: List[str], fmt: str, batch_size: int) -> Iterator[bytes]:
+    """
+    Serialize rows as NDJSON or CSV, yielding one chunk per `batch_size` rows.
+    """
+    buffer = io.StringIO()
+    chunk: List[bytes] = []
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore") if fmt == "csv" else None
+    if writer is not None:
+        writer.writeheader()
+
+    def flush() -> bytes:
+        data = buffer.getvalue().encode("utf-8") + b"".join(chunk)
+        buffer.seek(0)
+        buffer.truncate()
+        chunk.clear()
+        return data
+
+    for count, row in enumerate(rows, start=1):
+        if writer is not None:
+            for key, value in row.items():
+                if isinstance(value, datetime):
+                    row[key] = value.isoformat()
+                elif isinstance(value, dict):
+                    row[key] = dumps(value).decode("utf-8")
+            writer.writerow(row)
+        else:
+            chunk.append(dumps(row) + b"\n")
+        if count % batch_size == 0:
+            yield flush()
+
+    tail = flush()
+    if tail:
+        yield tail
+
+
+def iter_news_export(
+    fmt: str = "ndjson",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    after: Optional[str] = None,
+    batch_size: int = 500,
+) -> Iterator[bytes]:
+    """
+    Stream news items published in [since, until), in id order, after id `after`.
+    """
+    query = _range("published_at", since, until)
+    if after:
+        query["_id"] = {"$gt": after}
+    projection = {field: 1 for field in NEWS_EXPORT_FIELDS if field != "id"}
+    cursor = (
+        read_collection(NewsItemDocument._get_collection())
+        .find(query, projection)
+        .sort("_id", 1)
+        .batch_size(batch_size)
+    )
+
+    def rows():
+        try:
+            for doc in cursor:
+                doc["id"] = doc.pop("_id")
+                doc["scores"] = decode_scores(doc.get("scores"))
+                yield doc
+        finally:
+            cursor.close()
+
+    return _encode(rows(), NEWS_EXPORT_FIELDS, fmt, batch_size)
+
+
+def iter_alerts_export(
+    fmt: str = "ndjson",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    after: Optional[str] = None,
+    batch_size: int = 500,
+) -> Iterator[bytes]:
+    """
+    Stream alerts sent in [since, until), in id order, after id `after`.
+    """
+    query = _range("sent_at", since, until)
+    if after:
+        try:
+            query["_id"] = {"$gt": ObjectId(after)}
+        except InvalidId:
+            raise ValueError("invalid resume token")
+    projection = {field: 1 for field in ALERT_EXPORT_FIELDS if field != "id"}
+    cursor = read_collection(AlertDocument._get_collection()).find(query, projection).sort("_id", 1).batch_size(batch_size)
+
+    def rows():
+        try:
+            for doc in cursor:
+                doc["id"] = str(doc.pop("_id"))
+                yield doc
+        finally:
+            cursor.close()
+
+    return _encode(rows(), ALERT_EXPORT_FIELDS, fmt, batch_size)
@@ -0,0 +1,134 @@
+# app/services/jobs.py
+"""
+Job handlers for the queue-based scheduler (SCHEDULER_MODE=nuvom).
+
+The ingestion cycle is split into independent tasks so it can be spread over
+a pool of worker processes:
+
+- fetch_feed: fetch one RSS feed and enqueue classify jobs for its items
+- classify_items: classify a batch of items and store the new ones
+- send_alert: send one alert email for a stored news item
+- apply_retention: archive/expire old documents (once per RETENTION_INTERVAL_SECONDS)
+- rebuild_aggregates: recompute the dashboard counters from scratch
+
+High-priority items (app.services.priority) travel in their own classify
+jobs, queued ahead of regular work, whose new items get a send_alert job
+each at the same priority.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, List
+import logging
+
+from app.core.config import settings
+from app.core.jobqueue import enqueue, register_task
+from app.domain.records import NewsRecord
+from app.domain.labels import primary_label
+from app.infrastructure import rss_client
+from app.services.checkpoints import load_checkpoint, mark_done, unseen
+from app.infrastructure.smtp_emailer import SMTPEmailer
+from app.services.alert_sender import send_alert_for_news
+from app.services.classifier import ClassifierService, build_classifier
+from app.services.news_fetcher import store_items
+from app.services.retention import apply_retention, retention_due
+from app.services.aggregates import rebuild_aggregates
+from app.services.priority import JOB_PRIORITY, alert_recipient, split_priority, stored_ids
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache()
+def _classifier() -> ClassifierService:
+    return build_classifier(settings)
+
+
+@lru_cache()
+def _emailer() -> SMTPEmailer:
+    return SMTPEmailer.from_settings(settings)
+
+
+def enqueue_fetch_jobs() -> int:
+    """
+    Enqueue one fetch_feed job per configured feed (skipping feeds whose
+    previous fetch is still pending). Returns the number of jobs enqueued.
+    """
+    count = 0
+    priority_feeds = set(settings.priority_feed_list)
+    for url in settings.rss_feed_list:
+        priority = JOB_PRIORITY if url in priority_feeds else 0
+        if enqueue("fetch_feed", {"url": url}, priority=priority, dedupe_key=f"fetch:{url}"):
+            count += 1
+    if retention_due():
+        enqueue("apply_retention", {}, priority=-1, dedupe_key="retention")
+    logger.info("Enqueued %d fetch jobs", count)
+    return count
+
+
+@register_task("fetch_feed")
+def fetch_one_feed(payload: Dict[str, Any]) -> Dict[str, Any]:
+    url = payload["url"]
+    limit = payload.get("limit", 5)
+    checkpoint = load_checkpoint(url)
+    fetch = rss_client.fetch_feed(url, checkpoint.etag, checkpoint.modified)
+    items = unseen(checkpoint, fetch.items)[:limit]
+
+    batch_size = settings.QUEUE_CLASSIFY_BATCH_SIZE
+    high, normal = split_priority(items)
+    jobs = 0
+    for start in range(0, len(high), batch_size):
+        batch = [it.to_payload() for it in high[start:start + batch_size]]
+        enqueue("classify_items", {"items": batch, "priority": "high"}, priority=JOB_PRIORITY)
+        jobs += 1
+    for start in range(0, len(normal), batch_size):
+        batch = [it.to_payload() for it in normal[start:start + batch_size]]
+        enqueue("classify_items", {"items": batch})
+        jobs += 1
+    # the queued jobs own the items from here on; remember them as processed
+    checkpoint.etag, checkpoint.modified = fetch.etag, fetch.modified
+    mark_done(checkpoint, items)
+    return {"url": url, "fetched": len(items), "classify_jobs": jobs}
+
+
+@register_task("classify_items")
+def classify_items(payload: Dict[str, Any]) -> Dict[str, Any]:
+    items: List[NewsRecord] = [NewsRecord.from_payload(raw) for raw in payload.get("items", [])]
+    priority = payload.get("priority", "normal")
+    results = _classifier().classify_many_scores(items, settings=settings, priority=priority)
+    for it, scores in zip(items, results):
+        it.scores = scores
+        it.category = primary_label(scores)
+    added = store_items(items)
+    alerts = 0
+    if priority == "high" and added:
+        ids = stored_ids(added)
+        for it in added:
+            if it.link in ids:
+                enqueue(
+                    "send_alert",
+                    {"news_id": ids[it.link], "to": alert_recipient(), "priority": priority, "fetched_at": it.fetched_at},
+                    priority=JOB_PRIORITY,
+                )
+                alerts += 1
+    return {"classified": len(items), "added": len(added), "ids": [it.id for it in added], "alerts": alerts}
+
+
+@register_task("send_alert")
+def send_alert(payload: Dict[str, Any]) -> Dict[str, Any]:
+    to = payload.get("to") or settings.ALERT_EMAIL_TO
+    record = send_alert_for_news(
+        _emailer(), payload["news_id"], to, priority=payload.get("priority"), fetched_at=payload.get("fetched_at")
+    )
+    if not record.get("sent"):
+        # raise so the queue retries according to the job's policy
+        raise RuntimeError(record.get("error") or "alert not sent")
+    return {"news_id": record["news_id"], "to": record["to"], "sent": True}
+
+
+@register_task("apply_retention")
+def retention(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {"archived": apply_retention()}
+
+
+@register_task("rebuild_aggregates")
+def rebuild_stats(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return rebuild_aggregates()
@@ -3,58 +3,149 @@
 News fetcher service.
 
 Responsibilities:
-- fetch_and_process(classifier) -> List[NewsItem] (unchanged)
-- store_items(items) -> List[NewsItem] (unchanged)
+- fetch_and_process(classifier) -> List[NewsRecord]
+- store_items(items) -> List[NewsRecord]
 - list_news() -> List[NewsItem] (unchanged)
 - get_news_by_id(news_id) -> Optional[NewsItem] (NEW)
 - list_news_paginated(limit, offset) -> List[NewsItem] (NEW)
+- list_news_raw(limit, offset) -> List[dict] (projection-only fast path for list endpoints)
+- store_items_bulk(items) -> (added, duplicates, failures) (one insert_many per batch)
+
+The write path works on NewsRecord (no validation); read paths return NewsItem.
 """
 
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
 import logging
 import math
+import re
 import uuid
 import mongoengine.errors
+from pymongo.errors import BulkWriteError, PyMongoError
 
-from app.infrastructure.rss_client import fetch_all_configured
+from app.infrastructure.rss_client import fetch_feed
 from app.services.classifier import ClassifierService
 from app.domain.entities import NewsItem
+from app.domain.records import NewsRecord
+from app.domain.labels import decode_scores, encode_scores, primary_label, quantize, topic_bit
 from app.core.config import settings
 from app.models.news_item_doc import NewsItemDocument
+from app.models.feed_checkpoint_doc import FeedCheckpointDocument
+from app.services.checkpoints import load_checkpoint, mark_done, pending_items, save_stage, unseen
+from app.core.resilience import deadline, get_breaker
+from app.core.db import bulk_collection, read_collection
+from app.core.ingest_log import get_ingest_log
+from app.services.trends import get_trend_detector
+from app.services.aggregates import record_items
 
 logger = logging.getLogger(__name__)
 
 
-def store_items(items: List[NewsItem]) -> List[NewsItem]:
+def _to_news_item(doc: NewsItemDocument) -> NewsItem:
+    return NewsItem(
+        id=doc.id,
+        title=doc.title,
+        summary=doc.summary,
+        link=doc.link,
+        source=doc.source,
+        category=doc.category,
+        published_at=doc.published_at,
+        scores=decode_scores(doc.scores),
+    )
+
+
+def store_items(items: List[NewsRecord]) -> List[NewsRecord]:
     """
     Persist new items into Mongo (idempotent). Returns added items.
     """
     added = []
-    for it in items:
-        # ensure link is a plain string (mongodb validation)
-        link = str(it.link) if it.link else None
-        id= str(uuid.uuid4())
-        doc = NewsItemDocument.objects(id=id).first()
-        if not doc:
-            doc = NewsItemDocument(
-                id=id,
-                title=it.title,
-                summary=it.summary,
-                link=link,
-                source=it.source,
-                category=getattr(it, "category", None),
-                published_at=it.published_at,
-            )
-            try:
-                doc.save()
-            except mongoengine.errors.NotUniqueError:
-                # already exists skip it
+    # open circuit -> CircuitOpenError; the cycle fails fast instead of timing out per item
+    with get_breaker("mongo", failure_exceptions=(PyMongoError,)):
+        topics = settings.topic_list
+        for it in items:
+            if not it.link:
+                # link is required (and the dedupe key); clean_link() drops non-http(s) ones
+                logger.warning("store_items: skipping %r without a usable link", it.title)
                 continue
-            added.append(it)
+            mask, scores = encode_scores(it.scores, topics, settings.LABEL_SCORE_THRESHOLD)
+            id= str(uuid.uuid4())
+            doc = NewsItemDocument.objects(id=id).first()
+            if not doc:
+                doc = NewsItemDocument(
+                    id=id,
+                    title=it.title,
+                    summary=it.summary,
+                    link=it.link,
+                    source=it.source,
+                    category=getattr(it, "category", None),
+                    published_at=it.published_at,
+                    category_mask=mask,
+                    scores=scores,
+                )
+                try:
+                    doc.save()
+                except mongoengine.errors.NotUniqueError:
+                    # already exists skip it
+                    continue
+                except mongoengine.errors.ValidationError as exc:
+                    # one malformed item must not fail the batch (and wedge its feed checkpoint)
+                    logger.warning("store_items: skipping invalid item %r: %s", it.title, exc)
+                    continue
+                added.append(it)
+    record_items(added)
     logger.info("store_items: added=%d", len(added))
     return added
 
 
+def store_items_bulk(items: List[NewsRecord]) -> Tuple[List[NewsRecord], int, List[Tuple[int, str]]]:
+    """
+    Insert a batch with a single unordered insert_many.
+
+    Items keep their own id as `_id`. Returns (added items, duplicate count,
+    [(index, error)] for other per-item failures).
+    """
+    if not items:
+        return [], 0, []
+
+    topics = settings.topic_list
+    now = datetime.now(timezone.utc)
+    docs = []
+    for it in items:
+        mask, scores = encode_scores(it.scores, topics, settings.LABEL_SCORE_THRESHOLD)
+        docs.append({
+            "_id": it.id,
+            "title": it.title,
+            "summary": it.summary,
+            "link": it.link,
+            "source": it.source,
+            "category": it.category,
+            # same defaults as NewsItemDocument (insert_many bypasses mongoengine)
+            "published_at": it.published_at or now,
+            "ingested_at": now,
+            "category_mask": mask,
+            "scores": scores,
+        })
+
+    failed_idx = set()
+    duplicates = 0
+    failures: List[Tuple[int, str]] = []
+    with get_breaker("mongo", failure_exceptions=(PyMongoError,)):
+        try:
+            bulk_collection(NewsItemDocument._get_collection()).insert_many(docs, ordered=False)
+        except BulkWriteError as exc:
+            for err in exc.details.get("writeErrors", []):
+                failed_idx.add(err["index"])
+                if err.get("code") == 11000:
+                    duplicates += 1
+                else:
+                    failures.append((err["index"], err.get("errmsg", "write error")))
+
+    added = [it for idx, it in enumerate(items) if idx not in failed_idx]
+    record_items(added)
+    logger.info("store_items_bulk: added=%d duplicates=%d failed=%d", len(added), duplicates, len(failures))
+    return added, duplicates, failures
+
+
 def list_news() -> List[NewsItem]:
     """
     Return all news items (descending by published_at).
@@ -62,17 +153,7 @@ def list_news() -> List[NewsItem]:
     """
     items: List[NewsItem] = []
     for doc in NewsItemDocument.objects.order_by("published_at"):
-        items.append(
-            NewsItem(
-                id=doc.id,
-                title=doc.title,
-                summary=doc.summary,
-                link=doc.link,
-                source=doc.source,
-                category=doc.category,
-                published_at=doc.published_at,
-            )
-        )
+        items.append(_to_news_item(doc))
     return items
 
 
@@ -83,50 +164,230 @@ def get_news_by_id(news_id: str) -> Optional[NewsItem]:
     doc = NewsItemDocument.objects(id=news_id).first()
     if not doc:
         return None
-    return NewsItem(
-        id=doc.id,
-        title=doc.title,
-        summary=doc.summary,
-        link=doc.link,
-        source=doc.source,
-        category=doc.category,
-        published_at=doc.published_at,
-    )
+    return _to_news_item(doc)
+
+
+# categories that may be used in a `scores.<category>` field path (no ".", "$", ...)
+_CATEGORY = re.compile(r"^[a-z0-9_-]+$")
 
 
-def list_news_paginated(limit: int = 50, offset: int = 0) -> List[NewsItem]:
+def score_filter(category: Optional[str] = None, min_score: Optional[float] = None) -> dict:
+    """
+    Raw Mongo filter for "has category X" / "category X with score > min_score".
+
+    Uses the quantized `scores.<category>` field (wildcard-indexed) for score
+    thresholds and the `category_mask` bit for configured topics. Raises
+    ValueError for a category that is neither a configured topic nor a plain
+    [a-z0-9_-] name, since it becomes part of a field path.
+    """
+    if not category:
+        return {}
+    category = category.lower()
+    if category not in settings.topic_list and not _CATEGORY.match(category):
+        raise ValueError(f"invalid category {category!r}: use a configured topic or letters, digits, '_' and '-'")
+    if min_score is not None:
+        return {f"scores.{category}": {"$gt": quantize(min_score)}}
+    bit = topic_bit(category, settings.topic_list)
+    if bit is not None:
+        return {"category_mask": {"$bitsAllSet": bit}}
+    return {"$or": [{"category": category}, {f"scores.{category}": {"$exists": True}}]}
+
+
+def list_news_paginated(
+    limit: int = 50,
+    offset: int = 0,
+    category: Optional[str] = None,
+    min_score: Optional[float] = None,
+) -> List[NewsItem]:
     """
     Paginated read (limit, offset). Use for UI to avoid loading whole collection.
+    Optionally filtered by category / minimum category score (evaluated in MongoDB).
     """
-    qs = NewsItemDocument.objects.order_by("-published_at").skip(offset).limit(limit)
+    qs = NewsItemDocument.objects(__raw__=score_filter(category, min_score))
+    qs = qs.order_by("-published_at").skip(offset).limit(limit)
     items = []
     for doc in qs:
-        items.append(
-            NewsItem(
-                id=doc.id,
-                title=doc.title,
-                summary=doc.summary,
-                link=doc.link,
-                source=doc.source,
-                category=doc.category,
-                published_at=doc.published_at,
-            )
-        )
+        items.append(_to_news_item(doc))
     return items
 
 
-def fetch_and_process(classifier: ClassifierService) -> List[NewsItem]:
+# Fields returned by list endpoints (everything the dashboard needs)
+NEWS_LIST_FIELDS = ("title", "summary", "link", "source", "category", "published_at", "ingested_at", "scores")
+
+
+def since_filter(since: Optional[datetime], since_id: Optional[str] = None) -> dict:
+    """
+    Items stored after the (ingested_at, id) cursor of the last item a client saw.
+    Pair with a sort on (ingested_at, _id) ascending. The cursor is not
+    gap-free under concurrent writers; see GET /news/ for the overlap window.
+    """
+    if since is None:
+        return {}
+    if since_id is None:
+        return {"ingested_at": {"$gt": since}}
+    return {"$or": [{"ingested_at": {"$gt": since}}, {"ingested_at": since, "_id": {"$gt": since_id}}]}
+
+
+def _raw_news(doc: dict) -> dict:
+    doc["id"] = doc.pop("_id")
+    doc["scores"] = decode_scores(doc.get("scores"))
+    return doc
+
+
+def list_news_raw(
+    limit: int = 50,
+    offset: int = 0,
+    category: Optional[str] = None,
+    min_score: Optional[float] = None,
+    fields=NEWS_LIST_FIELDS,
+) -> List[dict]:
+    """
+    Fast read path for list endpoints: queries pymongo directly with a field
+    projection and returns plain dicts (no Document hydration, no Pydantic).
+    """
+    cursor = (
+        read_collection(NewsItemDocument._get_collection())
+        .find(score_filter(category, min_score), {field: 1 for field in fields})
+        .sort("published_at", -1)
+        .skip(offset)
+        .limit(limit)
+    )
+    return [_raw_news(doc) for doc in cursor]
+
+
+def _fetch_stage(
+    limit_per_feed: int,
+    urls: Optional[List[str]] = None,
+) -> List[Tuple[FeedCheckpointDocument, List[NewsRecord]]]:
+    """
+    Per feed (default: all configured feeds): resume in-flight items from its
+    checkpoint, or fetch (conditional GET) and keep only unseen entries.
+    Failing feeds are skipped.
+    """
+    feeds = []
+    for url in settings.rss_feed_list if urls is None else urls:
+        try:
+            checkpoint = load_checkpoint(url)
+            if checkpoint.stage != "idle" and checkpoint.pending:
+                items = pending_items(checkpoint)
+                logger.info("Resuming %s at stage %s (%d items)", url, checkpoint.stage, len(items))
+            else:
+                fetch = fetch_feed(url, checkpoint.etag, checkpoint.modified)
+                items = unseen(checkpoint, fetch.items)[:limit_per_feed]
+                save_stage(checkpoint, "fetched", items, etag=fetch.etag, modified=fetch.modified)
+            feeds.append((checkpoint, items))
+        except Exception:
+            logger.exception("Failed to fetch feed %s", url)
+    return feeds
+
+
+def _classify(classifier: ClassifierService, items: List[NewsRecord], priority: str = "normal") -> None:
+    # classify concurrently; the cycle deadline cancels stragglers (keyword fallback)
+    with deadline(settings.CYCLE_DEADLINE_SECONDS):
+        results = classifier.classify_many_scores(items, settings=settings, priority=priority)
+    for it, scores in zip(items, results):
+        it.scores = scores
+        it.category = primary_label(scores)
+
+
+def _fast_lane(classifier: ClassifierService, feeds) -> Tuple[List[NewsRecord], List[NewsRecord]]:
     """
-    Fetch all configured RSS feeds, classify each item and store new ones.
-    Returns newly added items.
+    Classify, store and alert the freshly fetched high-priority items ahead of
+    everything else. Returns (new high-priority items, remaining items).
+    """
+    # imported here: alert_sender (used by priority) imports this module
+    from app.services.priority import send_priority_alerts, split_priority
+
+    high, rest = [], []
+    for checkpoint, items in feeds:
+        if checkpoint.stage != "fetched":
+            rest.extend(items)
+            continue
+        fast, normal = split_priority(items)
+        high.extend(fast)
+        rest.extend(normal)
+    if not high:
+        return [], rest
+
+    logger.info("Fast lane: %d high-priority items", len(high))
+    _classify(classifier, high, priority="high")
+    new = store_items(high)
+    send_priority_alerts(new)
+    return new, rest
+
+
+def fetch_and_process(
+    classifier: ClassifierService,
+    limit_per_feed: int = 5,
+    urls: Optional[List[str]] = None,
+    use_log: bool = True,
+) -> List[NewsRecord]:
+    """
+    Fetch the RSS feeds (default: all configured), classify each item and
+    store new ones. Returns newly added items.
+
+    High-priority items (app.services.priority) are classified, stored and
+    alerted before the rest. Progress is checkpointed per feed
+    (app.services.checkpoints), so an interrupted cycle resumes without
+    refetching or reclassifying. With INGEST_LOG_ENABLED, the remaining
+    items go through the on-disk ingestion log. The log has a single
+    writer and consumer (the main cycle, run by the leader), so other
+    callers (the priority cycle, POST /news/fetch), which may run in other
+    processes, pass use_log=False and classify + store directly.
     """
     logger.info("Starting fetch_and_process")
-    fetched = fetch_all_configured()
-    logger.info("Fetched %d items", len(fetched))
-    # classify
-    for it in fetched:
-        # classifier.classify may be blocking; this function stays sync
-        it.category = classifier.classify(title=it.title, summary=it.summary or "", settings=settings)
-    new = store_items(fetched)
+    feeds = _fetch_stage(limit_per_feed, urls)
+    urgent, rest = _fast_lane(classifier, feeds)
+    if settings.INGEST_LOG_ENABLED and use_log:
+        get_trend_detector().observe(urgent)
+        _append_to_log(feeds, rest)
+        return urgent + _process_via_log(classifier)
+
+    to_classify = [
+        it for checkpoint, items in feeds if checkpoint.stage == "fetched" for it in items if it.priority != "high"
+    ]
+    logger.info("Fetched %d items (%d to classify)", sum(len(items) for _, items in feeds), len(to_classify))
+    _classify(classifier, to_classify)
+    for checkpoint, items in feeds:
+        if checkpoint.stage == "fetched":
+            save_stage(checkpoint, "classified", items)
+
+    new = store_items(rest)
+    for checkpoint, items in feeds:
+        mark_done(checkpoint, items)
+    new = urgent + new
+    get_trend_detector().observe(new)
+    logger.info("fetch_and_process: new=%d", len(new))
+    return new or []
+
+
+LOG_CONSUMER = "classify-store"
+
+
+def _append_to_log(feeds, fetched: List[NewsRecord]) -> None:
+    """
+    Append `fetched` items to the ingestion log, which then owns them.
+    """
+    if fetched:
+        get_ingest_log().append(fetched)
+    for checkpoint, items in feeds:
+        mark_done(checkpoint, items)
+    logger.info("Appended %d fetched items to the ingestion log", len(fetched))
+
+
+def _process_via_log(classifier: ClassifierService) -> List[NewsRecord]:
+    """
+    Classify + store the next INGEST_LOG_BATCH records after the committed
+    offset. The offset is committed only after the store succeeded, so items
+    wait in the log while Groq or Mongo is slow or down.
+    """
+    log = get_ingest_log()
+    records, next_offset = log.read(log.committed(LOG_CONSUMER), settings.INGEST_LOG_BATCH)
+    logger.info("Consuming %d records from the ingestion log (lag %d bytes)", len(records), log.lag(LOG_CONSUMER))
+    _classify(classifier, records)
+    new = store_items(records)
+    log.commit(LOG_CONSUMER, next_offset)
+    log.delete_expired(settings.INGEST_LOG_RETENTION_HOURS * 3600)
+    get_trend_detector().observe(new)
     logger.info("fetch_and_process: new=%d", len(new))
     return new or []
@@ -0,0 +1,131 @@
+# app/services/priority.py
+"""
+Priority fast lane for breaking news.
+
+rss_client marks an item priority="high" at parse time when its feed is a
+PRIORITY_SOURCES entry (by URL or feed title) or its title/summary contains
+one of PRIORITY_KEYWORDS. A cycle classifies and stores those items first,
+with high Groq priority, and alerts PRIORITY_ALERT_TO for each new one right
+away instead of waiting for the rest of the batch or a manual trigger.
+Feeds listed by URL are also polled on their own, shorter interval
+(PRIORITY_FETCH_INTERVAL_SECONDS) in background mode; in nuvom mode their
+jobs and alerts are queued ahead of regular work.
+
+Each fast-lane alert stores publish_latency_ms (published -> handed to SMTP)
+and detect_latency_ms (feed parsed -> handed to SMTP) on its AlertDocument;
+latency_report() summarises recent ones for GET /admin/priority.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+from app.core.config import settings
+from app.core.db import read_collection
+from app.domain.records import NewsRecord
+from app.infrastructure.smtp_emailer import SMTPEmailer
+from app.models.alert_doc import AlertDocument
+from app.models.news_item_doc import NewsItemDocument
+from app.services.alert_sender import send_alert_for_news
+
+logger = logging.getLogger(__name__)
+
+# queue priority of fast-lane jobs (regular jobs use 0)
+JOB_PRIORITY = 10
+
+
+@lru_cache()
+def _emailer() -> SMTPEmailer:
+    return SMTPEmailer.from_settings(settings)
+
+
+def split_priority(items: Iterable[NewsRecord]) -> Tuple[List[NewsRecord], List[NewsRecord]]:
+    """
+    (high-priority items, the rest), keeping their order.
+    """
+    high, normal = [], []
+    for it in items:
+        (high if it.priority == "high" else normal).append(it)
+    return high, normal
+
+
+def stored_ids(items: List[NewsRecord]) -> Dict[str, str]:
+    """
+    link -> stored news id for items just written by store_items (which
+    assigns its own ids); one query for the whole batch.
+    """
+    links = [it.link for it in items if it.link]
+    if not links:
+        return {}
+    cursor = NewsItemDocument._get_collection().find({"link": {"$in": links}}, {"link": 1})
+    return {doc["link"]: doc["_id"] for doc in cursor}
+
+
+def alert_recipient() -> str:
+    return settings.PRIORITY_ALERT_TO or settings.ALERT_EMAIL_TO
+
+
+def send_priority_alerts(items: List[NewsRecord], emailer: Optional[SMTPEmailer] = None) -> List[Dict[str, Any]]:
+    """
+    Send one alert per newly stored high-priority item. Failures are recorded
+    on the alert (as for manual alerts) and do not stop the others.
+    """
+    emailer = emailer or _emailer()
+    ids = stored_ids(items)
+    to = alert_recipient()
+    results = []
+    for it in items:
+        news_id = ids.get(it.link)
+        if news_id is None:
+            logger.warning("Priority item %r not found after store; no alert sent", it.title)
+            continue
+        try:
+            results.append(send_alert_for_news(emailer, news_id, to, priority=it.priority, fetched_at=it.fetched_at))
+        except Exception:
+            logger.exception("Priority alert failed for news_id=%s", news_id)
+    logger.info("Sent %d priority alerts", sum(1 for r in results if r.get("sent")))
+    return results
+
+
+def _percentile(values: List[int], pct: float) -> Optional[int]:
+    if not values:
+        return None
+    return values[min(int(len(values) * pct), len(values) - 1)]
+
+
+def _summary(values: List[int]) -> Dict[str, Optional[int]]:
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "p50_ms": _percentile(values, 0.5),
+        "p95_ms": _percentile(values, 0.95),
+        "max_ms": values[-1] if values else None,
+    }
+
+
+def latency_report(limit: int = 500) -> Dict[str, Any]:
+    """
+    Latency of the last `limit` sent fast-lane alerts.
+    """
+    cursor = (
+        read_collection(AlertDocument._get_collection())
+        .find(
+            {"priority": {"$ne": None}, "sent": True},
+            {"_id": 0, "publish_latency_ms": 1, "detect_latency_ms": 1},
+        )
+        .sort("sent_at", -1)
+        .limit(limit)
+    )
+    publish, detect = [], []
+    for doc in cursor:
+        if doc.get("publish_latency_ms") is not None:
+            publish.append(doc["publish_latency_ms"])
+        if doc.get("detect_latency_ms") is not None:
+            detect.append(doc["detect_latency_ms"])
+    return {
+        "sources": settings.priority_source_list,
+        "keywords": settings.priority_keyword_list,
+        "priority_feeds": settings.priority_feed_list,
+        "publish_to_inbox": _summary(publish),
+        "detect_to_inbox": _summary(detect),
+    }
@@ -0,0 +1,124 @@
+# app/services/repositories.py
+"""
+Async MongoDB repositories for the API read path.
+
+Queries go through PyMongo's AsyncMongoClient, so list endpoints run on the
+event loop instead of occupying a threadpool worker per request. Filters,
+projections and result shaping are shared with the sync read path in
+news_fetcher / alert_sender, so both return identical documents.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo.asynchronous.database import AsyncDatabase
+
+from app.core.db import get_async_db
+from app.domain.interfaces import AlertRepository, NewsRepository, StatsRepository
+from app.models.alert_doc import AlertDocument
+from app.models.alert_content_doc import AlertContentDocument
+from app.models.news_item_doc import NewsItemDocument
+from app.models.stats_doc import StatsDocument
+from app.services.alert_sender import ALERT_LIST_PROJECTION, _raw_alert
+from app.services.news_fetcher import NEWS_LIST_FIELDS, _raw_news, score_filter, since_filter
+
+
+class MongoNewsRepository(NewsRepository):
+
+    def __init__(self, db: Optional[AsyncDatabase] = None):
+        self._db = db
+
+    @property
+    def collection(self):
+        return (self._db if self._db is not None else get_async_db())[NewsItemDocument._get_collection_name()]
+
+    async def list_news(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        category: Optional[str] = None,
+        min_score: Optional[float] = None,
+        since: Optional[datetime] = None,
+        since_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        query = score_filter(category, min_score)
+        if since is not None:
+            query = {"$and": [query, since_filter(since, since_id)]}
+            order = [("ingested_at", 1), ("_id", 1)]
+        else:
+            order = [("published_at", -1)]
+        cursor = (
+            self.collection
+            .find(query, {field: 1 for field in NEWS_LIST_FIELDS})
+            .sort(order)
+            .skip(offset)
+            .limit(limit)
+        )
+        return [_raw_news(doc) async for doc in cursor]
+
+    async def get_news(self, news_id: str) -> Optional[Dict[str, Any]]:
+        doc = await self.collection.find_one({"_id": news_id}, {field: 1 for field in NEWS_LIST_FIELDS})
+        return _raw_news(doc) if doc else None
+
+
+class MongoAlertRepository(AlertRepository):
+
+    def __init__(self, db: Optional[AsyncDatabase] = None):
+        self._db = db
+
+    @property
+    def collection(self):
+        return (self._db if self._db is not None else get_async_db())[AlertDocument._get_collection_name()]
+
+    async def list_alerts(self, limit: int = 100, offset: int = 0, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        query = {"sent_at": {"$gt": since}} if since is not None else {}
+        cursor = self.collection.find(query, ALERT_LIST_PROJECTION).sort("sent_at", -1).skip(offset).limit(limit)
+        return [_raw_alert(doc) async for doc in cursor]
+
+    async def get_alert(self, alert_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            oid = ObjectId(alert_id)
+        except InvalidId:
+            return None
+        doc = await self.collection.find_one({"_id": oid}, {**ALERT_LIST_PROJECTION, "body": 1})
+        if not doc:
+            return None
+        alert = _raw_alert(doc)
+        if alert.get("content_id"):
+            db = self._db if self._db is not None else get_async_db()
+            content = await db[AlertContentDocument._get_collection_name()].find_one({"_id": alert["content_id"]}, {"body": 1, "html": 1})
+            alert["body"] = content.get("body") if content else None
+            alert["html"] = content.get("html") if content else None
+        return alert
+
+
+class MongoStatsRepository(StatsRepository):
+
+    def __init__(self, db: Optional[AsyncDatabase] = None):
+        self._db = db
+
+    @property
+    def collection(self):
+        return (self._db if self._db is not None else get_async_db())[StatsDocument._get_collection_name()]
+
+    async def get_stats(self, hours: int = 48) -> Dict[str, Any]:
+        """
+        Totals per category and source plus the last `hours` hourly buckets
+        (two indexed reads of small counter documents).
+        """
+        since = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0, tzinfo=None) - timedelta(hours=hours)
+        projection = {"_id": 0, "kind": 1, "key": 1, "count": 1, "updated_at": 1}
+        stats: Dict[str, Any] = {"total": 0, "categories": {}, "sources": {}, "hourly": [], "updated_at": None}
+        async for doc in self.collection.find({"kind": {"$in": ["total", "category", "source"]}}, projection):
+            if doc["kind"] == "total":
+                stats["total"] = doc["count"]
+                stats["updated_at"] = doc.get("updated_at")
+            elif doc["kind"] == "category":
+                stats["categories"][doc["key"]] = doc["count"]
+            else:
+                stats["sources"][doc["key"]] = doc["count"]
+        cursor = self.collection.find({"kind": "hour", "hour": {"$gte": since}}, {"_id": 0, "hour": 1, "count": 1}).sort("hour", 1)
+        stats["hourly"] = [{"hour": doc["hour"], "count": doc["count"]} async for doc in cursor]
+        return stats
@@ -0,0 +1,197 @@
+# app/services/retention.py
+"""
+Retention for the hot collections (news, alerts, jobs).
+
+Each collection keeps <NAME>_RETENTION_DAYS of documents, measured on a
+per-document timestamp (news.ingested_at, alerts.sent_at, jobs.finished_at).
+News stored before ingested_at existed get it backfilled from published_at
+(or the time of the backfill) so they expire too.
+Alert bodies (alert_contents.last_used_at) follow ALERTS_RETENTION_DAYS, so a
+body lives as long as the newest alert that references it.
+RETENTION_MODE decides what happens to older documents:
+
+- ttl: a TTL index on the timestamp; MongoDB's TTL monitor deletes them
+- collection: apply_retention() moves them to `<collection>_archive`
+- file: apply_retention() appends them to gzip NDJSON files partitioned by
+  day (RETENTION_ARCHIVE_DIR/<collection>/YYYY-MM-DD.ndjson.gz), then deletes
+
+Documents are only deleted from the hot collection after the archive write
+succeeded, so an interrupted run at worst archives a batch twice.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Type
+import gzip
+import logging
+import time
+
+from mongoengine import Document
+from pymongo.errors import BulkWriteError
+
+from app.core.config import settings
+from app.core.serialization import dumps
+from app.models.alert_doc import AlertDocument
+from app.models.alert_content_doc import AlertContentDocument
+from app.models.job_doc import JobDocument
+from app.models.news_item_doc import NewsItemDocument
+
+logger = logging.getLogger(__name__)
+
+RETENTION_MODES = ("ttl", "collection", "file")
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    document: Type[Document]
+    field: str
+    days: int
+    # field to copy into `field` for documents that predate it
+    backfill_from: Optional[str] = None
+
+    @property
+    def collection(self):
+        return self.document._get_collection()
+
+    @property
+    def index_name(self) -> str:
+        return f"{self.field}_ttl"
+
+
+def policies() -> List[RetentionPolicy]:
+    return [
+        RetentionPolicy(NewsItemDocument, "ingested_at", settings.NEWS_RETENTION_DAYS, backfill_from="published_at"),
+        RetentionPolicy(AlertDocument, "sent_at", settings.ALERTS_RETENTION_DAYS),
+        RetentionPolicy(AlertContentDocument, "last_used_at", settings.ALERTS_RETENTION_DAYS),
+        RetentionPolicy(JobDocument, "finished_at", settings.JOBS_RETENTION_DAYS),
+    ]
+
+
+def _mode() -> str:
+    mode = settings.RETENTION_MODE.lower()
+    if mode not in RETENTION_MODES:
+        raise ValueError(f"RETENTION_MODE must be one of {RETENTION_MODES}, got {settings.RETENTION_MODE!r}")
+    return mode
+
+
+def backfill_timestamps(policy: RetentionPolicy) -> int:
+    """
+    Set the policy's timestamp on documents missing it (from `backfill_from`,
+    else now); without it neither the TTL index nor the archive query ever
+    matches them. Returns the number of documents updated.
+    """
+    if policy.backfill_from is None:
+        return 0
+    result = policy.collection.update_many(
+        {policy.field: None},
+        [{"$set": {policy.field: {"$ifNull": [f"${policy.backfill_from}", "$$NOW"]}}}],
+    )
+    if result.modified_count:
+        logger.info("Backfilled %s on %d %s documents", policy.field, result.modified_count, policy.collection.name)
+    return result.modified_count
+
+
+def ensure_ttl_indexes() -> None:
+    """
+    Create, update or drop the TTL index of every policy to match the settings.
+
+    In ttl mode the index expires documents after the policy's window; in the
+    archive modes (or with days=0) it is dropped so MongoDB does not delete
+    documents before they have been archived.
+    """
+    mode = _mode()
+    for policy in policies():
+        coll = policy.collection
+        if policy.days > 0:
+            backfill_timestamps(policy)
+        existing = coll.index_information().get(policy.index_name)
+        if mode != "ttl" or policy.days <= 0:
+            if existing:
+                coll.drop_index(policy.index_name)
+                logger.info("Dropped TTL index %s.%s", coll.name, policy.index_name)
+            continue
+
+        seconds = policy.days * 86400
+        if existing is None:
+            coll.create_index([(policy.field, 1)], name=policy.index_name, expireAfterSeconds=seconds)
+            logger.info("Created TTL index %s.%s (%d days)", coll.name, policy.index_name, policy.days)
+        elif existing.get("expireAfterSeconds") != seconds:
+            # changing the window in place avoids rebuilding the index
+            coll.database.command("collMod", coll.name, index={"name": policy.index_name, "expireAfterSeconds": seconds})
+            logger.info("Updated TTL index %s.%s (%d days)", coll.name, policy.index_name, policy.days)
+
+
+def _archive_to_collection(policy: RetentionPolicy, docs: List[dict]) -> None:
+    archive = policy.collection.database[f"{policy.collection.name}_archive"]
+    try:
+        archive.insert_many(docs, ordered=False)
+    except BulkWriteError as exc:
+        # duplicates are left over from an interrupted run; anything else is fatal
+        if any(err.get("code") != 11000 for err in exc.details.get("writeErrors", [])):
+            raise
+
+
+def _archive_to_file(policy: RetentionPolicy, docs: List[dict]) -> None:
+    by_day: Dict[str, List[dict]] = {}
+    for doc in docs:
+        by_day.setdefault(doc[policy.field].strftime("%Y-%m-%d"), []).append(doc)
+    directory = Path(settings.RETENTION_ARCHIVE_DIR) / policy.collection.name
+    directory.mkdir(parents=True, exist_ok=True)
+    for day, rows in by_day.items():
+        # appending adds a gzip member; readers (gzip, zcat) see one continuous stream
+        with gzip.open(directory / f"{day}.ndjson.gz", "ab") as fh:
+            fh.write(b"".join(dumps(row) + b"\n" for row in rows))
+
+
+def archive_expired(policy: RetentionPolicy, mode: str, now: Optional[datetime] = None, batch_size: int = 1000) -> int:
+    """
+    Move documents older than the policy's window out of the hot collection.
+    Returns the number of documents archived.
+    """
+    if policy.days <= 0:
+        return 0
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=policy.days)
+    coll = policy.collection
+    query = {policy.field: {"$lt": cutoff}}
+    archived = 0
+    while True:
+        docs = list(coll.find(query).sort(policy.field, 1).limit(batch_size))
+        if not docs:
+            break
+        if mode == "collection":
+            _archive_to_collection(policy, docs)
+        else:
+            _archive_to_file(policy, docs)
+        coll.delete_many({"_id": {"$in": [doc["_id"] for doc in docs]}})
+        archived += len(docs)
+    if archived:
+        logger.info("Archived %d documents from %s (%s)", archived, coll.name, mode)
+    return archived
+
+
+def apply_retention(now: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    Enforce every policy once. Returns archived counts per collection
+    (empty in ttl mode, where MongoDB expires documents itself).
+    """
+    mode = _mode()
+    ensure_ttl_indexes()
+    if mode == "ttl":
+        return {}
+    return {policy.collection.name: archive_expired(policy, mode, now=now) for policy in policies()}
+
+
+_last_run = 0.0
+
+
+def retention_due() -> bool:
+    """
+    True at most once per RETENTION_INTERVAL_SECONDS (per process); used by the schedulers.
+    """
+    global _last_run
+    now = time.monotonic()
+    if _last_run and now - _last_run < settings.RETENTION_INTERVAL_SECONDS:
+        return False
+    _last_run = now
+    return True
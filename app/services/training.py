@@ -0,0 +1,125 @@
+# app/services/training.py
+"""
+Training for the local classifier backend.
+
+Bootstraps a LocalClassifier from news items already stored in MongoDB with a
+real category (typically labeled by Groq), evaluates it on a holdout split
+and saves it to LOCAL_MODEL_PATH. tune_cascade_threshold() picks the cascade
+confidence threshold on the same holdout split.
+"""
+
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+import logging
+import random
+
+from app.infrastructure.local_classifier import LocalClassifier
+from app.models.news_item_doc import NewsItemDocument
+
+logger = logging.getLogger(__name__)
+
+IGNORED_LABELS = [None, "", "uncategorized"]
+
+# newest labeled items used for training/tuning unless a caller asks for more
+MAX_EXAMPLES = 100_000
+
+
+def load_labeled_examples(min_per_label: int = 5, limit: Optional[int] = MAX_EXAMPLES) -> List[Tuple[str, str]]:
+    """
+    Return (text, label) pairs for the `limit` most recently ingested items
+    (all of them if limit is None), dropping labels with too few examples.
+    """
+    qs = NewsItemDocument.objects(category__nin=IGNORED_LABELS).only("title", "summary", "category")
+    if limit:
+        qs = qs.order_by("-ingested_at").limit(limit)
+    examples = [(f"{doc.title}\n{doc.summary or ''}".lower(), doc.category) for doc in qs.no_cache()]
+    counts = Counter(label for _, label in examples)
+    kept = [(text, label) for text, label in examples if counts[label] >= min_per_label]
+    logger.info("Loaded %d labeled examples (%d labels)", len(kept), len({label for _, label in kept}))
+    return kept
+
+
+def split_examples(
+    examples: List[Tuple[str, str]], holdout: float = 0.1, seed: int = 13
+) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """
+    Deterministic train/holdout split (same seed -> same holdout for training and tuning).
+    """
+    examples = sorted(examples)
+    random.Random(seed).shuffle(examples)
+    split = int(len(examples) * (1 - holdout))
+    return examples[:split], examples[split:]
+
+
+def train_local_classifier(path: str, holdout: float = 0.1, seed: int = 13) -> LocalClassifier:
+    """
+    Fit on stored labeled items, report holdout accuracy, save the model to `path`.
+    """
+    examples = load_labeled_examples()
+    if not examples:
+        raise RuntimeError("no labeled news items found; run the Groq backend for a while first")
+
+    train, test = split_examples(examples, holdout, seed)
+
+    model = LocalClassifier.fit([t for t, _ in train], [label for _, label in train])
+    if test:
+        predicted = model.predict([t for t, _ in test])
+        correct = sum(1 for (label, _), (_, truth) in zip(predicted, test) if label == truth)
+        logger.info("Holdout accuracy: %.3f (%d items)", correct / len(test), len(test))
+
+    model.save(path)
+    logger.info("Saved local classifier to %s", path)
+    return model
+
+
+def evaluate_thresholds(
+    model: LocalClassifier, holdout: List[Tuple[str, str]], thresholds: List[float]
+) -> List[Dict[str, float]]:
+    """
+    For each threshold: share of items the local tier keeps (no LLM call),
+    precision on those, and expected overall accuracy if Groq handles the
+    rest (stored labels are treated as the LLM's answers).
+    """
+    predictions = model.predict([text for text, _ in holdout])
+    rows = []
+    for threshold in thresholds:
+        kept = [
+            (label == truth)
+            for (label, confidence), (_, truth) in zip(predictions, holdout)
+            if label != "uncategorized" and confidence >= threshold
+        ]
+        n = len(holdout)
+        rows.append({
+            "threshold": threshold,
+            "local_share": len(kept) / n,
+            "local_precision": (sum(kept) / len(kept)) if kept else 1.0,
+            "expected_accuracy": (sum(kept) + (n - len(kept))) / n,
+        })
+    return rows
+
+
+def tune_cascade_threshold(model_path: str, target_precision: float = 0.9) -> Optional[float]:
+    """
+    Pick the lowest threshold whose local-tier precision meets `target_precision`
+    on the holdout split (lowest threshold = fewest LLM calls).
+    """
+    model = LocalClassifier.load(model_path)
+    _, holdout = split_examples(load_labeled_examples())
+    if not holdout:
+        raise RuntimeError("not enough labeled news items for a holdout set")
+
+    thresholds = [round(0.3 + 0.05 * step, 2) for step in range(14)]
+    best = None
+    for row in evaluate_thresholds(model, holdout, thresholds):
+        logger.info(
+            "threshold=%.2f local_share=%.3f local_precision=%.3f expected_accuracy=%.3f",
+            row["threshold"], row["local_share"], row["local_precision"], row["expected_accuracy"],
+        )
+        if best is None and row["local_precision"] >= target_precision:
+            best = row["threshold"]
+
+    if best is None:
+        logger.warning("No threshold reaches precision %.2f; keep sending everything to Groq", target_precision)
+    else:
+        logger.info("Recommended CASCADE_THRESHOLD=%.2f", best)
+    return best
@@ -0,0 +1,177 @@
+# app/services/trends.py
+"""
+Streaming trend and burst detection over incoming news items.
+
+Time is cut into buckets of TREND_BUCKET_SECONDS. Each bucket holds a
+count-min sketch plus a top-k of the terms (and, separately, the categories)
+seen while it was current, so memory is fixed by the settings no matter how
+many distinct terms arrive. Buckets live in a ring and are recycled as time
+moves on.
+
+A key is trending when its count over the last TREND_WINDOW_BUCKETS buckets
+is well above what the preceding TREND_BASELINE_BUCKETS buckets predict:
+
+    expected = baseline_count * window / baseline
+    burst    = count >= TREND_MIN_COUNT and count >= TREND_BURST_RATIO * (expected + 1)
+
+Counts are per process; the detector sees the items stored by the process it
+runs in (scheduler cycles and bulk ingest in the API process), so with
+SCHEDULER_MODE=nuvom the items stored by queue workers are not counted.
+It is created on first use (get_trend_detector()).
+"""
+
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional
+import math
+import re
+import time
+
+from app.core.config import settings
+from app.core.sketch import CountMinSketch, TopK
+
+_TOKEN = re.compile(r"[a-z][a-z0-9'-]{2,}")
+STOPWORDS = frozenset(
+    """
+    the and for with that this from have has had was were are will would could should
+    into over after before about their they them than then there what when where which
+    while who why how its it's not but you your our out new says said more most also
+    just can may one two year years day days week first last here now all any been
+    """.split()
+)
+
+
+def extract_terms(title: str, summary: Optional[str] = None) -> List[str]:
+    """
+    Distinct lowercase terms of an item (each counted once per item).
+    """
+    text = f"{title} {summary or ''}".lower()
+    return sorted({t for t in _TOKEN.findall(text) if t not in STOPWORDS})
+
+
+class _Bucket:
+
+    def __init__(self, width: int, depth: int, top_k: int):
+        self.index = -1
+        self.sketch = CountMinSketch(width, depth)
+        self.top = TopK(top_k)
+
+    def reset(self, index: int) -> None:
+        self.index = index
+        self.sketch.clear()
+        self.top.clear()
+
+
+class SlidingCounter:
+    """
+    Approximate per-key counts over a ring of time buckets.
+    """
+
+    def __init__(self, buckets: int, bucket_seconds: float, width: int, depth: int, top_k: int):
+        self.bucket_seconds = bucket_seconds
+        self._ring = [_Bucket(width, depth, top_k) for _ in range(buckets)]
+
+    def _bucket(self, index: int) -> _Bucket:
+        bucket = self._ring[index % len(self._ring)]
+        if bucket.index != index:
+            bucket.reset(index)
+        return bucket
+
+    def add(self, keys: Iterable[str], now: float) -> None:
+        bucket = self._bucket(int(now // self.bucket_seconds))
+        for key in keys:
+            bucket.top.update(key, bucket.sketch.add(key))
+
+    def span(self, newest: int, count: int) -> List[_Bucket]:
+        """
+        Buckets newest-count+1 .. newest that still hold data for that interval.
+        """
+        buckets = []
+        for index in range(newest - count + 1, newest + 1):
+            bucket = self._ring[index % len(self._ring)]
+            if bucket.index == index:
+                buckets.append(bucket)
+        return buckets
+
+
+class TrendDetector:
+
+    def __init__(
+        self,
+        bucket_seconds: float = 300,
+        window_buckets: int = 3,
+        baseline_buckets: int = 24,
+        burst_ratio: float = 3.0,
+        min_count: int = 5,
+        width: int = 2048,
+        depth: int = 4,
+        top_k: int = 50,
+    ):
+        self.bucket_seconds = bucket_seconds
+        self.window_buckets = window_buckets
+        self.baseline_buckets = baseline_buckets
+        self.burst_ratio = burst_ratio
+        self.min_count = min_count
+        size = window_buckets + baseline_buckets
+        self.terms = SlidingCounter(size, bucket_seconds, width, depth, top_k)
+        self.categories = SlidingCounter(size, bucket_seconds, width, depth, top_k)
+        self._lock = Lock()
+
+    def observe(self, items: Iterable[Any], now: Optional[float] = None) -> None:
+        """
+        Count the terms and category of each item (anything with .title/.summary/.category).
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            for it in items:
+                self.terms.add(extract_terms(it.title, it.summary), now)
+                if it.category and it.category != "uncategorized":
+                    self.categories.add([it.category], now)
+
+    def _trends(self, counter: SlidingCounter, newest: int, limit: int) -> List[Dict[str, Any]]:
+        window = counter.span(newest, self.window_buckets)
+        baseline = counter.span(newest - self.window_buckets, self.baseline_buckets)
+        candidates = {key for bucket in window for key in bucket.top.counts}
+        scale = self.window_buckets / self.baseline_buckets
+        results = []
+        for key in candidates:
+            count = CountMinSketch.estimate_sum((b.sketch for b in window), key)
+            expected = CountMinSketch.estimate_sum((b.sketch for b in baseline), key) * scale
+            results.append({
+                "key": key,
+                "count": count,
+                "expected": round(expected, 2),
+                "score": round((count - expected) / math.sqrt(expected + 1), 2),
+                "burst": count >= self.min_count and count >= self.burst_ratio * (expected + 1),
+            })
+        results.sort(key=lambda r: (r["burst"], r["score"], r["count"]), reverse=True)
+        return results[:limit]
+
+    def snapshot(self, limit: int = 20, now: Optional[float] = None) -> Dict[str, Any]:
+        now = time.time() if now is None else now
+        newest = int(now // self.bucket_seconds)
+        with self._lock:
+            terms = self._trends(self.terms, newest, limit)
+            categories = self._trends(self.categories, newest, limit)
+        return {
+            "window_seconds": self.window_buckets * self.bucket_seconds,
+            "baseline_seconds": self.baseline_buckets * self.bucket_seconds,
+            "terms": terms,
+            "categories": categories,
+            "bursts": [dict(r, kind="term") for r in terms if r["burst"]]
+            + [dict(r, kind="category") for r in categories if r["burst"]],
+        }
+
+
+@lru_cache()
+def get_trend_detector() -> TrendDetector:
+    return TrendDetector(
+        bucket_seconds=settings.TREND_BUCKET_SECONDS,
+        window_buckets=settings.TREND_WINDOW_BUCKETS,
+        baseline_buckets=settings.TREND_BASELINE_BUCKETS,
+        burst_ratio=settings.TREND_BURST_RATIO,
+        min_count=settings.TREND_MIN_COUNT,
+        width=settings.TREND_SKETCH_WIDTH,
+        depth=settings.TREND_SKETCH_DEPTH,
+        top_k=settings.TREND_TOP_K,
+    )
@@ -1,20 +1,36 @@
 # app/ui/streamlit.py
 """
 Streamlit demo UI for News Alert System
-- Live auto-refresh
-- Highlight new items for 10 seconds
+- Live auto-refresh, loading only items stored since the last refresh
+- Flag new items for 10 seconds
 - Search, filter by source, category, date
+- Paginated table (one widget per page, not per item)
 - Robust API response handling
+
+Each browser tab keeps a bounded frame (MAX_ITEMS newest items) in session
+state and polls GET /news/?since=<cursor>. Items do not become visible in
+ingested_at order (a bulk write stamps one time for its whole batch, and
+several workers write concurrently), so each poll starts POLL_OVERLAP_SECONDS
+before the cursor and drops ids the tab already has. HTTP responses are cached with
+st.cache_data for a few seconds, so N tabs on the same cursor share one
+request; filtering is cached on the frame + filter values.
 """
 
 import streamlit as st
 import requests
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
 from streamlit_autorefresh import st_autorefresh
 from app.core.config import settings as _settings
 
 API_BASE = f"http://{_settings.APP_HOST}:{_settings.APP_PORT}/api/v1"
+MAX_ITEMS = 10_000  # per tab; oldest (by published_at) are dropped beyond this
+PAGE_LIMIT = 1000  # items per API request
+MAX_ALERTS = 200
+# re-read this much before the cursor on each poll, to catch late-visible writes
+POLL_OVERLAP_SECONDS = 60
+NEWS_COLUMNS = ["id", "title", "summary", "link", "source", "category", "published_at", "ingested_at"]
 
 st.set_page_config(page_title="News Alert Demo", layout="wide")
 st.title("News Alert System Demo Dashboard")
@@ -29,13 +45,130 @@ query = st.sidebar.text_input("Search", placeholder="Search title or summary..."
 # Auto-refresh
 st_autorefresh(interval=refresh_interval * 1000, limit=None)
 
-# Session state for highlights
-if "last_ids" not in st.session_state:
-    st.session_state.last_ids = set()
-if "highlight_until" not in st.session_state:
-    st.session_state.highlight_until = {}
 
-now = datetime.now()
+# ---------------- Data loading ----------------
+
+@st.cache_data(ttl=5, show_spinner=False)
+def fetch_news(since: Optional[str], since_id: Optional[str], offset: int = 0) -> List[dict]:
+    """
+    One page from GET /news/. Cached briefly so tabs polling the same cursor share the request.
+    """
+    params = {"limit": PAGE_LIMIT, "offset": offset}
+    if since:
+        params.update(since=since, since_id=since_id)
+    resp = requests.get(f"{API_BASE}/news/", params=params, timeout=10)
+    resp.raise_for_status()
+    data = resp.json()
+    return data if isinstance(data, list) else []
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def fetch_alerts(since: Optional[str]) -> List[dict]:
+    params = {"limit": MAX_ALERTS}
+    if since:
+        params["since"] = since
+    resp = requests.get(f"{API_BASE}/alerts/", params=params, timeout=10)
+    resp.raise_for_status()
+    return resp.json().get("alerts", [])
+
+
+def to_frame(rows: List[dict]) -> pd.DataFrame:
+    """
+    Typed frame for a batch of API rows; dates are parsed once, here, per batch.
+    """
+    df = pd.DataFrame(rows, columns=NEWS_COLUMNS)
+    df["published_at"] = pd.to_datetime(df["published_at"], errors="coerce", utc=True)
+    df["ingested_at"] = pd.to_datetime(df["ingested_at"], errors="coerce", utc=True)
+    df["search_text"] = (df["title"].fillna("") + "\n" + df["summary"].fillna("")).str.lower()
+    return df
+
+
+def cursor_of(rows: List[dict], fallback: Tuple[Optional[str], Optional[str]]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    (ingested_at, id) of the most recently stored row, as sent by the API.
+    """
+    stored = [(row["ingested_at"], row["id"]) for row in rows if row.get("ingested_at")]
+    return max(stored) if stored else fallback
+
+
+def overlap_since(ingested_at: str) -> str:
+    """
+    The cursor time moved back by POLL_OVERLAP_SECONDS.
+    """
+    return (datetime.fromisoformat(ingested_at) - timedelta(seconds=POLL_OVERLAP_SECONDS)).isoformat()
+
+
+def load_news() -> pd.DataFrame:
+    """
+    Merge items newer than the session cursor into the session frame.
+    """
+    state = st.session_state
+    if "news" not in state:
+        # first run: newest MAX_ITEMS by published_at, then poll by cursor
+        rows: List[dict] = []
+        while len(rows) < MAX_ITEMS:
+            page = fetch_news(None, None, offset=len(rows))
+            rows.extend(page)
+            if len(page) < PAGE_LIMIT:
+                break
+        state.news = to_frame(rows)
+        state.cursor = cursor_of(rows, ("1970-01-01T00:00:00", None))
+        state.first_seen = {}
+        return state.news
+
+    rows = []
+    cursor = state.cursor
+    # first page: the overlap window (no id tie-breaker); later pages follow the cursor
+    request = (overlap_since(cursor[0]), None)
+    while len(rows) < MAX_ITEMS:
+        page = fetch_news(*request)
+        rows.extend(page)
+        cursor = cursor_of(page, cursor)
+        request = cursor
+        if len(page) < PAGE_LIMIT:
+            break
+    known = set(state.news["id"])
+    rows = [row for row in rows if row["id"] not in known]
+    if rows:
+        now = datetime.now().timestamp()
+        for row in rows:
+            state.first_seen[row["id"]] = now
+        merged = pd.concat([state.news, to_frame(rows)], ignore_index=True)
+        merged = merged.drop_duplicates("id", keep="last")
+        if len(merged) > MAX_ITEMS:
+            merged = merged.nlargest(MAX_ITEMS, "published_at")
+        state.news = merged.reset_index(drop=True)
+        state.cursor = cursor
+    return state.news
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def filter_news(
+    df: pd.DataFrame,
+    query: str,
+    sources: Tuple[str, ...],
+    categories: Tuple[str, ...],
+    date_range: Tuple,
+) -> pd.DataFrame:
+    filtered = df
+    if query:
+        filtered = filtered[filtered["search_text"].str.contains(query.lower(), regex=False)]
+    if sources:
+        filtered = filtered[filtered["source"].isin(sources)]
+    if categories:
+        filtered = filtered[filtered["category"].isin(categories)]
+    if len(date_range) == 2:
+        start_date, end_date = date_range
+        start = pd.Timestamp(start_date, tz="UTC")
+        end = pd.Timestamp(end_date, tz="UTC") + pd.Timedelta(days=1)
+        filtered = filtered[(filtered["published_at"] >= start) & (filtered["published_at"] < end)]
+    return filtered.sort_values("published_at", ascending=False)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def filter_options(df: pd.DataFrame) -> Tuple[List[str], List[str]]:
+    return sorted(df["source"].dropna().unique()), sorted(df["category"].dropna().unique())
+
 
 # Layout
 col_left, col_right = st.columns([2.2, 1])
@@ -54,113 +187,84 @@ with col_left:
         except Exception as e:
             st.error(f"Fetch failed: {e}")
 
-    # Fetch news from API
     try:
-        resp = requests.get(f"{API_BASE}/news/")
-        resp.raise_for_status()
-        news = resp.json() if isinstance(resp.json(), list) else []
+        df = load_news()
     except Exception as e:
         st.error(f"Could not load news: {e}")
-        news = []
+        df = st.session_state.get("news", to_frame([]))
 
-    df = pd.DataFrame(news)
     if df.empty:
         st.info("No news items found. Try fetching.")
     else:
         # Sidebar filters
-        sources = sorted(df["source"].dropna().unique())
-        categories = sorted(df["category"].dropna().unique())
+        sources, categories = filter_options(df)
         selected_sources = st.sidebar.multiselect("Source", options=sources)
         selected_categories = st.sidebar.multiselect("Category", options=categories)
 
         # Date range filter
         if "date_range_default" not in st.session_state:
-            min_d = pd.to_datetime(df["published_at"]).min().date()
-            max_d = pd.to_datetime(df["published_at"]).max().date()
-            st.session_state.date_range_default = (min_d, max_d)
+            st.session_state.date_range_default = (
+                df["published_at"].min().date(),
+                df["published_at"].max().date(),
+            )
         date_range = st.sidebar.date_input("Published Date", value=st.session_state.date_range_default)
 
-        # Apply filters
-        filtered = df.copy()
-        if query:
-            q = query.lower()
-            filtered = filtered[
-                filtered["title"].str.lower().str.contains(q) |
-                filtered["summary"].str.lower().str.contains(q)
-            ]
-        if selected_sources:
-            filtered = filtered[filtered["source"].isin(selected_sources)]
-        if selected_categories:
-            filtered = filtered[filtered["category"].isin(selected_categories)]
+        filtered = filter_news(df, query, tuple(selected_sources), tuple(selected_categories), tuple(date_range))
 
-        start_date, end_date = date_range
-        filtered["published_at"] = pd.to_datetime(filtered["published_at"])
-        filtered = filtered[
-            (filtered["published_at"] >= pd.Timestamp(start_date)) &
-            (filtered["published_at"] <= pd.Timestamp(end_date))
-        ]
-
-        # Highlight new items
-        current_ids = set(filtered["id"])
-        new_ids = current_ids - st.session_state.last_ids
-        for nid in new_ids:
-            st.session_state.highlight_until[nid] = now.timestamp() + 10
-        st.session_state.last_ids = current_ids
-
-        # Render news items
-        for _, row in filtered.sort_values("published_at", ascending=False).iterrows():
-            item = row.to_dict()
-            highlight = now.timestamp() < st.session_state.highlight_until.get(item["id"], 0)
-            bg_color = "#fff3bf" if highlight else "#f8f9fa"
-
-            with st.container():
-                st.markdown(
-                    f"<div style='background-color: {bg_color}; padding: 14px; border-radius: 8px; margin-bottom: 12px;'>",
-                    unsafe_allow_html=True
-                )
-                st.write(f"**{item['title']}**")
-                st.caption(
-                    f"📰 {item.get('source', 'N/A')} | 🏷️ {item.get('category', 'N/A')} | "
-                    f"{item['published_at'].strftime('%Y-%m-%d %H:%M')}"
-                )
-                if item.get("summary"):
-                    st.write(item["summary"])
-                if item.get("link"):
-                    st.markdown(f"[🔗 Read more]({item['link']})")
-
-                # Send alert
-                if st.button("Send Alert", key=f"alert_{item['id']}"):
-                    try:
-                        send = requests.post(f"{API_BASE}/alerts/{item['id']}")
-                        send.raise_for_status()
-                        st.success("Alert sent")
-                    except Exception as e:
-                        st.error(f"Failed to send alert: {e}")
-
-                st.markdown("</div>", unsafe_allow_html=True)
+        # Paginated table
+        page_size = st.selectbox("Rows per page", [25, 50, 100, 250], index=1)
+        pages = max(1, -(-len(filtered) // page_size))
+        page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, step=1)
+        view = filtered.iloc[(page - 1) * page_size:page * page_size].copy()
+
+        # Flag items that arrived in the last 10 seconds
+        now = datetime.now().timestamp()
+        first_seen = st.session_state.first_seen
+        view.insert(0, "new", [now - first_seen.get(nid, 0) < 10 for nid in view["id"]])
+
+        st.caption(f"{len(filtered)} of {len(df)} loaded items")
+        st.dataframe(
+            view[["new", "title", "source", "category", "published_at", "link"]],
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "new": st.column_config.CheckboxColumn("🆕", width="small"),
+                "published_at": st.column_config.DatetimeColumn("Published", format="YYYY-MM-DD HH:mm"),
+                "link": st.column_config.LinkColumn("Link", display_text="🔗 Read more"),
+            },
+        )
+
+        # Send alert for an item on the current page
+        titles = dict(zip(view["id"], view["title"]))
+        selected = st.selectbox("Item", options=list(titles), format_func=lambda nid: titles[nid]) if titles else None
+        if selected and st.button("Send Alert"):
+            try:
+                send = requests.post(f"{API_BASE}/alerts/{selected}")
+                send.raise_for_status()
+                st.success("Alert sent")
+            except Exception as e:
+                st.error(f"Failed to send alert: {e}")
 
 # ---------------- Right Panel: Alert History ----------------
 with col_right:
     st.subheader("Alert History")
+    if "alerts" not in st.session_state:
+        st.session_state.alerts = []
     try:
-        hist_resp = requests.get(f"{API_BASE}/alerts/")
-        hist_resp.raise_for_status()
-
-        resp_json = hist_resp.json()
-        hist_data = resp_json.get("alerts", [])
-
+        alerts = st.session_state.alerts
+        newest = alerts[0]["sent_at"] if alerts else None
+        fresh = fetch_alerts(newest)
+        if fresh:
+            st.session_state.alerts = (fresh + alerts)[:MAX_ALERTS]
     except Exception as e:
         st.error(f"Failed to load alert history: {e}")
-        hist_data = []
-
 
+    hist_data = st.session_state.alerts
     if hist_data:
-        for al in reversed(hist_data):
-            st.write(
-                f"📧 **{al.get('to', 'N/A')}**\n\n"
-                f"Subject: {al.get('subject', 'N/A')}\n\n"
-                f"Sent: {al.get('sent', False)} at {al.get('sent_at', 'N/A')}"
-            )
-            st.markdown("---")
+        st.dataframe(
+            pd.DataFrame(hist_data, columns=["to", "subject", "sent", "sent_at"]),
+            hide_index=True,
+            use_container_width=True,
+        )
     else:
         st.info("No alerts found.")
@@ -0,0 +1,86 @@
+# scripts/bench_alert_render.py
+"""
+CPU benchmark: per-recipient cost of building an alert email.
+
+- legacy: format the body by hand and build + serialize an EmailMessage for
+  every recipient (what alert_sender / SMTPEmailer used to do)
+- templated: render the Jinja2 templates once per story (cached) and reuse
+  the serialized multipart message, only folding the To header per recipient
+
+No network, SMTP server or MongoDB needed.
+
+    python scripts/bench_alert_render.py --stories 20 --recipients 1000
+"""
+
+import argparse
+import time
+from email import policy
+from email.message import EmailMessage
+from typing import List
+
+from app.domain.entities import NewsItem
+from app.infrastructure.smtp_emailer import SMTPEmailer
+from app.services.alert_templates import render_alert
+
+FROM = "alerts@example.com"
+
+
+def make_stories(n: int) -> List[NewsItem]:
+    return [
+        NewsItem(
+            id=f"story-{i}",
+            title=f"Headline number {i} about markets and technology",
+            summary="Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 6,
+            link=f"https://example.com/articles/{i}",
+            source="Example Wire",
+            category="business",
+        )
+        for i in range(n)
+    ]
+
+
+def legacy(stories: List[NewsItem], recipients: List[str]) -> int:
+    size = 0
+    for news in stories:
+        for to in recipients:
+            lines = [news.title, "", news.summary or "", "", f"Source: {news.source}", f"Category: {news.category}"]
+            if news.link:
+                lines += ["", f"Link: {news.link}"]
+            msg = EmailMessage()
+            msg["Subject"] = f"[News Alert] {news.title}"
+            msg["From"] = FROM
+            msg["To"] = to
+            msg.set_content("\n".join(lines))
+            size += len(msg.as_bytes(policy=policy.SMTP))
+    return size
+
+
+def templated(stories: List[NewsItem], recipients: List[str]) -> int:
+    emailer = SMTPEmailer("localhost", 25, "user", "password", default_from=FROM)
+    size = 0
+    for news in stories:
+        rendered = render_alert(news)
+        prepared = emailer.prepare(rendered.subject, rendered.text, rendered.html)
+        for to in recipients:
+            size += len(prepared.for_recipient(to))
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stories", type=int, default=20)
+    parser.add_argument("--recipients", type=int, default=1000)
+    args = parser.parse_args()
+
+    stories = make_stories(args.stories)
+    recipients = [f"user{i}@example.com" for i in range(args.recipients)]
+    messages = args.stories * args.recipients
+    for name, fn in (("legacy", legacy), ("templated", templated)):
+        start = time.perf_counter()
+        size = fn(stories, recipients)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>10}: {elapsed * 1e6 / messages:8.1f} us/recipient  ({size / messages:,.0f} bytes/message)")
+
+
+if __name__ == "__main__":
+    main()
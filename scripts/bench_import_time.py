@@ -0,0 +1,101 @@
+# scripts/bench_import_time.py
+"""
+Cold-start benchmark: import time of the API and CLI entry points.
+
+Each target is imported in a fresh interpreter with `-X importtime`; the
+report shows the time spent on the import (best of --repeat runs, minus what
+a bare interpreter spends at startup) and the slowest top-level imports.
+The script exits with status 1 when a target exceeds its budget or imports
+a module that must stay lazy (loaded on first use only), so it can gate CI:
+
+    python scripts/bench_import_time.py
+    python scripts/bench_import_time.py app.main --budget-ms 1500 --top 15
+
+Importing must not need a configured environment (settings are built on
+first use), so the children run with the current environment as is.
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# target -> budget (ms); generous enough for a laptop, tight enough to catch a new eager import
+TARGETS: Dict[str, float] = {
+    "app.main": 2000,
+    "app.entrypoints": 50,
+    "app.core.worker": 1500,
+    "app.services.retention": 1000,
+}
+
+# heavy modules that only some code paths need; none of the targets may import them
+LAZY_MODULES = ("groq", "feedparser", "uvicorn", "streamlit", "pandas")
+
+
+def import_profile(code: str) -> List[Tuple[int, int, str]]:
+    """
+    (self us, cumulative us, indented module name) per line of -X importtime.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        error = "\n".join(line for line in proc.stderr.splitlines() if not line.startswith("import time:"))
+        raise RuntimeError(f"{code!r} failed:\n{error}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name[1:]))
+    return rows
+
+
+def measure(code: str, repeat: int) -> Tuple[float, List[Tuple[int, int, str]]]:
+    best_total, best_rows = None, []
+    for _ in range(repeat):
+        rows = import_profile(code)
+        # top-level entries (no indentation) add up to the whole import
+        total = sum(cumulative for _, cumulative, name in rows if not name.startswith(" ")) / 1000
+        if best_total is None or total < best_total:
+            best_total, best_rows = total, rows
+    return best_total, best_rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("targets", nargs="*", help="modules to import (default: the entry points)")
+    parser.add_argument("--budget-ms", type=float, help="budget for every target (overrides the defaults)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10, help="slowest top-level imports to list")
+    args = parser.parse_args()
+
+    startup, baseline = measure("pass", args.repeat)
+    preloaded = {name for _, _, name in baseline}
+    failed = False
+    for module in args.targets or list(TARGETS):
+        budget = args.budget_ms or TARGETS.get(module, 1000)
+        total, rows = measure(f"import {module}", args.repeat)
+        total = max(total - startup, 0.0)
+        rows = [row for row in rows if row[2] not in preloaded]
+        loaded = {name.strip() for _, _, name in rows}
+        eager = [lazy for lazy in LAZY_MODULES if lazy in loaded]
+        ok = total <= budget and not eager
+        failed |= not ok
+        print(f"{module}: {total:.0f} ms (budget {budget:.0f} ms) {'OK' if ok else 'FAIL'}")
+        if eager:
+            print(f"  imports modules that should load lazily: {', '.join(eager)}")
+        top = sorted((r for r in rows if not r[2].startswith(" ")), key=lambda r: r[1], reverse=True)
+        for _, cumulative, name in top[:args.top]:
+            print(f"  {cumulative / 1000:8.1f} ms  {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+# scripts/bench_local_classifier.py
+"""
+Throughput benchmark for the local classifier backend.
+
+Trains on synthetic articles and reports articles/second for batch scoring
+on the current CPU. Does not need MongoDB or an API key.
+
+    python scripts/bench_local_classifier.py --docs 20000
+"""
+
+import argparse
+import random
+import time
+
+from app.infrastructure.local_classifier import LocalClassifier
+
+VOCAB = {
+    "tech": "software chip ai startup cloud apple google code developer security",
+    "business": "market stocks earnings bank revenue merger investors profit trade",
+    "politics": "election senate vote president law policy minister party campaign",
+    "sports": "match goal team league cup player coach score season",
+    "health": "hospital vaccine doctors patients study disease virus treatment",
+}
+COMMON = "the a of in on today report says new year people after over".split()
+
+
+def synthetic(label: str, words: int = 60) -> str:
+    pool = VOCAB[label].split() + COMMON
+    return " ".join(random.choice(pool) for _ in range(words))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--docs", type=int, default=20000)
+    args = parser.parse_args()
+
+    labels = [random.choice(list(VOCAB)) for _ in range(2000)]
+    model = LocalClassifier.fit([synthetic(label) for label in labels], labels)
+
+    truth = [random.choice(list(VOCAB)) for _ in range(args.docs)]
+    texts = [synthetic(label) for label in truth]
+    start = time.perf_counter()
+    predicted = model.predict(texts)
+    elapsed = time.perf_counter() - start
+
+    accuracy = sum(1 for (label, _), t in zip(predicted, truth) if label == t) / len(truth)
+    print(f"{args.docs} docs in {elapsed:.2f}s -> {args.docs / elapsed:,.0f} docs/s (accuracy {accuracy:.3f})")
+
+
+if __name__ == "__main__":
+    main()
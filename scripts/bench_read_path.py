@@ -0,0 +1,91 @@
+# scripts/bench_read_path.py
+"""
+CPU / allocation benchmark: hydrated vs raw read path for GET /news/.
+
+Simulates one list request of N documents as pymongo returns them and
+compares:
+
+- hydrated: Document._from_son -> NewsItem -> response_model validation -> JSON
+- raw:      projection dict -> _raw_news -> FastJSONResponse.render
+
+No MongoDB needed; only the per-request Python work is measured.
+
+    python scripts/bench_read_path.py --items 200 --rounds 200
+"""
+
+import argparse
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.api.responses import FastJSONResponse
+from app.api.schemas import NewsListResponse
+from app.models.news_item_doc import NewsItemDocument
+from app.services.news_fetcher import NEWS_LIST_FIELDS, _raw_news, _to_news_item
+
+
+def make_docs(n: int) -> List[dict]:
+    now = datetime(2024, 1, 1)
+    return [
+        {
+            "_id": str(uuid.uuid4()),
+            "title": f"Headline number {i} about markets and technology",
+            "summary": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 6,
+            "link": f"https://example.com/articles/{i}",
+            "source": "Example News",
+            "category": "tech",
+            "published_at": now - timedelta(minutes=i),
+            "category_mask": 1,
+            "scores": {"tech": 230, "business": 90},
+        }
+        for i in range(n)
+    ]
+
+
+def hydrated(docs: List[dict]) -> bytes:
+    adapter = TypeAdapter(List[NewsListResponse])
+    items = [_to_news_item(NewsItemDocument._from_son(dict(d))) for d in docs]
+    validated = adapter.validate_python([item.model_dump() for item in items])
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def raw(docs: List[dict]) -> bytes:
+    projected = [{k: d[k] for k in ("_id",) + NEWS_LIST_FIELDS} for d in docs]
+    return FastJSONResponse([_raw_news(d) for d in projected]).body
+
+
+def measure(name: str, func, docs: List[dict], rounds: int) -> None:
+    func(docs)  # warm-up
+    cpu = time.process_time()
+    for _ in range(rounds):
+        func(docs)
+    cpu_ms = 1000 * (time.process_time() - cpu) / rounds
+
+    tracemalloc.start()
+    func(docs)
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    print(f"{name:9s} cpu/request={cpu_ms:7.2f} ms  peak={peak / 1024:8.1f} KiB  live blocks={blocks}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    docs = make_docs(args.items)
+    measure("hydrated", hydrated, docs, args.rounds)
+    measure("raw", raw, docs, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# scripts/bench_records.py
+"""
+CPU / allocation benchmark: NewsItem (Pydantic) vs NewsRecord (slotted dataclass)
+through the ingestion pipeline.
+
+Per item it runs the work the pipeline does between feed and Mongo:
+
+- build from a parsed feed entry (rss_client)
+- job payload round trip (fetch_feed -> classify_items)
+- set scores/category after classification
+- build the insert document (store_items_bulk)
+
+No network or MongoDB needed.
+
+    python scripts/bench_records.py --items 1000 --rounds 50
+"""
+
+import argparse
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import List
+
+from app.domain.entities import NewsItem
+from app.domain.records import NewsRecord, clean_link
+
+
+def make_entries(n: int) -> List[dict]:
+    now = datetime(2024, 1, 1)
+    return [
+        {
+            "id": f"https://example.com/articles/{i}",
+            "title": f"Headline number {i} about markets and technology",
+            "summary": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 6,
+            "link": f"https://example.com/articles/{i}",
+            "published_at": now - timedelta(minutes=i),
+        }
+        for i in range(n)
+    ]
+
+
+def _doc(it) -> dict:
+    return {
+        "_id": it.id,
+        "title": it.title,
+        "summary": it.summary,
+        "link": str(it.link) if it.link else None,
+        "source": it.source,
+        "category": it.category,
+        "published_at": it.published_at,
+        "scores": it.scores,
+    }
+
+
+def pydantic_pipeline(entries: List[dict]) -> List[dict]:
+    items = [
+        NewsItem(id=e["id"], title=e["title"][:500], link=e["link"], summary=e["summary"],
+                 published_at=e["published_at"], source="Example News", category="uncategorized")
+        for e in entries
+    ]
+    items = [NewsItem(**item.model_dump(mode="json")) for item in items]
+    for it in items:
+        it.scores = {"tech": 0.9, "business": 0.3}
+        it.category = "tech"
+    return [_doc(it) for it in items]
+
+
+def record_pipeline(entries: List[dict]) -> List[dict]:
+    items = [
+        NewsRecord(id=e["id"], title=e["title"][:500], link=clean_link(e["link"]), summary=e["summary"],
+                   published_at=e["published_at"], source="Example News", category="uncategorized")
+        for e in entries
+    ]
+    items = [NewsRecord.from_payload(item.to_payload()) for item in items]
+    for it in items:
+        it.scores = {"tech": 0.9, "business": 0.3}
+        it.category = "tech"
+    return [_doc(it) for it in items]
+
+
+def measure(name: str, func, entries: List[dict], rounds: int) -> None:
+    func(entries)  # warm-up
+    cpu = time.process_time()
+    for _ in range(rounds):
+        func(entries)
+    cpu_us = 1e6 * (time.process_time() - cpu) / rounds / len(entries)
+
+    tracemalloc.start()
+    func(entries)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:9s} cpu/item={cpu_us:7.2f} us  peak/item={peak / len(entries):8.1f} B")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    entries = make_entries(args.items)
+    measure("pydantic", pydantic_pipeline, entries, args.rounds)
+    measure("record", record_pipeline, entries, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
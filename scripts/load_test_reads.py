@@ -0,0 +1,83 @@
+# scripts/load_test_reads.py
+"""
+Load test: GET /news/ served via run_in_threadpool (sync pymongo) vs the
+async repository (AsyncMongoClient), under concurrent requests.
+
+Both variants are mounted on a throwaway in-process app and hit through
+httpx's ASGI transport, so only the server-side data path differs. Needs a
+reachable MongoDB at MONGO_URI with some news in it.
+
+    python scripts/load_test_reads.py --requests 2000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+
+from app.api.responses import FastJSONResponse
+from app.core.db import close_async_db, init_db
+from app.services.news_fetcher import list_news_raw
+from app.services.repositories import MongoNewsRepository
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    repo = MongoNewsRepository()
+
+    @app.get("/threadpool")
+    async def threadpool(limit: int = 50):
+        return FastJSONResponse(await run_in_threadpool(list_news_raw, limit, 0))
+
+    @app.get("/async")
+    async def async_repo(limit: int = 50):
+        return FastJSONResponse(await repo.list_news(limit, 0))
+
+    return app
+
+
+async def run(client: httpx.AsyncClient, path: str, total: int, concurrency: int, limit: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(path, params={"limit": limit})
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    await client.get(path, params={"limit": limit})  # warm-up (pool, first connection)
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{path:12s} {total / elapsed:8.1f} req/s  "
+        f"p50={1000 * statistics.median(latencies):7.1f} ms  p99={1000 * p99:7.1f} ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    init_db()
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for path in ("/threadpool", "/async"):
+            await run(client, path, args.requests, args.concurrency, args.limit)
+    await close_async_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,8 +10,7 @@ import time
 import logging
 from app.core.logging import configure_logging
 from app.core.config import settings
-from app.services.classifier import ClassifierService
-from app.infrastructure.groq_client import GroqClient
+from app.services.classifier import build_classifier
 from app.services.news_fetcher import fetch_and_process
 
 configure_logging()
@@ -23,8 +22,7 @@ def main():
     Run a simple forever loop that fetches and processes news every 120 seconds.
     """
     logger.info("Starting external scheduler (interval=120s)")
-    groq = GroqClient(settings.GROQ_API_KEY) if settings.GROQ_API_KEY else None
-    classifier = ClassifierService(groq=groq)
+    classifier = build_classifier(settings)
 
     while True:
         try: